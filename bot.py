@@ -62,7 +62,7 @@ bot = commands.Bot(command_prefix=Config.DISCORD_COMMAND_PREFIX, intents=intents
 from src.services.vlc_controller import VLCController
 from src.services.tmdb_service import TMDBService
 from src.services.watch_folder_service import WatchFolderService
-from src.utils.media_utils import MediaUtils
+from src.utils.media_utils import MediaUtils, human_size
 from src.services.radarr_service import RadarrService
 
 vlc = VLCController(bot=bot)
@@ -100,12 +100,7 @@ def _is_connected_to_channel(guild: discord.Guild, channel_id: int) -> bool:
 
 def _format_bytes(n: int) -> str:
     try:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(max(0, int(n)))
-        for u in units:
-            if size < 1024 or u == units[-1]:
-                return f"{size:.2f}{u}"
-            size /= 1024
+        return human_size(n, sep='')
     except Exception:
         return "-"
 
@@ -644,7 +639,7 @@ async def on_ready():
     # If initial enqueue on start is enabled, delay the announcement until after initial scan completes
     if Config.WATCH_ENQUEUE_ON_START and watch_service:
         logger.info("Delaying startup announcement until watch folder initial scan completes...")
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         def wait_and_announce():
             try:
                 # Wait up to 2 minutes for the initial scan to finish
@@ -1559,6 +1554,9 @@ def main():
     except Exception as e:
         logger.critical(f"Error starting bot: {e}")
         sys.exit(1)
+    finally:
+        # Release the pooled HTTP connection to VLC
+        vlc.close()
 
 if __name__ == "__main__":
     main()
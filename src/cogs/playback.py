@@ -1,33 +1,155 @@
 import discord
 from discord.ext import commands
 import asyncio
+import copy
 import logging
 import os
 import re
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import unquote, urlparse
-from ..utils.media_utils import MediaUtils
+from ..utils.media_utils import MediaUtils, human_size
 from ..config import Config
 from ..utils.command_utils import format_cmd_inline
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# ElementPath expressions for VLC XML. ElementTree compiles and caches these on first
+# use, and the predicate form lets a single C-level find() replace nested Python loops.
+LEAF_XPATH = './/leaf'
+# VLC marks the playing leaf with current="current"; match on presence of the attribute
+CURRENT_LEAF_XPATH = './/leaf[@current]'
+FILENAME_XPATH = "./category/info[@name='filename']"
+STATUS_FILENAME_XPATH = "./information/category/info[@name='filename']"
+
+# Static embed templates for hot commands: filled with per-call values and built in one
+# step via discord.Embed.from_dict (fields lists are always created fresh per call)
+QUEUE_STATUS_TEMPLATE = {'title': "📋 Queue Status", 'color': discord.Color.blue().value}
+NOW_PLAYING_TEMPLATE = {'color': discord.Color.blue().value}
+
+# Presence text limit (characters) and the separator before the progress suffix
+PRESENCE_MAX_LENGTH = 120
+PRESENCE_PROGRESS_SEP = " — "
+
+# Speed presets accepted by the speed command (alias -> playback rate)
+SPEED_PRESETS = {
+    **dict.fromkeys(('1.5', '1.5x', '15', 'fast', 'up'), 1.5),
+    **dict.fromkeys(('1', '1.0', 'normal', 'default', 'reset', 'norm'), 1.0),
+}
+
+# Display labels for VLC playback states (avoids str.capitalize() per call)
+STATE_DISPLAY = {'playing': 'Playing', 'paused': 'Paused', 'stopped': 'Stopped'}
+# Emoji shown next to the playback state in the status embed
+STATE_EMOJI = {'playing': '▶️', 'paused': '⏸️', 'stopped': '⏹️'}
+
+
+# VLC states checked by the poll loop: playback sitting at the end of a track / media loaded
+_END_STATES = frozenset({'stopped', 'paused'})
+_ACTIVE_STATES = frozenset({'playing', 'paused'})
+
+
+def _extract_time(status) -> tuple:
+    """Return (time, length) in seconds from a VLC status element, or (None, None).
+
+    Walks the status children once instead of issuing a find() per field.
+    """
+    if status is None:
+        return None, None
+    time_text = length_text = None
+    for child in status:
+        tag = child.tag
+        if tag == 'time':
+            time_text = child.text
+        elif tag == 'length':
+            length_text = child.text
+        else:
+            continue
+        if time_text is not None and length_text is not None:
+            break
+    try:
+        return int(time_text), int(length_text)
+    except (TypeError, ValueError):
+        return None, None
+
+
+@lru_cache(maxsize=256)
+def _parse_media_name(name: str) -> tuple:
+    """Return the movie/TV filename parse for a name, memoized per name.
+
+    The same item is parsed on every status and announcement while it plays,
+    and the regex-heavy parsers always give the same answer for the same string.
+    lru_cache is thread-safe, so the metadata and VLC worker threads can share it.
+
+    Returns:
+        tuple: (title, year, tv_title, tv_season, tv_episode, tv_year, edition_tag,
+                has_explicit_episode, episode_label)
+    """
+    title, year = MediaUtils.parse_movie_filename(name)
+    tv_title, tv_season, tv_episode, tv_year = MediaUtils.parse_tv_filename(name)
+    edition_tag = MediaUtils.extract_edition_tag(name)
+    episode_label = f"S{int(tv_season):02d}E{int(tv_episode):02d}" if tv_season and tv_episode else None
+    # Detect if there's an explicit episode marker
+    has_explicit_episode = bool(tv_episode) or bool(re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", name))
+    return (title, year, tv_title, tv_season, tv_episode, tv_year, edition_tag,
+            has_explicit_episode, episode_label)
+
+
 class PlaybackCommands(commands.Cog):
+    # Upper bound on a single TMDB enrichment; announcements fall back to filename-only after this
+    METADATA_LOOKUP_TIMEOUT = 20.0
+    # Poll interval for the unified VLC poller (seconds); presence progress and periodic
+    # announcements piggyback on its snapshots at their own, longer cadences
+    MONITOR_INTERVAL = 0.5
+    # While nothing changes the poll interval backs off (x1.5 per quiet tick) up to this cap;
+    # bot commands wake the poller early (see wake_poller)
+    MONITOR_MAX_INTERVAL = 5.0
+    # Within this many seconds of the end of a track the poller stays at MONITOR_INTERVAL
+    MONITOR_NEAR_END_SECONDS = 10
+    # How often (seconds) the poller re-reads its Config toggles
+    RUNTIME_SETTINGS_REFRESH = 60.0
+    # Resolved Now Playing metadata (TMDB hits and misses) is reused for this long (seconds)
+    METADATA_CACHE_TTL = 60 * 60
+    METADATA_CACHE_MAX_ENTRIES = 256
+    # Minimum spacing between presence updates; Discord allows 5 per 60s on the gateway
+    PRESENCE_MIN_INTERVAL = 12.0
+    # Settle time before applying a presence request so back-to-back skips send only the last title
+    PRESENCE_DEBOUNCE_SECONDS = 0.5
+    # queue_status lists at most this many queued items
+    QUEUE_STATUS_MAX_ITEMS = 5
+    # Window for folding rapid auto-play notices into one channel message
+    NOTIFY_COALESCE_SECONDS = 2.0
+    # A channel that was missing or forbidden is retried after this many seconds
+    CHANNEL_MISS_TTL = 300.0
+    # Let the soft queue act on ordinary track changes: interrupt a track that is not the
+    # queued item, and correct a "wrong" item while playing. Off by default, so a queue_next
+    # item waits for the current track to stop/pause at its end, as it always has
+    QUEUE_INTERRUPT_ON_TRACK_CHANGE = False
+
     def __init__(self, bot, vlc_controller, tmdb_service, watch_service):
         self.bot = bot
         self.vlc = vlc_controller
         self.tmdb = tmdb_service
         self.watch_service = watch_service
         self.last_state_change = {}
+        # Clock for cooldowns and schedules; rebound to the running loop's time() in cog_load
+        # (the default event loop clock is time.monotonic as well)
+        self._now = time.monotonic
+        # Running event loop, captured in cog_load for executor hand-offs
+        self._loop = None
         self.logger = logging.getLogger(__name__)
-        self.last_known_state = None
-        self.last_known_position = None
-        self.last_known_playing_item = None  # Track the last item that was playing
+        # State seen on the previous monitor tick, replaced as a whole at the end of each tick:
+        # VLC state, 1-based playlist position and the playing leaf's id (to detect when it finished)
+        self._last_snapshot = {'state': None, 'position': None, 'item_id': None}
         self.monitoring_task = None
-        self._presence_progress_task = None
+        # Set after a bot command so the poller picks up its effect without waiting out the backoff
+        self._poll_wake = asyncio.Event()
         self._last_command_announce_ts = 0.0
         self._suppress_auto_announce_until = 0.0
+        self._announce_lock = asyncio.Lock()
         self._last_announced_item_id = None
         self._last_announced_item_name = None
         self._command_initiated_change = False  # Suppress auto announce immediately after bot-issued next/prev
@@ -41,8 +163,10 @@ class PlaybackCommands(commands.Cog):
         except Exception:
             self._np_cooldown = 10.0
             self._auto_suppress_seconds = 6.0
-        self.periodic_announce_task = None
         self.playback_started_event = asyncio.Event()
+        # Periodic announcement schedule (loop time of the next announcement, None until playback starts)
+        self._next_periodic_announce_due = None
+        self._periodic_announce_inflight = None
         self.last_queue_auto_play = 0  # Timestamp of last queue auto-play to prevent rapid triggers
         # Presence/update throttling for bot activity updates
         self._presence_last_set = 0.0
@@ -52,10 +176,72 @@ class PlaybackCommands(commands.Cog):
             self._presence_throttle_seconds = int(getattr(Config, 'PRESENCE_UPDATE_THROTTLE', 5))
         except Exception:
             self._presence_throttle_seconds = 5
+        # Newest requested (name, reason) waiting for _presence_flusher; None when idle
+        self._pending_presence = None
+        self._presence_wake = asyncio.Event()
+        self._presence_flusher_task = None
+        # Config toggles read by the poller, snapshotted by _reload_runtime_settings
+        self._runtime_settings_ts = 0.0
+        self._reload_runtime_settings()
+        self._next_presence_progress_due = 0.0
         
         # Track selected subtitle since VLC API doesn't expose it
         self.selected_subtitle_stream_index = None
         self._initial_scan_pending = True # Guard for startup presence
+        # Short-lived playlist cache shared within a single command: dict with
+        # ts, playlist, leaves, id_to_pos ({item_id: 1-based position}) and current_id
+        self._playlist_cache = None
+        self._playlist_cache_ttl = 0.5
+        # Dedicated workers for TMDB enrichment so slow metadata calls never occupy the
+        # default executor used for VLC requests
+        self._metadata_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tmdb-lookup")
+        # Single worker for blocking VLC control calls: keeps them off the event loop while
+        # preserving their order and the controller's unsynchronized queue bookkeeping
+        self._vlc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vlc-http")
+        # (fn, args) pairs queued by _queue_vlc and submitted together by _flush_vlc
+        self._pending_vlc_cmds = []
+        # (metadata_name, uri) -> (monotonic ts, lookup tuple); see _lookup_metadata_async
+        self._metadata_cache = {}
+        # Bot avatar URL for embed thumbnails, resolved on first use; see _get_bot_avatar_url
+        self._bot_avatar_url = None
+        # Resolved announce/notification channels (channel id -> channel); see _resolve_channel
+        self._channel_cache = {}
+        # Channels that could not be fetched (channel id -> retry-after time); see _resolve_channel
+        self._channel_misses = {}
+        # Pending auto-play notices (label -> latest text) and the task that flushes them
+        self._notify_buf = {}
+        self._notify_task = None
+        # Static embed pieces built once: the speed usage embed is never mutated after
+        # construction, and the Ko-fi support field is None when KOFI_URL is unset
+        self._speed_usage_embed = discord.Embed(
+            title="Playback Speed — Usage",
+            description=(
+                f"Set the playback rate using a numeric value, or use a preset like 'normal' to reset.\n\n"
+                f"Examples: {format_cmd_inline('speed 1.5')} or {format_cmd_inline('speed normal')}"
+            ),
+            color=discord.Color.blue()
+        )
+        self._speed_usage_embed.add_field(name="Aliases", value="spd, speed15, speednorm", inline=True)
+        self._kofi_field = (
+            {'name': "Support kutsaratinidor by supporting CtrlVee", 'value': f"☕ <{Config.KOFI_URL}>", 'inline': False}
+            if Config.KOFI_URL else None
+        )
+        # Fixed-text command replies are sent as-is and never mutated either, so share one instance each
+        blue, green = discord.Color.blue(), discord.Color.green()
+        red, dark_red = discord.Color.red(), discord.Color.dark_red()
+        self._static_embeds = {
+            'play_started': discord.Embed(title="▶️ Playback started", description="Playback started/resumed", color=green),
+            'stop_ok': discord.Embed(title="⏹️ Playback stopped", description="Playback has been stopped", color=red),
+            'stop_failed': discord.Embed(title="⏹️ Playback stop failed", description="Error: Could not stop playback", color=dark_red),
+            'rewind_invalid': discord.Embed(title="⏪ Rewind failed", description="Please specify a positive number of seconds", color=red),
+            'rewind_failed': discord.Embed(title="⏪ Rewind failed", description="Error: Could not rewind", color=dark_red),
+            'forward_invalid': discord.Embed(title="⏩ Fast-forward failed", description="Please specify a positive number of seconds", color=red),
+            'forward_failed': discord.Embed(title="⏩ Fast-forward failed", description="Error: Could not fast forward", color=dark_red),
+            'next_loading': discord.Embed(title="Loading next track…", color=blue),
+            'next_done': discord.Embed(title="Skipped to next track", color=blue),
+            'previous_loading': discord.Embed(title="Loading previous track…", color=blue),
+            'previous_done': discord.Embed(title="Jumped to previous track", color=blue),
+        }
 
     def _filename_from_uri(self, uri: str | None) -> str | None:
         """Extract a filename from VLC item URI/path for metadata fallback."""
@@ -90,7 +276,7 @@ class PlaybackCommands(commands.Cog):
             if re.fullmatch(r'[A-Za-z0-9]{2,6}', token):
                 return True
             # Parsed title is too short to be a meaningful media title.
-            parsed_title, _ = MediaUtils.parse_movie_filename(n)
+            parsed_title = _parse_media_name(n)[0]
             if parsed_title and len(parsed_title.strip()) <= 4:
                 return True
             return False
@@ -108,6 +294,154 @@ class PlaybackCommands(commands.Cog):
             return uri_name
         return name
         
+    def _get_bot_avatar_url(self) -> str | None:
+        """Return the bot's avatar URL, building discord.py's Asset URL only once."""
+        if self._bot_avatar_url is None:
+            user = self.bot.user
+            if user is not None and hasattr(user, 'display_avatar'):
+                self._bot_avatar_url = user.display_avatar.url
+        return self._bot_avatar_url
+
+    def _get_playlist_cached(self):
+        """Return (playlist, leaves) reusing a very recent fetch when available.
+
+        Avoids repeated HTTP round-trips and full-tree `.//leaf` walks when a single
+        command needs the playlist more than once.
+
+        Returns:
+            tuple: (playlist, leaves) where playlist may be None and leaves is a list
+        """
+        cache = self._get_playlist_cache_entry()
+        return cache['playlist'], cache['leaves']
+
+    def _get_playlist_cache_entry(self) -> dict:
+        """Return the current playlist cache entry, refreshing it when stale.
+
+        On refresh the id -> position index and the current item id are built in the
+        same pass as the leaf list, so later lookups are dict hits instead of scans.
+        """
+        now = time.monotonic()
+        cache = self._playlist_cache
+        if cache is not None and (now - cache['ts']) < self._playlist_cache_ttl:
+            return cache
+        playlist = self.vlc.get_playlist()
+        leaves = playlist.findall(LEAF_XPATH) if playlist is not None else []
+        id_to_pos = {leaf.get('id'): i for i, leaf in enumerate(leaves, 1)}
+        current_leaf = playlist.find(CURRENT_LEAF_XPATH) if playlist is not None else None
+        current_id = current_leaf.get('id') if current_leaf is not None else None
+        cache = {
+            'ts': now,
+            'playlist': playlist,
+            'leaves': leaves,
+            'id_to_pos': id_to_pos,
+            'current_id': current_id,
+        }
+        self._playlist_cache = cache
+        return cache
+
+    def _get_current_cached(self):
+        """Return (position, current_item) from the playlist cache via dict lookup.
+
+        Returns:
+            tuple: (position, current_item), both None when nothing is current
+        """
+        cache = self._get_playlist_cache_entry()
+        position = cache['id_to_pos'].get(cache['current_id'])
+        if position is None:
+            return None, None
+        return position, cache['leaves'][position - 1]
+
+    def _invalidate_playlist_cache(self):
+        """Drop the cached playlist after actions that change the current item."""
+        self._playlist_cache = None
+
+    async def _vlc_call(self, fn, *args):
+        """Run a blocking VLCController call on the VLC worker thread and return its result.
+
+        Playback and soft-queue control calls all go through here (other cogs use
+        run_vlc_command), so they run one at a time in submission order. Two kinds of
+        call may run out of order with them: read-only status/playlist snapshots on the
+        default pool (see _fetch_status_and_current), and the watch folder service's
+        playlist appends on its own thread. Neither changes what is playing, so at worst
+        they observe the state just before or just after a command.
+        """
+        return await self._loop.run_in_executor(self._vlc_executor, fn, *args)
+
+    async def run_vlc_command(self, fn, *args):
+        """Run a VLC control call from another cog, in order with this cog's commands."""
+        return await self._vlc_call(fn, *args)
+
+    def _queue_vlc(self, fn, *args):
+        """Queue a blocking VLCController call to be sent by the next _flush_vlc."""
+        self._pending_vlc_cmds.append((fn, args))
+
+    def _run_vlc_batch(self, batch):
+        """Run queued calls in order on the VLC worker thread; a failing call yields None."""
+        results = []
+        for fn, args in batch:
+            try:
+                results.append(fn(*args))
+            except Exception as e:
+                logger.error(f"Batched VLC call {getattr(fn, '__name__', fn)} failed: {e}")
+                results.append(None)
+        return results
+
+    async def _flush_vlc(self):
+        """Send all queued VLC calls back-to-back in a single worker hop.
+
+        The calls share the keep-alive connection without yielding to other
+        commands in between. Returns their results in queue order.
+        """
+        batch, self._pending_vlc_cmds = self._pending_vlc_cmds, []
+        if not batch:
+            return []
+        return await self._vlc_call(self._run_vlc_batch, batch)
+
+    def _get_current_streamed(self):
+        """Return (position, current_item), streaming playlist.xml only when the cache is stale.
+
+        A fresh playlist cache answers with a dict lookup; otherwise iterparse stops at
+        the current leaf rather than building and indexing the whole playlist tree.
+        """
+        cache = self._playlist_cache
+        if cache is not None and (time.monotonic() - cache['ts']) < self._playlist_cache_ttl:
+            return self._get_current_cached()
+        return self.vlc.get_playlist_current()
+
+    async def _fetch_status_and_current(self):
+        """Fetch VLC status and the current playlist item concurrently, off the event loop.
+
+        Both are read-only, so they use the default pool rather than the ordered VLC worker.
+
+        Returns:
+            tuple: (status, (position, current_item))
+        """
+        status, current = await asyncio.gather(
+            asyncio.to_thread(self.vlc.get_status_cached),
+            asyncio.to_thread(self._get_current_streamed),
+        )
+        return status, current
+
+    def _reload_runtime_settings(self, now: float = 0.0):
+        """Snapshot the Config values the poller checks, so ticks do not re-read them."""
+        self._presence_enabled = bool(getattr(Config, 'ENABLE_PRESENCE', True))
+        self._presence_progress_enabled = bool(getattr(Config, 'ENABLE_PRESENCE_PROGRESS', True))
+        try:
+            self._presence_progress_interval = max(5, int(getattr(Config, 'PRESENCE_PROGRESS_UPDATE_INTERVAL', 30)))
+        except Exception:
+            self._presence_progress_interval = 30
+        self._periodic_announce_enabled = bool(getattr(Config, 'PERIODIC_ANNOUNCE_ENABLED', False))
+        try:
+            self._periodic_announce_interval = int(getattr(Config, 'PERIODIC_ANNOUNCE_INTERVAL', 300))
+        except Exception:
+            self._periodic_announce_interval = 300
+        self._announce_channel_ids = tuple(Config.get_announce_channel_ids())
+        try:
+            self._watch_channel_id = int(getattr(Config, 'WATCH_ANNOUNCE_CHANNEL_ID', 0) or 0)
+        except Exception:
+            self._watch_channel_id = 0
+        self._runtime_settings_ts = now
+
     def signal_initial_scan_complete(self):
         """Signal that the initial watch folder scan is complete."""
         self.logger.info("Initial scan complete; presence clearing is now enabled.")
@@ -115,25 +449,16 @@ class PlaybackCommands(commands.Cog):
 
     async def cog_load(self):
         """Called when the cog is loaded"""
-        self.monitoring_task = self.bot.loop.create_task(self._monitor_vlc_state())
+        self._loop = asyncio.get_running_loop()
+        self._now = self._loop.time
+        # One poller drives state monitoring, presence progress and periodic announcements
+        self.monitoring_task = self.bot.loop.create_task(self._vlc_poller())
         self.logger.info("VLC state monitoring started")
         # Schedule a one-time startup presence sync (runs after the bot is ready)
         try:
             self.bot.loop.create_task(self._startup_presence_sync())
         except Exception as e:
-            self.logger.debug(f"Could not schedule startup presence sync: {e}")
-        # Start periodic presence progress updater if enabled
-        try:
-            self._presence_progress_task = self.bot.loop.create_task(self._presence_progress_loop())
-            self.logger.info("Presence progress updater started")
-        except Exception as e:
-            self.logger.debug(f"Could not start presence progress updater: {e}")
-        # Start periodic announcement task
-        try:
-            self.periodic_announce_task = self.bot.loop.create_task(self._periodic_announce_loop())
-            self.logger.info("Periodic announcement task started")
-        except Exception as e:
-            self.logger.debug(f"Could not start periodic announcement task: {e}")
+            self.logger.debug("Could not schedule startup presence sync: %s", e)
 
     async def _startup_presence_sync(self):
         """Sync bot presence on startup if VLC is already playing/paused.
@@ -142,63 +467,181 @@ class PlaybackCommands(commands.Cog):
         Respects Config.ENABLE_PRESENCE and uses a brief delay to let VLC status stabilize.
         """
         try:
-            if not getattr(Config, 'ENABLE_PRESENCE', True):
+            if not self._presence_enabled:
                 return
             # Ensure the bot is fully ready before attempting presence updates
             await self.bot.wait_until_ready()
             # Small delay to allow VLC HTTP status to stabilize after connect
             await asyncio.sleep(0.4)
 
-            status = self.vlc.get_status()
+            status = await self._vlc_call(self.vlc.get_status)
             if status is None:
                 return
 
-            state_elem = status.find('state')
-            current_state = state_elem.text if state_elem is not None else None
-            if current_state not in ['playing', 'paused']:
+            current_state = status.findtext('state')
+            if current_state not in _ACTIVE_STATES:
                 return
 
-            # Try to resolve the current item's display name from playlist first
-            name = None
-            try:
-                playlist = self.vlc.get_playlist()
-                if playlist is not None:
-                    _, current_item = self._find_current_position(playlist)
-                    if current_item is not None:
-                        name = current_item.get('name')
-            except Exception:
-                name = None
-
-            # Fallback: pull filename from status information
-            if not name:
-                try:
-                    info_root = status.find('information')
-                    if info_root is not None:
-                        for category in info_root.findall('category'):
-                            for info in category.findall('info'):
-                                if info.get('name') == 'filename':
-                                    name = info.text
-                                    break
-                            if name:
-                                break
-                except Exception:
-                    name = None
-
+            _, current_item = await self._vlc_call(self.vlc.get_playlist_current)
+            name = self._extract_current_title(status, current_item)
             if name:
                 try:
                     await self._set_presence(name, reason="startup sync")
                     self.logger.info(f"Startup presence set: {name}")
                 except Exception as e:
-                    self.logger.debug(f"Failed to set startup presence: {e}")
+                    self.logger.debug("Failed to set startup presence: %s", e)
         except Exception as e:
-            self.logger.debug(f"Startup presence sync skipped: {e}")
+            self.logger.debug("Startup presence sync skipped: %s", e)
+
+    def _extract_current_title(self, status, current_item) -> str | None:
+        """Resolve the current item's display name for presence.
+
+        Prefers the current playlist leaf's name, falling back to the filename VLC
+        reports in the status <information> block.
+        """
+        try:
+            if current_item is not None and current_item.get('name'):
+                return current_item.get('name')
+            if status is not None:
+                info = status.find(STATUS_FILENAME_XPATH)
+                if info is not None and info.text:
+                    return info.text
+        except Exception:
+            pass
+        return None
+
+    def _lookup_now_playing_metadata(self, metadata_name: str, uri: str | None, include_tmdb: bool = True):
+        """Resolve TMDB metadata for a Now Playing announcement (blocking; run in a thread).
+
+        Args:
+            metadata_name: Filename/title to parse
+            uri: Item URI (used for folder-name fallback lookups)
+            include_tmdb: When False, only parse the name (no network calls)
+
+        Returns:
+            tuple: (tmdb_embed, edition_tag, is_movie_embed, has_explicit_episode, episode_label)
+        """
+        tmdb_embed = None
+        edition_tag = None
+        is_movie_embed = False
+        has_explicit_episode = False
+        episode_label = None
+        try:
+            (title, year, tv_title, tv_season, tv_episode, tv_year, edition_tag,
+             has_explicit_episode, episode_label) = _parse_media_name(metadata_name)
+
+            if not include_tmdb:
+                pass
+            elif has_explicit_episode and tv_title:
+                # Has explicit episode: prefer TV
+                tmdb_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
+            else:
+                # No explicit episode: try both and compare scores
+                movie_embed = None
+                tv_embed = None
+                movie_score = 0.0
+                tv_score = 0.0
+                
+                if title:
+                    movie_embed = self.tmdb.get_movie_metadata(title, year, file_path=uri)
+                    movie_score = getattr(self.tmdb, '_last_match_score', 0.0)
+                
+                if tv_title:
+                    tv_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
+                    tv_score = getattr(self.tmdb, '_last_match_score', 0.0)
+                
+                # Choose the better match
+                if tv_embed and movie_embed:
+                    tmdb_embed = tv_embed if tv_score > movie_score else movie_embed
+                    is_movie_embed = (tmdb_embed == movie_embed)
+                elif tv_embed:
+                    tmdb_embed = tv_embed
+                elif movie_embed:
+                    tmdb_embed = movie_embed
+                    is_movie_embed = True
+                else:
+                    # Fallback: try generic TV lookup
+                    if title:
+                        tmdb_embed = self.tmdb.get_tv_metadata(title)
+        except Exception:
+            tmdb_embed = None
+        return tmdb_embed, edition_tag, is_movie_embed, has_explicit_episode, episode_label
 
-    async def _announce_now_playing(self, origin: str, item: ET.Element | None, position: int | None):
+    async def _lookup_metadata_async(self, metadata_name: str, uri: str | None):
+        """Run _lookup_now_playing_metadata on the metadata workers with a timeout.
+
+        A hung TMDB request can only delay its own announcement; on timeout the
+        filename-derived details are returned without TMDB data.
+
+        Completed lookups (including "no TMDB match") are cached per item so the periodic
+        announcer and repeated status calls do not repeat the TMDB round-trips. The
+        cached embed is never mutated; _build_now_playing_embed works on a copy.
+        """
+        key = (metadata_name, uri)
+        entry = self._metadata_cache.get(key)
+        if entry is not None and (time.monotonic() - entry[0]) <= self.METADATA_CACHE_TTL:
+            return entry[1]
+        self._metadata_cache.pop(key, None)
+
+        future = self._loop.run_in_executor(self._metadata_executor, self._lookup_now_playing_metadata, metadata_name, uri)
+        try:
+            lookup = await asyncio.wait_for(future, timeout=self.METADATA_LOOKUP_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"TMDB lookup timed out after {self.METADATA_LOOKUP_TIMEOUT:.0f}s for '{metadata_name}'")
+            # Not cached: a later announcement may still get the TMDB data
+            return self._lookup_now_playing_metadata(metadata_name, uri, include_tmdb=False)
+
+        while len(self._metadata_cache) >= self.METADATA_CACHE_MAX_ENTRIES:
+            try:
+                self._metadata_cache.pop(next(iter(self._metadata_cache)))
+            except (StopIteration, KeyError):
+                break
+        self._metadata_cache[key] = (time.monotonic(), lookup)
+        return lookup
+
+    def _build_now_playing_embed(self, display_name: str | None, lookup: tuple, position: int | None = None) -> discord.Embed:
+        """Build the "Now Playing" embed shared by announcements and the status command.
+
+        Args:
+            display_name: Name to show when there is no TMDB match (None -> "VLC Status")
+            lookup: Result tuple from _lookup_now_playing_metadata
+            position: 1-based playlist position to show, if known
+        """
+        tmdb_embed, edition_tag, is_movie_embed, has_explicit_episode, episode_label = lookup
+        if tmdb_embed:
+            # Work on a deep copy: lookups are cached and shared between announcements, and
+            # Embed.to_dict() hands back the same fields list the source embed holds
+            embed = discord.Embed.from_dict(copy.deepcopy(tmdb_embed.to_dict()))
+            embed.title = f"Now Playing: {tmdb_embed.title}"
+            if edition_tag and is_movie_embed:
+                embed.add_field(name="Edition", value=edition_tag, inline=True)
+            if episode_label and not is_movie_embed:
+                embed.add_field(name="Episode", value=episode_label, inline=True)
+        else:
+            fields = []
+            if edition_tag and not has_explicit_episode:
+                fields.append({'name': "Edition", 'value': edition_tag, 'inline': True})
+            if episode_label:
+                fields.append({'name': "Episode", 'value': episode_label, 'inline': True})
+            embed = discord.Embed.from_dict({
+                **NOW_PLAYING_TEMPLATE,
+                'title': f"Now Playing: {display_name}" if display_name else "VLC Status",
+                'fields': fields,
+            })
+        if position:
+            embed.add_field(name="Playlist", value=f"#{position}", inline=True)
+        return embed
+
+    async def _announce_now_playing(self, origin: str, item: ET.Element | None, position: int | None,
+                                    edit_msg: discord.Message | None = None,
+                                    metadata_task: asyncio.Task | None = None):
         """Unified Now Playing announcer with cooldown and de-duplication.
 
         origin: 'command' | 'monitor' | 'periodic'
         item: current VLC playlist leaf element
         position: 1-based playlist position if known
+        edit_msg: optional placeholder message (e.g. "Loading…") to edit in place
+        metadata_task: optional task already running _lookup_now_playing_metadata for this item
         """
         try:
             if item is None:
@@ -210,132 +653,143 @@ class PlaybackCommands(commands.Cog):
             if not display_name:
                 return
             # Build a de-duplication key from cleaned name and position
-            key = f"{MediaUtils.clean_filename_for_display(display_name)}|{position or ''}"
-            now_ts = asyncio.get_event_loop().time()
-            # Cooldown: avoid re-announcing the same item too frequently
-            if self._last_now_playing_key == key and (now_ts - self._last_now_playing_ts) < self._np_cooldown:
-                return
-            # Prepare TMDB embed if possible
-            tmdb_embed = None
-            edition_tag = None
-            is_movie_embed = False
-            has_explicit_episode = False
-            episode_label = None
-            try:
-                title, year = MediaUtils.parse_movie_filename(metadata_name)
-                tv_title, tv_season, tv_episode, tv_year = MediaUtils.parse_tv_filename(metadata_name)
-                edition_tag = MediaUtils.extract_edition_tag(metadata_name)
-                if tv_season and tv_episode:
-                    episode_label = f"S{int(tv_season):02d}E{int(tv_episode):02d}"
-                
-                # Detect if there's an explicit episode marker
-                has_explicit_episode = bool(tv_episode) or bool(re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", metadata_name))
-                
-                if has_explicit_episode and tv_title:
-                    # Has explicit episode: prefer TV
-                    tmdb_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
-                else:
-                    # No explicit episode: try both and compare scores
-                    movie_embed = None
-                    tv_embed = None
-                    movie_score = 0.0
-                    tv_score = 0.0
-                    
-                    if title:
-                        movie_embed = self.tmdb.get_movie_metadata(title, year, file_path=uri)
-                        movie_score = getattr(self.tmdb, '_last_match_score', 0.0)
-                    
-                    if tv_title:
-                        tv_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
-                        tv_score = getattr(self.tmdb, '_last_match_score', 0.0)
-                    
-                    # Choose the better match
-                    if tv_embed and movie_embed:
-                        tmdb_embed = tv_embed if tv_score > movie_score else movie_embed
-                        is_movie_embed = (tmdb_embed == movie_embed)
-                    elif tv_embed:
-                        tmdb_embed = tv_embed
-                    elif movie_embed:
-                        tmdb_embed = movie_embed
-                        is_movie_embed = True
-                    else:
-                        # Fallback: try generic TV lookup
-                        if title:
-                            tmdb_embed = self.tmdb.get_tv_metadata(title)
-            except Exception:
-                tmdb_embed = None
-            if tmdb_embed:
-                final = tmdb_embed
-                final.title = f"Now Playing: {final.title}"
-                if edition_tag and is_movie_embed:
-                    try:
-                        final.add_field(name="Edition", value=edition_tag, inline=True)
-                    except Exception:
-                        pass
-                if episode_label and not is_movie_embed:
-                    try:
-                        final.add_field(name="Episode", value=episode_label, inline=True)
-                    except Exception:
-                        pass
-            else:
-                final = discord.Embed(title=f"Now Playing: {display_name}", color=discord.Color.blue())
-                if edition_tag and not has_explicit_episode:
-                    try:
-                        final.add_field(name="Edition", value=edition_tag, inline=True)
-                    except Exception:
-                        pass
-                if episode_label:
-                    try:
-                        final.add_field(name="Episode", value=episode_label, inline=True)
-                    except Exception:
-                        pass
-            # Add position if available
-            if position:
+            key = f"{MediaUtils.clean_filename_for_display(display_name or '')}|{position or ''}"
+            # Only the de-dup check and the reservation are serialized, so a monitor transition
+            # and a command cannot both announce the same item; the slow TMDB lookup and the
+            # Discord sends below run outside the lock
+            async with self._announce_lock:
+                now_ts = self._now()
+                # Cooldown: avoid re-announcing the same item too frequently
+                if self._last_now_playing_key == key and (now_ts - self._last_now_playing_ts) < self._np_cooldown:
+                    return
+                # A command may have announced while this monitor call waited for the lock
+                if origin == 'monitor' and now_ts < self._suppress_auto_announce_until:
+                    return
+                # Reserve the key (and the command suppression window) before any awaits
+                self._last_now_playing_key = key
+                self._last_now_playing_ts = now_ts
+                if origin == 'command':
+                    self._last_command_announce_ts = now_ts
+                    self._suppress_auto_announce_until = now_ts + self._auto_suppress_seconds
+                    self._last_announced_item_id = item.get('id')
+                    self._last_announced_item_name = name
+            # Prepare TMDB embed if possible (prefetched by the caller or looked up off the event loop)
+            lookup = None
+            if metadata_task is not None:
                 try:
-                    final.add_field(name="Playlist", value=f"#{position}", inline=True)
+                    lookup = await metadata_task
                 except Exception:
-                    pass
+                    lookup = None
+            if lookup is None:
+                lookup = await self._lookup_metadata_async(metadata_name, uri)
+            final = self._build_now_playing_embed(display_name, lookup, position)
             # Update presence
-            try:
-                await self._set_presence(display_name, reason=f"now playing ({origin})")
-            except Exception:
-                pass
-            # Send to announce channels
-            channel_ids = Config.get_announce_channel_ids()
-            for channel_id in channel_ids or []:
+            await self._set_presence(display_name, reason=f"now playing ({origin})")
+            # Replace the command's placeholder in place instead of posting a second message
+            edited_channel_id = None
+            if edit_msg is not None:
                 try:
-                    channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
-                    if channel:
-                        await channel.send(embed=final)
-                        self.logger.info(f"Sent unified Now Playing ({origin}) to channel {channel_id}")
+                    await edit_msg.edit(content=None, embed=final)
+                    edited_channel_id = edit_msg.channel.id
                 except Exception as e:
-                    self.logger.error(f"Failed to send unified Now Playing to channel {channel_id}: {e}")
-            # Record last
-            self._last_now_playing_key = key
-            self._last_now_playing_ts = now_ts
-            # Mark command suppression states
-            try:
-                self._last_command_announce_ts = now_ts if origin == 'command' else self._last_command_announce_ts
-                if origin == 'command':
-                    self._suppress_auto_announce_until = now_ts + self._auto_suppress_seconds
-                    self._last_announced_item_id = item.get('id')
-                    self._last_announced_item_name = name
-            except Exception:
-                pass
+                    self.logger.debug("Failed to edit placeholder message: %s", e)
+            # Send to announce channels concurrently
+            channel_ids = [cid for cid in self._announce_channel_ids if cid != edited_channel_id]
+            await self._send_to_channels(channel_ids, final, f"unified Now Playing ({origin})")
         except Exception as e:
             self.logger.error(f"_announce_now_playing error: {e}")
-        
+
+    async def _resolve_channel(self, channel_id: int):
+        """Return the channel for an id, caching it so fetch_channel runs at most once per channel.
+
+        Channels that are missing or not visible to the bot are remembered for
+        CHANNEL_MISS_TTL, so a bad id does not cost a REST call on every notification
+        but a restored channel or fixed permission is picked up again.
+        """
+        channel = self._channel_cache.get(channel_id)
+        if channel is not None:
+            return channel
+        now = self._now()
+        if now < self._channel_misses.get(channel_id, 0.0):
+            return None
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except (discord.NotFound, discord.Forbidden) as e:
+                self.logger.warning(f"Channel {channel_id} is not available: {e}")
+                self._channel_misses[channel_id] = now + self.CHANNEL_MISS_TTL
+                return None
+        self._channel_misses.pop(channel_id, None)
+        self._channel_cache[channel_id] = channel
+        return channel
+
+    async def _notify_watch_channel(self, text: str, label: str):
+        """Queue a plain-text notice for the auto-play notification channel, if any.
+
+        Notices are coalesced for NOTIFY_COALESCE_SECONDS; within the window only the
+        latest notice per label is kept, so queue churn produces a single message.
+        """
+        if not self._watch_channel_id:
+            return
+        self._notify_buf.pop(label, None)
+        self._notify_buf[label] = text
+        if self._notify_task is None or self._notify_task.done():
+            self._notify_task = asyncio.create_task(self._flush_notify_after(self.NOTIFY_COALESCE_SECONDS))
+
+    async def _flush_notify_after(self, delay: float):
+        """Wait out the coalescing window, then send all pending notices in one message."""
+        await asyncio.sleep(delay)
+        buf, self._notify_buf = self._notify_buf, {}
+        if not buf:
+            return
+        try:
+            channel = await self._resolve_channel(self._watch_channel_id)
+            if channel:
+                await channel.send("\n".join(buf.values()))
+        except Exception as e:
+            logger.error(f"Failed to send {', '.join(buf)}: {e}")
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Drop deleted channels from the announce channel cache."""
+        self._channel_cache.pop(channel.id, None)
+
+    async def _send_to_channel(self, channel_id: int, embed: discord.Embed, label: str):
+        """Send an embed to one announce channel."""
+        try:
+            channel = await self._resolve_channel(channel_id)
+            if channel:
+                await channel.send(embed=embed)
+                self.logger.info(f"Sent {label} to channel {channel_id}")
+        except Exception as e:
+            self.logger.error(f"Failed to send {label} to channel {channel_id}: {e}")
+
+    async def _send_to_channels(self, channel_ids, embed: discord.Embed, label: str):
+        """Send an embed to several announce channels concurrently."""
+        if not channel_ids:
+            return
+        results = await asyncio.gather(
+            *(self._send_to_channel(cid, embed, label) for cid in channel_ids),
+            return_exceptions=True,
+        )
+        for cid, result in zip(channel_ids, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to send {label} to channel {cid}: {result}")
+
     async def cog_unload(self):
         """Called when the cog is unloaded"""
         if self.monitoring_task:
             self.monitoring_task.cancel()
             self.logger.info("VLC state monitoring stopped")
-        if self._presence_progress_task:
-            self._presence_progress_task.cancel()
-            self.logger.info("Presence progress updater stopped")
-        if self.periodic_announce_task:
-            self.periodic_announce_task.cancel()
-            self.logger.info("Periodic announcement task stopped")
+        if self._periodic_announce_inflight:
+            self._periodic_announce_inflight.cancel()
+        if self._presence_flusher_task:
+            self._presence_flusher_task.cancel()
+        if self._notify_task:
+            self._notify_task.cancel()
+        self._metadata_executor.shutdown(wait=False)
+        self._vlc_executor.shutdown(wait=False)
 
     @commands.command(name='cleanup', aliases=['plcleanup','cleanup_missing'])
     async def cleanup_missing(self, ctx: commands.Context):
@@ -351,7 +805,7 @@ class PlaybackCommands(commands.Cog):
         except Exception:
             pass
         try:
-            result = self.vlc.remove_missing_playlist_items()
+            result = await self._vlc_call(self.vlc.remove_missing_playlist_items)
             removed = int(result.get('removed', 0))
             items = result.get('items', []) or []
             if removed == 0:
@@ -363,7 +817,7 @@ class PlaybackCommands(commands.Cog):
             lines = []
             for it in listed:
                 nm = it.get('name') or '<unknown>'
-                lines.append(f"• {MediaUtils.clean_filename_for_display(nm)}")
+                lines.append(f"• {MediaUtils.clean_filename_for_display(nm or '')}")
             if more > 0:
                 lines.append(f"… and {more} more")
             embed = discord.Embed(
@@ -371,223 +825,121 @@ class PlaybackCommands(commands.Cog):
                 description=f"Removed {removed} missing file(s) from the playlist:\n\n" + "\n".join(lines),
                 color=discord.Color.orange()
             )
-            try:
-                embed.set_footer(text="Cleanup tool")
-            except Exception:
-                pass
+            embed.set_footer(text="Cleanup tool")
             await ctx.send(embed=embed)
         except Exception as e:
             self.logger.error(f"cleanup_missing error: {e}")
             await ctx.send(f"❌ Cleanup failed: {e}")
 
-    async def _periodic_announce_loop(self):
-        """Periodically announce the currently playing media, triggered by playback start."""
-        try:
-            await self.bot.wait_until_ready()
-        except Exception:
-            return
+    def _maybe_periodic_announce(self, status, now: float):
+        """Schedule the periodic Now Playing announcement when it is due.
 
-        while not self.bot.is_closed():
-            try:
-                # Wait until playback starts
+        Armed by playback start (playback_started_event); the first announcement goes out
+        one interval after playback starts and then every interval while playback lasts.
+        """
+        if not self.playback_started_event.is_set():
+            if self._next_periodic_announce_due is not None:
                 self.logger.info("Periodic announcer is waiting for playback to start...")
-                await self.playback_started_event.wait()
-                self.logger.info("Playback started, periodic announcer is active.")
-
-                interval = int(getattr(Config, 'PERIODIC_ANNOUNCE_INTERVAL', 300))
-
-                # Wait for the initial interval before the first announcement
-                await asyncio.sleep(interval)
-
-                # Keep announcing as long as playback is active
-                while self.playback_started_event.is_set():
-                    if not getattr(Config, 'PERIODIC_ANNOUNCE_ENABLED', False):
-                        self.logger.debug("Periodic announcement disabled in config, pausing until re-enabled.")
-                        # If disabled, wait until it might be re-enabled without spamming checks
-                        await asyncio.sleep(interval)
-                        continue
-
-                    channel_ids = Config.get_announce_channel_ids()
-                    if not channel_ids:
-                        self.logger.debug("Periodic announcement skipped: No announcement channels configured.")
-                        await asyncio.sleep(interval)
-                        continue
-                    
-                    status = self.vlc.get_status()
-                    if status and status.find('state').text == 'playing':
-                        self.logger.info("VLC is playing, preparing periodic announcement...")
-                        embed = await self.get_status_embed()
-                        if embed:
-                            for channel_id in channel_ids:
-                                try:
-                                    channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
-                                    if channel:
-                                        await channel.send(embed=embed)
-                                        self.logger.info(f"Sent periodic 'Now Playing' announcement to channel {channel_id}")
-                                except Exception as e:
-                                    self.logger.error(f"Failed to send periodic announcement to channel {channel_id}: {e}")
-                        else:
-                            self.logger.debug("Periodic announcement skipped: could not generate status embed.")
-                    else:
-                        self.logger.debug("Periodic announcement skipped: VLC not in 'playing' state.")
-
-                    # Wait for the next interval
-                    await asyncio.sleep(interval)
-
-            except asyncio.CancelledError:
-                break # Exit loop cleanly on cancellation
-            except Exception as e:
-                self.logger.error(f"Error in periodic announcement loop: {e}")
-                # If a major error occurs, wait a bit before restarting the wait
-                await asyncio.sleep(30)
+                # Playback stopped: drop an announcement still waiting on its embed
+                if self._periodic_announce_inflight is not None and not self._periodic_announce_inflight.done():
+                    self._periodic_announce_inflight.cancel()
+            self._next_periodic_announce_due = None
+            return
 
-    async def _presence_progress_loop(self):
-        """Periodically update presence with playback progress (mm:ss/MM:SS)."""
-        try:
-            await self.bot.wait_until_ready()
-        except Exception:
+        interval = self._periodic_announce_interval
+        if self._next_periodic_announce_due is None:
+            self.logger.info("Playback started, periodic announcer is active.")
+            self._next_periodic_announce_due = now + interval
             return
-        interval = 0
-        try:
-            interval = max(5, int(getattr(Config, 'PRESENCE_PROGRESS_UPDATE_INTERVAL', 30)))
-        except Exception:
-            interval = 30
-        while not self.bot.is_closed():
-            try:
-                # Respect config toggles
-                if not getattr(Config, 'ENABLE_PRESENCE', True) or not getattr(Config, 'ENABLE_PRESENCE_PROGRESS', True):
-                    await asyncio.sleep(interval)
-                    continue
+        if now < self._next_periodic_announce_due:
+            return
+        self._next_periodic_announce_due = now + interval
 
-                status = None
-                try:
-                    status = self.vlc.get_status()
-                except Exception:
-                    status = None
+        if not self._periodic_announce_enabled:
+            self.logger.debug("Periodic announcement disabled in config, pausing until re-enabled.")
+            return
 
-                if status is None:
-                    await asyncio.sleep(interval)
-                    continue
+        channel_ids = self._announce_channel_ids
+        if not channel_ids:
+            self.logger.debug("Periodic announcement skipped: No announcement channels configured.")
+            return
 
-                state_elem = status.find('state')
-                current_state = state_elem.text if state_elem is not None else None
-                # Only update progress while playing or paused
-                if current_state not in ['playing', 'paused']:
-                    await asyncio.sleep(interval)
-                    continue
+        if status is None or status.findtext('state') != 'playing':
+            self.logger.debug("Periodic announcement skipped: VLC not in 'playing' state.")
+            return
+        # Building the embed may wait on TMDB; run it beside the poller so queue handling keeps ticking
+        if self._periodic_announce_inflight is not None and not self._periodic_announce_inflight.done():
+            self.logger.debug("Periodic announcement skipped: previous announcement still in progress.")
+            return
+        self._periodic_announce_inflight = self.bot.loop.create_task(self._send_periodic_announcement(channel_ids))
 
-                # Resolve current title
-                title = None
-                try:
-                    playlist = self.vlc.get_playlist()
-                    if playlist is not None:
-                        _, current_item = self._find_current_position(playlist)
-                        if current_item is not None:
-                            title = current_item.get('name')
-                except Exception:
-                    title = None
-                if not title:
-                    try:
-                        info_root = status.find('information')
-                        if info_root is not None:
-                            for category in info_root.findall('category'):
-                                for info in category.findall('info'):
-                                    if info.get('name') == 'filename':
-                                        title = info.text
-                                        break
-                                if title:
-                                    break
-                    except Exception:
-                        title = None
+    async def _send_periodic_announcement(self, channel_ids):
+        """Send the current status embed to the announce channels."""
+        try:
+            self.logger.info("VLC is playing, preparing periodic announcement...")
+            embed = await self.get_status_embed()
+            if not embed:
+                self.logger.debug("Periodic announcement skipped: could not generate status embed.")
+                return
+            await self._send_to_channels(channel_ids, embed, "periodic 'Now Playing' announcement")
+        except Exception as e:
+            self.logger.error(f"Error in periodic announcement loop: {e}")
 
-                if not title:
-                    await asyncio.sleep(interval)
-                    continue
+    async def _presence_progress_tick(self, status, current_item):
+        """Update presence with playback progress (mm:ss/MM:SS) from a poll snapshot."""
+        # Respect config toggles
+        if not self._presence_enabled or not self._presence_progress_enabled:
+            return
+        if status is None:
+            return
 
-                # Compute progress string
-                progress_suffix = None
-                try:
-                    time_elem = status.find('time')
-                    length_elem = status.find('length')
-                    if time_elem is not None and length_elem is not None and time_elem.text and length_elem.text:
-                        cur = int(time_elem.text)
-                        total = int(length_elem.text)
-                        if total > 0 and cur >= 0:
-                            def fmt(n: int) -> str:
-                                return f"{n//60}:{n%60:02d}"
-                            progress_suffix = f"{fmt(cur)}/{fmt(total)}"
-                except Exception:
-                    progress_suffix = None
+        current_state = status.findtext('state')
+        # Only update progress while playing or paused
+        if current_state not in _ACTIVE_STATES:
+            return
 
-                name_for_presence = title
-                if progress_suffix:
-                    # Trim to keep final presence text within safe limits (~120 chars)
-                    base = title
-                    try:
-                        suffix = f" — {progress_suffix}"
-                        max_total = 120
-                        max_base = max_total - len(suffix)
-                        if len(base) > max_base:
-                            base = base[: max(0, max_base - 3)] + "..."
-                        name_for_presence = base + suffix
-                    except Exception:
-                        name_for_presence = f"{title} — {progress_suffix}"
+        title = self._extract_current_title(status, current_item)
+        if not title:
+            return
 
-                # Mark paused state in reason for clarity (no change to visible text)
-                reason = "progress tick (paused)" if current_state == 'paused' else "progress tick"
-                try:
-                    await self._set_presence(name_for_presence, reason=reason)
-                except Exception:
-                    pass
+        # Compute progress string
+        progress_suffix = None
+        cur, total = _extract_time(status)
+        if cur is not None and total > 0 and cur >= 0:
+            progress_suffix = f"{cur // 60}:{cur % 60:02d}/{total // 60}:{total % 60:02d}"
+
+        name_for_presence = title
+        if progress_suffix:
+            # Trim to keep final presence text within safe limits
+            suffix = f"{PRESENCE_PROGRESS_SEP}{progress_suffix}"
+            max_base = PRESENCE_MAX_LENGTH - len(suffix)
+            if len(title) > max_base:
+                title = title[: max(0, max_base - 3)] + "..."
+            name_for_presence = title + suffix
+
+        # Nothing to do when Discord already shows this text (e.g. while paused)
+        if name_for_presence == self._presence_last_name and self._pending_presence is None:
+            return
 
-            except Exception as e:
-                logger.debug(f"Presence progress loop error: {e}")
-            finally:
-                try:
-                    await asyncio.sleep(interval)
-                except Exception:
-                    pass
-        
-    def _find_current_position(self, playlist):
-        """Find the position of the current item in the playlist
-        
-        Args:
-            playlist: The XML playlist from VLC
-            
-        Returns:
-            tuple: (position, current_item) where position is 1-based index or None if not found
-                  and current_item is the XML element or None if not found
-        """
-        if playlist is None:
-            return None, None
-            
-        current_item = None
-        position = None
-        
-        # Find current item and its position
-        for i, item in enumerate(playlist.findall('.//leaf')):
-            if item.get('current'):
-                current_item = item
-                position = i + 1  # Convert to 1-based index
-                break
-                
-        return position, current_item
+        # Mark paused state in reason for clarity (no change to visible text)
+        reason = "progress tick (paused)" if current_state == 'paused' else "progress tick"
+        await self._set_presence(name_for_presence, reason=reason)
 
     async def _check_cooldown(self, ctx):
         """Check if enough time has passed since last state change"""
         guild_id = str(ctx.guild.id) if ctx.guild else 'dm'
-        current_time = asyncio.get_event_loop().time()
+        current_time = self._now()
         
         if guild_id in self.last_state_change:
             time_since_last = current_time - self.last_state_change[guild_id]
             if time_since_last < 1:
-                logger.debug(f"Command ignored - too soon after last state change ({time_since_last:.2f}s)")
+                logger.debug("Command ignored - too soon after last state change (%.2fs)", time_since_last)
                 return False
         return True
     
     def _check_queue_auto_play_cooldown(self):
         """Check if enough time has passed since last queue auto-play to prevent rapid triggers"""
-        current_time = asyncio.get_event_loop().time()
+        current_time = self._now()
         time_since_last = current_time - self.last_queue_auto_play
         
         if time_since_last < 2.0:  # 2 second cooldown between queue auto-plays
@@ -607,24 +959,12 @@ class PlaybackCommands(commands.Cog):
         try:
             # No target provided -> show usage embed
             if target is None:
-                embed = discord.Embed(
-                    title="Playback Speed — Usage",
-                    description=(
-                        f"Set the playback rate using a numeric value, or use a preset like 'normal' to reset.\n\n"
-                        f"Examples: {format_cmd_inline('speed 1.5')} or {format_cmd_inline('speed normal')}"
-                    ),
-                    color=discord.Color.blue()
-                )
-                embed.add_field(name="Aliases", value="spd, speed15, speednorm", inline=True)
-                await ctx.send(embed=embed)
+                await ctx.send(embed=self._speed_usage_embed)
                 return
 
             t = target.strip().lower()
-            if t in ('1.5', '1.5x', '15', 'fast', 'up'):
-                rate = 1.5
-            elif t in ('1', '1.0', 'normal', 'default', 'reset', 'norm'):
-                rate = 1.0
-            else:
+            rate = SPEED_PRESETS.get(t)
+            if rate is None:
                 # Try to parse a float
                 try:
                     rate = float(t.rstrip('x'))
@@ -640,356 +980,399 @@ class PlaybackCommands(commands.Cog):
 
             ok = False
             try:
-                ok = self.vlc.set_rate(rate)
+                ok = await self._vlc_call(self.vlc.set_rate, rate)
+            except Exception as e:
+                logger.error(f"Error setting playback rate: {e}")
+
+            if ok:
+                if rate == 1.0:
+                    embed = discord.Embed(
+                        title="Playback Speed Reset",
+                        description="✅ Playback speed reset to normal (1.0x)",
+                        color=discord.Color.green()
+                    )
+                else:
+                    embed = discord.Embed(
+                        title="Playback Speed Updated",
+                        description=f"✅ Playback speed set to {rate}x",
+                        color=discord.Color.green()
+                    )
+                # Add Ko-fi support field when configured
+                if self._kofi_field:
+                    embed.add_field(**self._kofi_field)
+                await ctx.send(embed=embed)
+            else:
+                embed = discord.Embed(
+                    title="Playback Speed Failed",
+                    description=f"⚠️ Failed to set playback speed to {rate}x",
+                    color=discord.Color.orange()
+                )
+                await ctx.send(embed=embed)
+        except Exception as e:
+            logger.error(f"Speed command error: {e}")
+            embed = discord.Embed(
+                title="Error",
+                description=f"An error occurred while setting playback speed: {e}",
+                color=discord.Color.dark_red()
+            )
+            await ctx.send(embed=embed)
+        
+    async def _vlc_poller(self):
+        """Single background poller for VLC state, presence progress and periodic announcements.
+
+        Fetches status and the current playlist item once per tick and hands the same
+        snapshot to each concern instead of running three loops that each poll VLC on
+        their own timer.
+        """
+        await self.bot.wait_until_ready()
+        last_key = None
+        unchanged_ticks = 0
+        while not self.bot.is_closed():
+            status = None
+            current_position, current_item = None, None
+            try:
+                # HTTP + XML parse run in worker threads so the event loop keeps dispatching.
+                # Only the current leaf is needed here, so the playlist is stream-parsed.
+                # These are read-only snapshots, so they skip the ordered VLC worker (see _vlc_call).
+                status, (current_position, current_item) = await asyncio.gather(
+                    asyncio.to_thread(self.vlc.get_status),
+                    asyncio.to_thread(self.vlc.get_playlist_current),
+                )
+            except Exception as e:
+                logger.error(f"Error polling VLC: {e}")
+            now = self._now()
+            if now - self._runtime_settings_ts >= self.RUNTIME_SETTINGS_REFRESH:
+                self._reload_runtime_settings(now)
+            # Presence progress runs before state handling so a queue auto-play in this
+            # tick is not overwritten by the older title from the same snapshot
+            if now >= self._next_presence_progress_due:
+                self._next_presence_progress_due = now + self._presence_progress_interval
+                try:
+                    await self._presence_progress_tick(status, current_item)
+                except Exception as e:
+                    logger.debug("Presence progress loop error: %s", e)
+            try:
+                await self._monitor_tick(status, current_position, current_item)
+            except Exception as e:
+                logger.error(f"Error in VLC monitoring task: {e}")
+            try:
+                self._maybe_periodic_announce(status, now)
+            except Exception as e:
+                self.logger.error(f"Error in periodic announcement loop: {e}")
+
+            # Back off while state and track stay the same; any change snaps back to fast polling,
+            # and the end of a track (where queue auto-play happens) is always polled quickly
+            key = (status.findtext('state') if status is not None else None, current_position)
+            if key != last_key:
+                last_key = key
+                unchanged_ticks = 0
+            elif self._near_track_end(status):
+                unchanged_ticks = 0
+            else:
+                unchanged_ticks += 1
+            interval = min(self.MONITOR_MAX_INTERVAL, self.MONITOR_INTERVAL * (1.5 ** min(unchanged_ticks, 6)))
+            try:
+                await asyncio.wait_for(self._poll_wake.wait(), timeout=interval)
+                self._poll_wake.clear()
+                unchanged_ticks = 0
+            except asyncio.TimeoutError:
+                pass
+
+    def wake_poller(self):
+        """Poll VLC again right away instead of waiting out the backoff.
+
+        Other cogs call this after they change playback (e.g. play_search, the scheduler).
+        """
+        self._poll_wake.set()
+
+    async def cog_after_invoke(self, ctx):
+        """Wake the poller after any command in this cog, since it may have changed VLC's state."""
+        self.wake_poller()
+
+    def _near_track_end(self, status) -> bool:
+        """True when the status reports less than MONITOR_NEAR_END_SECONDS left in the track."""
+        current_time, total_length = _extract_time(status)
+        if current_time is None:
+            return False
+        return total_length > 0 and (total_length - current_time) < self.MONITOR_NEAR_END_SECONDS
+
+    async def _monitor_tick(self, status, current_position, current_item):
+        """Handle VLC state and track transitions for one poll snapshot"""
+        current_state = status.findtext('state') if status is not None else None
+        if current_state is None:
+            return
+        # Playback time/length from this tick's status, shared by the end-of-track checks below
+        current_time, total_length = _extract_time(status)
+        last = self._last_snapshot
+        item_attrs = current_item.attrib if current_item is not None else {}
+        # Per-tick context shared by the handlers below; 'next_queued' is the soft-queue head,
+        # refreshed by a handler only after it changes the queue
+        tick = {
+            'state': current_state,
+            'position': current_position,
+            'item': current_item,
+            # Leaf attributes read once per tick
+            'item_id': item_attrs.get('id'),
+            'item_name': item_attrs.get('name'),
+            'time': current_time,
+            'length': total_length,
+            'next_queued': await self._vlc_call(self.vlc.get_next_queued_item),
+            'last': last,
+            'state_changed': last['state'] is not None and current_state != last['state'],
+            'position_changed': last['state'] is not None and current_position != last['position'],
+        }
+        await self._sync_playback_flags(current_state)
+
+        if tick['state_changed'] or tick['position_changed']:
+            if tick['position_changed']:
+                self.vlc.invalidate_subtitle_cache()
+            await self._handle_queue_transition(tick)
+            # A command-initiated change consumes the tick: the snapshot is left as-is
+            if await self._handle_change_announce(tick):
+                return
+
+        # Update last known state
+        self._last_snapshot = {'state': current_state, 'position': current_position, 'item_id': tick['item_id']}
+
+        # Steady playback with an empty soft queue: the end-of-track and queue checks only
+        # act near the end of a track or with something queued, so skip them outright
+        if not tick['next_queued']:
+            if current_time is None or total_length <= 0 or (total_length - current_time) >= self.MONITOR_NEAR_END_SECONDS:
+                return
+
+        await self._handle_track_end(tick)
+        if tick['next_queued']:
+            await self._enforce_queue(tick)
+
+    async def _sync_playback_flags(self, current_state):
+        """Mirror VLC's state into presence and the periodic announcer's started event."""
+        # If VLC is stopped, clear the bot's presence (throttled)
+        # BUT: do not clear it if we are still waiting for the initial scan to complete
+        try:
+            if current_state == 'stopped':
+                if not self._initial_scan_pending:
+                    await self._set_presence(None, reason="stopped")
+                # Signal that playback has stopped
+                if self.playback_started_event.is_set():
+                    self.logger.info("Playback stopped, deactivating periodic announcer.")
+                    self.playback_started_event.clear()
+            elif current_state == 'playing':
+                # Signal that playback has started
+                if not self.playback_started_event.is_set():
+                    self.playback_started_event.set()
+        except Exception:
+            # Non-fatal: presence/event update failures should not stop monitoring
+            pass
+
+    async def _handle_queue_transition(self, tick):
+        """Keep the soft queue in charge across track changes and stops/pauses."""
+        current_state = tick['state']
+        current_item = tick['item']
+        state_changed = tick['state_changed']
+        position_changed = tick['position_changed']
+        # Handle queue transitions when track changes OR when state changes to stopped/paused
+        if not ((position_changed and current_item is not None) or (state_changed and current_state in _END_STATES)):
+            return
+        # Track-change handling keys off the playing item's id and is opt-in; without it
+        # only the stop/pause branch below runs (see QUEUE_INTERRUPT_ON_TRACK_CHANGE)
+        follow_track_changes = self.QUEUE_INTERRUPT_ON_TRACK_CHANGE
+        current_item_id = tick['item_id'] if follow_track_changes and current_item is not None else None
+        next_queued = tick['next_queued']
+
+        # Priority 1: Handle position changes (track transitions)
+        if position_changed and current_item_id:
+            # There's a queued item - check if the current track is NOT the queued item
+            if next_queued and current_item_id != next_queued['item_id'] and self._check_queue_auto_play_cooldown():
+                logger.info("Track changed to %s but we have queued item %s - interrupting to play queued item", current_item_id, next_queued['item_id'])
+                try:
+                    play_result = await self._vlc_call(self.vlc.play_next_queued_item)
+                    logger.info("Auto-play result: %s", play_result)
+
+                    if play_result.get("success"):
+                        tick['next_queued'] = await self._vlc_call(self.vlc.get_next_queued_item)
+                        logger.info("Auto-played next queued item: %s", play_result.get('item_name', 'Unknown'))
+
+                        # Optionally notify in Discord if notification channel is set
+                        await self._notify_watch_channel(f"Auto-playing next queued item: **{play_result.get('item_name', 'Unknown')}**", "auto-play notification")
+
+                    else:
+                        logger.warning("Auto-play failed: %s", play_result.get('error', 'Unknown error'))
+                except Exception as e:
+                    logger.error("Error auto-playing next queued item: %s", e)
+
+        # Priority 2: For state changes to stopped OR paused, check if we should auto-play next queued item
+        # (movies often go to paused state when they end, not stopped)
+        elif state_changed and current_state in _END_STATES and next_queued and self._check_queue_auto_play_cooldown():
+            try:
+                logger.info("Track %s - checking for next queued item to auto-play", current_state)
+                logger.info("Next queued item found: %s", next_queued)
+
+                # Additional check: if paused, make sure we're actually at the end
+                should_auto_play = True
+                current_time, total_length = tick['time'], tick['length']
+                if current_state == 'paused' and current_time is not None:
+                    # Only auto-play if we're within 3 seconds of the end
+                    if total_length > 0 and (total_length - current_time) > 3:
+                        should_auto_play = False
+                        logger.debug("Paused but not at end: %s/%ss - not auto-playing", current_time, total_length)
+
+                if should_auto_play:
+                    play_result = await self._vlc_call(self.vlc.play_next_queued_item)
+                    logger.info("Auto-play result: %s", play_result)
+
+                    if play_result.get("success"):
+                        tick['next_queued'] = await self._vlc_call(self.vlc.get_next_queued_item)
+                        logger.info("Auto-played next queued item: %s", play_result.get('item_name', 'Unknown'))
+
+                        # Optionally notify in Discord if notification channel is set
+                        await self._notify_watch_channel(f"Auto-playing next queued item: **{play_result.get('item_name', 'Unknown')}**", "auto-play notification")
+                        # Update presence to show the newly playing queued item
+                        await self._set_presence(play_result.get('item_name'), reason="auto-queue (end detection)")
+                    else:
+                        logger.warning("Auto-play failed: %s", play_result.get('error', 'Unknown error'))
+
+            except Exception as e:
+                logger.error("Error auto-playing next queued item: %s", e)
+
+        if not position_changed or not follow_track_changes:
+            return
+
+        # Handle normal queue transitions for position changes (only if we didn't intercept)
+        if current_item_id:
+            try:
+                # Check for queue transitions and shuffle restoration
+                queue_result = await self._vlc_call(self.vlc.check_and_handle_queue_transition, current_item_id)
+                tick['next_queued'] = await self._vlc_call(self.vlc.get_next_queued_item)
+
+                # Log any queue transitions
+                for transition in queue_result.get("transitions") or ():
+                    if transition["action"] == "shuffle_restored":
+                        logger.info("Queue system restored shuffle after item %s finished", transition['item_id'])
+
+                        # Optionally notify in Discord if notification channel is set
+                        await self._notify_watch_channel("Queue finished, shuffle mode restored.", "shuffle restored notification")
+
+            except Exception as e:
+                logger.error("Error handling queue transition: %s", e)
+
+        # Detect when the last playing item finished (for shuffle restoration)
+        last_item_id = tick['last']['item_id']
+        if last_item_id and last_item_id != current_item_id:
+            # The last playing item is no longer playing - it finished
+            try:
+                await self._vlc_call(self.vlc._handle_queued_item_finished, last_item_id)
+                tick['next_queued'] = await self._vlc_call(self.vlc.get_next_queued_item)
+                # Ensure playback rate is reset to normal after an item finishes
+                try:
+                    await self._vlc_call(self.vlc.set_rate, 1.0)
+                    logger.debug("Playback rate reset to 1.0 after item finished")
+                except Exception as e:
+                    logger.debug("Failed to reset playback rate after finish: %s", e)
+            except Exception as e:
+                logger.error("Error handling finished item %s: %s", last_item_id, e)
+
+    async def _handle_change_announce(self, tick) -> bool:
+        """Log a state/track change, update presence and auto-announce it.
+
+        Returns:
+            True when the change was initiated by a bot command, which consumes the tick.
+        """
+        current_state = tick['state']
+        current_position = tick['position']
+        current_item = tick['item']
+        position_changed = tick['position_changed']
+        item_name = tick['item_name']
+
+        # Log the change regardless of notification channel
+        if tick['state_changed']:
+            logger.info("VLC state changed to: %s", current_state)
+        elif position_changed:
+            logger.info("Track changed to: %s #%s", item_name or 'Unknown', current_position if current_position else 'N/A')
+
+        # Update presence on normal track transitions (no queue intervention)
+        if position_changed and item_name:
+            await self._set_presence(item_name, reason="track change")
+
+        # Only send Discord message if a notification channel is configured
+        channel_ids = self._announce_channel_ids
+        now_ts = self._now()
+        # If the bot itself initiated the change, suppress one-time auto announce and clear the flag
+        if self._command_initiated_change:
+            self.logger.debug("Auto announce suppressed: command-initiated change")
+            self._command_initiated_change = False
+            return True
+        # Hard suppression: if we just sent a command-driven Now Playing, skip auto announce entirely (short window)
+        if position_changed and (now_ts - self._last_command_announce_ts) < self._auto_suppress_seconds:
+            self.logger.debug("Auto announce suppressed: recent command-driven Now Playing")
+        # Note: do not suppress by ID/name to allow manual selection announcements
+        elif channel_ids and (now_ts - self._last_command_announce_ts) > 1 and now_ts >= self._suppress_auto_announce_until:
+            # Use unified announcer
+            await self._announce_now_playing('monitor', current_item, current_position)
+        elif not channel_ids:
+            self.logger.debug("Track change announcement skipped: No announcement channels configured.")
+        else:
+            self.logger.debug("Track change announcement skipped: Debounced.")
+        return False
+
+    async def _handle_track_end(self, tick):
+        """React to playback sitting within a few seconds of the end of the track."""
+        current_state = tick['state']
+        current_time, total_length = tick['time'], tick['length']
+        if current_time is None or total_length <= 0 or current_state not in _ACTIVE_STATES:
+            return
+        remaining = total_length - current_time
+        if tick['next_queued']:
+            # Priority 3: End-of-track detection. This helps in cases where the state change
+            # to 'stopped' is delayed. We just log; the 'stopped'/'paused' handler does the work.
+            if remaining < 3 and self._check_queue_auto_play_cooldown():
+                logger.info("Track is near the end, preparing to auto-play next queued item.")
+        # If VLC pauses at the very end of a track (common behavior) and there's no queued item,
+        # clear presence to avoid showing a stale title
+        elif current_state == 'paused' and remaining <= 3:
+            await self._set_presence(None, reason="paused at end")
+            logger.info("Cleared presence: VLC paused at track end and no queued items")
+
+    async def _enforce_queue(self, tick):
+        """Make sure a waiting soft-queue item gets played."""
+        current_state = tick['state']
+        next_queued = tick['next_queued']
+        # Case 1: VLC is stopped and we have queued items
+        if current_state == 'stopped':
+            # Reset playback rate when VLC has stopped (file finished), batched with the
+            # auto-play so the transition costs one worker hop instead of two
+            self._queue_vlc(self.vlc.set_rate, 1.0)
+            if not self._check_queue_auto_play_cooldown():
+                await self._flush_vlc()
+                return
+            try:
+                self._queue_vlc(self.vlc.play_next_queued_item)
+                play_result = (await self._flush_vlc())[-1] or {"success": False, "error": "VLC call failed"}
+                logger.info("Auto-play result from stopped state: %s", play_result)
+                if play_result.get("success"):
+                    logger.info("Auto-played next queued item: %s", play_result.get('item_name', 'Unknown'))
+                    # Optionally notify
+                    await self._notify_watch_channel(f"Auto-playing next queued item: **{play_result.get('item_name', 'Unknown')}**", "auto-play notification")
+                    # Update presence
+                    await self._set_presence(play_result.get('item_name'), reason="auto-queue (stopped)")
+                else:
+                    logger.warning("Auto-play from stopped state failed: %s", play_result.get('error', 'Unknown error'))
             except Exception as e:
-                logger.error(f"Error setting playback rate: {e}")
+                logger.error("Error auto-playing from stopped state: %s", e)
 
-            if ok:
-                if rate == 1.0:
-                    embed = discord.Embed(
-                        title="Playback Speed Reset",
-                        description="✅ Playback speed reset to normal (1.0x)",
-                        color=discord.Color.green()
-                    )
-                else:
-                    embed = discord.Embed(
-                        title="Playback Speed Updated",
-                        description=f"✅ Playback speed set to {rate}x",
-                        color=discord.Color.green()
-                    )
-                # Add Ko-fi support field when configured
+        # Case 2: VLC is playing but wrong item (queue was bypassed); opt-in, since it
+        # would cut the current track instead of letting the queued item wait for it
+        elif self.QUEUE_INTERRUPT_ON_TRACK_CHANGE and current_state == 'playing' and tick['item'] is not None:
+            current_item_id = tick['item_id']
+            if current_item_id != next_queued['item_id'] and self._check_queue_auto_play_cooldown():
                 try:
-                    if Config.KOFI_URL:
-                        embed.add_field(name="Support kutsaratinidor by supporting CtrlVee", value=f"☕ {f'<{Config.KOFI_URL}>'}", inline=False)
-                except Exception:
-                    pass
-                await ctx.send(embed=embed)
-            else:
-                embed = discord.Embed(
-                    title="Playback Speed Failed",
-                    description=f"⚠️ Failed to set playback speed to {rate}x",
-                    color=discord.Color.orange()
-                )
-                await ctx.send(embed=embed)
-        except Exception as e:
-            logger.error(f"Speed command error: {e}")
-            embed = discord.Embed(
-                title="Error",
-                description=f"An error occurred while setting playback speed: {e}",
-                color=discord.Color.dark_red()
-            )
-            await ctx.send(embed=embed)
-        
-    async def _monitor_vlc_state(self):
-        """Background task to monitor VLC state changes"""
-        await self.bot.wait_until_ready()
-        while not self.bot.is_closed():
-            try:
-                status = self.vlc.get_status()
-                if status:
-                    current_state = status.find('state').text
-                    # If VLC is stopped, clear the bot's presence (throttled)
-                    # BUT: do not clear it if we are still waiting for the initial scan to complete
-                    try:
-                        if current_state == 'stopped':
-                            if not self._initial_scan_pending:
-                                await self._set_presence(None, reason="stopped")
-                            # Signal that playback has stopped
-                            if self.playback_started_event.is_set():
-                                self.logger.info("Playback stopped, deactivating periodic announcer.")
-                                self.playback_started_event.clear()
-                        elif current_state == 'playing':
-                            # Signal that playback has started
-                            if not self.playback_started_event.is_set():
-                                self.playback_started_event.set()
-                    except Exception:
-                        # Non-fatal: presence/event update failures should not stop monitoring
-                        pass
-                    
-                    # Get current position and item from playlist
-                    playlist = self.vlc.get_playlist()
-                    current_position = None
-                    current_item = None
-                    if playlist is not None:
-                        current_position, current_item = self._find_current_position(playlist)
-                    
-                    # Check for state changes
-                    if self.last_known_state is not None:
-                        state_changed = current_state != self.last_known_state
-                        position_changed = current_position != self.last_known_position
-                        
-                        # Handle queue transitions when track changes OR when state changes to stopped/paused
-                        if (position_changed and current_item is not None) or (state_changed and current_state in ['stopped', 'paused']):
-                            current_item_id = current_item.get('id') if current_item else None
-                            
-                            # Priority 1: Handle position changes (track transitions)
-                            if position_changed and current_item_id:
-                                # Check if there's a queue and this is a natural track progression
-                                next_queued = self.vlc.get_next_queued_item()
-                                if next_queued:
-                                    # There's a queued item - check if the current track is NOT the queued item
-                                    if current_item_id != next_queued['item_id']:
-                                        if self._check_queue_auto_play_cooldown():
-                                            logger.info(f"Track changed to {current_item_id} but we have queued item {next_queued['item_id']} - interrupting to play queued item")
-                                            try:
-                                                play_result = self.vlc.play_next_queued_item()
-                                                logger.info(f"Auto-play result: {play_result}")
-                                                
-                                                if play_result.get("success"):
-                                                    logger.info(f"Auto-played next queued item: {play_result.get('item_name', 'Unknown')}")
-                                                    
-                                                    # Optionally notify in Discord if notification channel is set
-                                                    channel_id = getattr(Config, 'WATCH_ANNOUNCE_CHANNEL_ID', 0)
-                                                    if channel_id:
-                                                        try:
-                                                            channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
-                                                            if channel:
-                                                                await channel.send(f"Auto-playing next queued item: **{play_result.get('item_name', 'Unknown')}**")
-                                                        except Exception as e:
-                                                            logger.error(f"Failed to send auto-play notification: {e}")
-                                                        
-                                                else:
-                                                    logger.warning(f"Auto-play failed: {play_result.get('error', 'Unknown error')}")
-                                            except Exception as e:
-                                                logger.error(f"Error auto-playing next queued item: {e}")
-                            
-                            # Priority 2: For state changes to stopped OR paused, check if we should auto-play next queued item
-                            # (movies often go to paused state when they end, not stopped)
-                            elif state_changed and current_state in ['stopped', 'paused'] and self.vlc.get_next_queued_item():
-                                if self._check_queue_auto_play_cooldown():
-                                    try:
-                                        logger.info(f"Track {current_state} - checking for next queued item to auto-play")
-                                        next_queued = self.vlc.get_next_queued_item()
-                                        logger.info(f"Next queued item found: {next_queued}")
-                                        
-                                        # Additional check: if paused, make sure we're actually at the end
-                                        should_auto_play = True
-                                        if current_state == 'paused':
-                                            try:
-                                                status = self.vlc.get_status()
-                                                if status is not None:
-                                                    time_elem = status.find('time')
-                                                    length_elem = status.find('length')
-                                                    if time_elem is not None and length_elem is not None:
-                                                        current_time = int(time_elem.text)
-                                                        total_length = int(length_elem.text)
-                                                        # Only auto-play if we're within 3 seconds of the end
-                                                        if total_length > 0 and (total_length - current_time) > 3:
-                                                            should_auto_play = False
-                                                            logger.debug(f"Paused but not at end: {current_time}/{total_length}s - not auto-playing")
-                                            except Exception as e:
-                                                logger.debug(f"Could not check time position: {e}")
-                                        
-                                        if should_auto_play:
-                                            play_result = self.vlc.play_next_queued_item()
-                                            logger.info(f"Auto-play result: {play_result}")
-                                            
-                                            if play_result.get("success"):
-                                                logger.info(f"Auto-played next queued item: {play_result.get('item_name', 'Unknown')}")
-                                                
-                                                # Optionally notify in Discord if notification channel is set
-                                                channel_id = getattr(Config, 'WATCH_ANNOUNCE_CHANNEL_ID', 0)
-                                                if channel_id:
-                                                    try:
-                                                        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
-                                                        if channel:
-                                                            await channel.send(f"Auto-playing next queued item: **{play_result.get('item_name', 'Unknown')}**")
-                                                    except Exception as e:
-                                                        logger.error(f"Failed to send auto-play notification: {e}")
-                                                # Update presence to show the newly playing queued item
-                                                try:
-                                                    await self._set_presence(play_result.get('item_name'), reason="auto-queue (end detection)")
-                                                except Exception:
-                                                    pass
-                                            else:
-                                                logger.warning(f"Auto-play failed: {play_result.get('error', 'Unknown error')}")
-                                            
-                                    except Exception as e:
-                                        logger.error(f"Error auto-playing next queued item: {e}")
-                            
-                            # Handle normal queue transitions for position changes (only if we didn't intercept)
-                            if position_changed and current_item_id:
-                                try:
-                                    # Check for queue transitions and shuffle restoration
-                                    queue_result = self.vlc.check_and_handle_queue_transition(current_item_id)
-                                    
-                                    # Log any queue transitions
-                                    if queue_result.get("transitions"):
-                                        for transition in queue_result["transitions"]:
-                                            if transition["action"] == "shuffle_restored":
-                                                logger.info(f"Queue system restored shuffle after item {transition['item_id']} finished")
-                                                
-                                                # Optionally notify in Discord if notification channel is set
-                                                channel_id = getattr(Config, 'WATCH_ANNOUNCE_CHANNEL_ID', 0)
-                                                if channel_id:
-                                                    try:
-                                                        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
-                                                        if channel:
-                                                            await channel.send("Queue finished, shuffle mode restored.")
-                                                    except Exception as e:
-                                                        logger.error(f"Failed to send shuffle restored notification: {e}")
-                                    
-                                except Exception as e:
-                                    logger.error(f"Error handling queue transition: {e}")
-                            
-                            # Detect when the last playing item finished (for shuffle restoration)
-                            if position_changed and self.last_known_playing_item:
-                                last_item_id = self.last_known_playing_item.get('id')
-                                if last_item_id and last_item_id != current_item_id:
-                                    # The last playing item is no longer playing - it finished
-                                    try:
-                                        self.vlc._handle_queued_item_finished(last_item_id)
-                                        # Ensure playback rate is reset to normal after an item finishes
-                                        try:
-                                            self.vlc.set_rate(1.0)
-                                            logger.debug("Playback rate reset to 1.0 after item finished")
-                                        except Exception as e:
-                                            logger.debug(f"Failed to reset playback rate after finish: {e}")
-                                    except Exception as e:
-                                        logger.error(f"Error handling finished item {last_item_id}: {e}")
-                        
-                        if state_changed or position_changed:
-                            # Get item name if available
-                            item_name = None
-                            if current_item is not None:
-                                item_name = current_item.get('name')
-                                
-                            # Log the change regardless of notification channel
-                            if state_changed:
-                                logger.info(f"VLC state changed to: {current_state}")
-                            elif position_changed:
-                                logger.info(f"Track changed to: {item_name or 'Unknown'} #{current_position if current_position else 'N/A'}")
-
-                            # Update presence on normal track transitions (no queue intervention)
-                            try:
-                                if position_changed and item_name:
-                                    await self._set_presence(item_name, reason="track change")
-                            except Exception:
-                                pass
-                            
-                            # Only send Discord message if a notification channel is configured
-                            channel_ids = Config.get_announce_channel_ids()
-                            now_ts = asyncio.get_event_loop().time()
-                            # If the bot itself initiated the change, suppress one-time auto announce and clear the flag
-                            if self._command_initiated_change:
-                                self.logger.debug("Auto announce suppressed: command-initiated change")
-                                self._command_initiated_change = False
-                                continue
-                            # Hard suppression: if we just sent a command-driven Now Playing, skip auto announce entirely (short window)
-                            if position_changed and (now_ts - self._last_command_announce_ts) < self._auto_suppress_seconds:
-                                self.logger.debug("Auto announce suppressed: recent command-driven Now Playing")
-                            # Note: do not suppress by ID/name to allow manual selection announcements
-                            elif channel_ids and (now_ts - self._last_command_announce_ts) > 1 and now_ts >= self._suppress_auto_announce_until:
-                                # Use unified announcer
-                                await self._announce_now_playing('monitor', current_item, current_position)
-                            elif not channel_ids:
-                                self.logger.debug("Track change announcement skipped: No announcement channels configured.")
-                            else:
-                                self.logger.debug("Track change announcement skipped: Debounced.")
-                    
-                    # Update last known state
-                    self.last_known_state = current_state
-                    self.last_known_position = current_position
-                    self.last_known_playing_item = current_item  # Track the current playing item
-                    
-                    # Priority 3: End-of-track detection - check if current track is about to end
-                    if current_state in ['playing', 'paused'] and self.vlc.get_next_queued_item():
-                        # This check is to see if we are near the end of the media.
-                        # If we are, we can be more aggressive about checking for the next item.
-                        # This helps in cases where the state change to 'stopped' is delayed.
-                        try:
-                            status = self.vlc.get_status()
-                            if status is not None:
-                                time_elem = status.find('time')
-                                length_elem = status.find('length')
-                                if time_elem is not None and length_elem is not None:
-                                    current_time = int(time_elem.text)
-                                    total_time = int(length_elem.text)
-                                    # If within 3 seconds of the end, we might want to act.
-                                    if total_time > 0 and (total_time - current_time) < 3:
-                                        if self._check_queue_auto_play_cooldown():
-                                            logger.info("Track is near the end, preparing to auto-play next queued item.")
-                                            # This path is tricky because we might preemptively switch.
-                                            # For now, we just log. The main 'stopped'/'paused' handler will do the work.
-                        except Exception as e:
-                            logger.debug(f"Error in end-of-track detection: {e}")
-
-                    # If VLC pauses at the very end of a track (common behavior) and there's no queued item,
-                    # clear presence to avoid showing a stale title
-                    try:
-                        if current_state == 'paused' and not self.vlc.get_next_queued_item():
-                            status = self.vlc.get_status()
-                            if status is not None:
-                                time_elem = status.find('time')
-                                length_elem = status.find('length')
-                                if time_elem is not None and length_elem is not None:
-                                    current_time = int(time_elem.text)
-                                    total_length = int(length_elem.text)
-                                    if total_length > 0 and (total_length - current_time) <= 3:
-                                        # Near end while paused and nothing queued -> clear presence
-                                        await self._set_presence(None, reason="paused at end")
-                                        logger.info("Cleared presence: VLC paused at track end and no queued items")
-                    except Exception as e:
-                        logger.debug(f"Paused-end presence clear check failed: {e}")
-                    
-                    # Enhanced periodic check: If we have queued items, ensure they get played
-                    next_queued = self.vlc.get_next_queued_item()
-                    if next_queued:
-                        # Case 1: VLC is stopped and we have queued items
-                        if current_state == 'stopped':
-                            # Reset playback rate when VLC has stopped (file finished)
-                            try:
-                                self.vlc.set_rate(1.0)
-                            except Exception:
-                                pass
-                            if self._check_queue_auto_play_cooldown():
-                                try:
-                                    play_result = self.vlc.play_next_queued_item()
-                                    logger.info(f"Auto-play result from stopped state: {play_result}")
-                                    if play_result.get("success"):
-                                        logger.info(f"Auto-played next queued item: {play_result.get('item_name', 'Unknown')}")
-                                        # Optionally notify
-                                        channel_id = getattr(Config, 'WATCH_ANNOUNCE_CHANNEL_ID', 0)
-                                        if channel_id:
-                                            try:
-                                                channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
-                                                if channel:
-                                                    await channel.send(f"Auto-playing next queued item: **{play_result.get('item_name', 'Unknown')}**")
-                                            except Exception as e:
-                                                logger.error(f"Failed to send auto-play notification: {e}")
-                                        # Update presence
-                                        try:
-                                            await self._set_presence(play_result.get('item_name'), reason="auto-queue (stopped)")
-                                        except Exception:
-                                            pass
-                                    else:
-                                        logger.warning(f"Auto-play from stopped state failed: {play_result.get('error', 'Unknown error')}")
-                                except Exception as e:
-                                    logger.error(f"Error auto-playing from stopped state: {e}")
-                        
-                        # Case 2: VLC is playing but wrong item (queue was bypassed)
-                        elif current_state == 'playing' and current_item:
-                            current_item_id = current_item.get('id')
-                            if current_item_id != next_queued['item_id']:
-                                if self._check_queue_auto_play_cooldown():
-                                    try:
-                                        logger.info(f"Periodic check: Wrong item playing ({current_item_id}), should be queued item ({next_queued['item_id']}) - correcting")
-                                        play_result = self.vlc.play_next_queued_item()
-                                        
-                                        if play_result.get("success"):
-                                            logger.info(f"Periodic correction successful: {play_result.get('item_name', 'Unknown')}")
-                                            try:
-                                                await self._set_presence(play_result.get('item_name'), reason="periodic correction (wrong item)")
-                                            except Exception:
-                                                pass
-                                    except Exception as e:
-                                        logger.error(f"Error in periodic queue correction: {e}")
-                    
-            except Exception as e:
-                logger.error(f"Error in VLC monitoring task: {e}")
-            
-            # Wait before next check
-            await asyncio.sleep(0.5)  # Check every half second for more responsive queue handling
+                    logger.info("Periodic check: Wrong item playing (%s), should be queued item (%s) - correcting", current_item_id, next_queued['item_id'])
+                    play_result = await self._vlc_call(self.vlc.play_next_queued_item)
+
+                    if play_result.get("success"):
+                        logger.info("Periodic correction successful: %s", play_result.get('item_name', 'Unknown'))
+                        await self._set_presence(play_result.get('item_name'), reason="periodic correction (wrong item)")
+                except Exception as e:
+                    logger.error("Error in periodic queue correction: %s", e)
 
     @commands.command(name='speedstatus', aliases=['spdstatus', 'sr'])
     @commands.has_any_role(*Config.ALLOWED_ROLES)
@@ -999,7 +1382,7 @@ class PlaybackCommands(commands.Cog):
         Usage examples are shown with the configured prefix in `!!controls`.
         """
         try:
-            status = self.vlc.get_status()
+            status = await self._vlc_call(self.vlc.get_status_cached)
             if not status:
                 await ctx.send('Error: Could not access VLC status')
                 return
@@ -1039,7 +1422,7 @@ class PlaybackCommands(commands.Cog):
     async def subtitle_next(self, ctx):
         """Cycle to the next subtitle track in VLC (if supported)."""
         try:
-            ok = self.vlc.subtitle_next()
+            ok = await self._vlc_call(self.vlc.subtitle_next)
             if ok:
                 embed = discord.Embed(
                     title="💬 Subtitles",
@@ -1066,7 +1449,7 @@ class PlaybackCommands(commands.Cog):
     async def subtitle_prev(self, ctx):
         """Cycle to the previous subtitle track in VLC (if supported)."""
         try:
-            ok = self.vlc.subtitle_prev()
+            ok = await self._vlc_call(self.vlc.subtitle_prev)
             if ok:
                 embed = discord.Embed(
                     title="💬 Subtitles",
@@ -1098,7 +1481,7 @@ class PlaybackCommands(commands.Cog):
             except Exception:
                 pass
             
-            tracks = self.vlc.get_subtitle_tracks()
+            tracks = await self._vlc_call(self.vlc.get_subtitle_tracks)
             if tracks is None:
                 await ctx.send("Couldn't retrieve subtitle tracks from VLC.")
                 return
@@ -1136,10 +1519,7 @@ class PlaybackCommands(commands.Cog):
                 color=discord.Color.blue()
             )
             # Show current selection explicitly
-            try:
-                selected_track = next((tr for tr in tracks if tr.get('selected')), None)
-            except Exception:
-                selected_track = None
+            selected_track = next((tr for tr in tracks if tr.get('selected')), None)
             if selected_track:
                 cur_idx = selected_track.get('index') or selected_track.get('id')
                 cur_name = selected_track.get('name') or (f"Track {cur_idx}" if cur_idx is not None else "Track")
@@ -1174,21 +1554,23 @@ class PlaybackCommands(commands.Cog):
                 await ctx.send(f"Usage: {format_cmd_inline('sub_set <number|off>')}")
                 return
             # Fetch tracks to support index-based addressing
-            tracks = self.vlc.get_subtitle_tracks() or []
-            logger.info(f"sub_set: User requested '{track_id}', found {len(tracks)} tracks")
+            tracks = await self._vlc_call(self.vlc.get_subtitle_tracks) or []
+            logger.debug("sub_set: User requested '%s', found %d tracks", track_id, len(tracks))
             
             # Log all tracks for debugging
-            for i, tr in enumerate(tracks, start=1):
-                logger.debug(f"  Track {i}: id={tr.get('id')}, index={tr.get('index')}, stream_index={tr.get('stream_index')}, name={tr.get('name')}, selected={tr.get('selected')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, tr in enumerate(tracks, start=1):
+                    logger.debug("  Track %d: id=%s, index=%s, stream_index=%s, name=%s, selected=%s",
+                                 i, tr.get('id'), tr.get('index'), tr.get('stream_index'), tr.get('name'), tr.get('selected'))
 
             # Handle disable synonyms
             tokens_off = {"off", "none", "disable", "disabled"}
             if track_id.lower() in tokens_off:
-                logger.info(f"sub_set: Disabling subtitles")
+                logger.info("sub_set: Disabling subtitles")
                 # Try -1 first, fallback to 0 for older VLC versions
-                ok = self.vlc.set_subtitle_track(-1)
+                ok = await self._vlc_call(self.vlc.set_subtitle_track, -1)
                 if not ok:
-                    ok = self.vlc.set_subtitle_track(0)
+                    ok = await self._vlc_call(self.vlc.set_subtitle_track, 0)
                 if not ok:
                     await ctx.send("Failed to disable subtitles (tried -1 and 0).")
                     return
@@ -1213,59 +1595,50 @@ class PlaybackCommands(commands.Cog):
                 await ctx.send(f"Position out of range. There are {len(tracks)} subtitle tracks. Use {format_cmd_inline('sub_list')} to see them.")
                 return
             
-            logger.info(f"sub_set: Looking for track at position {pos_index}")
-            
-            # Find track by GUI order (index field)
+            # Find track by GUI order (index field); the first track wins on duplicate indexes
+            by_index = {}
+            for tr in tracks:
+                by_index.setdefault(tr.get('index'), tr)
             tid = None
             stream_idx = None
-            selected_track = None
-            for tr in tracks:
-                if tr.get('index') == pos_index:
-                    tid = tr.get('id')
-                    stream_idx = tr.get('stream_index')
-                    selected_track = tr
-                    logger.info(f"sub_set: Found track by index: id={tid}, stream_index={stream_idx}, name={tr.get('name')}")
-                    break
+            selected_track = by_index.get(pos_index)
+            if selected_track is not None:
+                tid = selected_track.get('id')
+                stream_idx = selected_track.get('stream_index')
+                logger.debug("sub_set: Found track by index: id=%s, stream_index=%s", tid, stream_idx)
             
             # Fallback to list order if no index mapping available
             if tid is None:
                 selected_track = tracks[pos_index - 1]
                 tid = selected_track.get('id')
                 stream_idx = selected_track.get('stream_index')
-                logger.info(f"sub_set: Using list order fallback: id={tid}, stream_index={stream_idx}, name={selected_track.get('name')}")
+                logger.debug("sub_set: Using list order fallback: id=%s, stream_index=%s", tid, stream_idx)
             
-            # Try setting subtitle track - prefer stream_index over track ID
+            # Try setting subtitle track - prefer stream_index over track ID, then fall back to the
+            # list position for VLC versions that support it. Each entry is
+            # (label, value sent to VLC, value remembered as the selected subtitle)
             # VLC HTTP API typically uses stream index (0, 1, 2...) not track IDs
-            ok = False
+            attempts = []
             if stream_idx is not None:
-                logger.info(f"sub_set: Attempting to set subtitle by stream_index={stream_idx}")
-                ok = self.vlc.set_subtitle_track(stream_idx)
-                if ok:
-                    logger.info(f"sub_set: Successfully set by stream_index={stream_idx}")
-                    # Track the selected subtitle
-                    self.selected_subtitle_stream_index = stream_idx
-            
-            if not ok and tid is not None:
-                logger.info(f"sub_set: Attempting to set subtitle by track id={tid}")
-                ok = self.vlc.set_subtitle_track(tid)
-                if ok:
-                    logger.info(f"sub_set: Successfully set by track id={tid}")
-                    self.selected_subtitle_stream_index = stream_idx if stream_idx else tid
-            
-            if not ok:
-                # Try direct position fallback for VLC versions that support it
-                logger.warning(f"sub_set: Failed to set by stream_index and id, trying position-based fallback")
-                ok = self.vlc.set_subtitle_track(pos_index - 1)
+                attempts.append(("stream_index", stream_idx, stream_idx))
+            if tid is not None:
+                attempts.append(("track id", tid, stream_idx if stream_idx else tid))
+            attempts.append(("position", pos_index - 1, stream_idx if stream_idx else (pos_index - 1)))
+            attempts.append(("position", pos_index, stream_idx if stream_idx else pos_index))
+            ok = False
+            for label, value, remembered in attempts:
+                ok = await self._vlc_call(self.vlc.set_subtitle_track, value)
                 if ok:
-                    logger.info(f"sub_set: Successfully set by position {pos_index - 1}")
-                    self.selected_subtitle_stream_index = stream_idx if stream_idx else (pos_index - 1)
-                else:
-                    ok = self.vlc.set_subtitle_track(pos_index)
-                    if ok:
-                        logger.info(f"sub_set: Successfully set by position {pos_index}")
-                        self.selected_subtitle_stream_index = stream_idx if stream_idx else pos_index
+                    # One summary line per command instead of one per lookup/attempt
+                    logger.info("sub_set: Set position %d (%s) by %s=%s",
+                                pos_index, selected_track.get('name'), label, value)
+                    # Track the selected subtitle (VLC doesn't expose it)
+                    self.selected_subtitle_stream_index = remembered
+                    break
                 
             if not ok:
+                logger.warning("sub_set: Could not set position %d after trying %s",
+                               pos_index, ", ".join(f"{label}={value}" for label, value, _ in attempts))
                 embed = discord.Embed(
                     title="💬 Subtitles",
                     description=f"Failed to set subtitle track {pos_index}. Use {format_cmd_inline('sub_list')} to verify available tracks.",
@@ -1274,37 +1647,21 @@ class PlaybackCommands(commands.Cog):
                 await ctx.send(embed=embed)
                 return
 
-            # Confirm new selection by re-reading tracks
-            tracks2 = self.vlc.get_subtitle_tracks() or []
-            selected_name = None
-            selected_pos = None
-            # Use the track we attempted to set as a fallback if VLC doesn't mark selection
-            fallback_name = selected_track.get('name') if selected_track else None
-            fallback_pos = selected_track.get('index') if selected_track else pos_index
-            for tr in tracks2:
-                if tr.get('selected'):
-                    selected_name = tr.get('name')
-                    selected_pos = tr.get('index')
-                    logger.info(f"sub_set: Confirmed selection - pos={selected_pos}, name={selected_name}")
-                    break
-
-            if selected_pos is None:
-                # Show the intended track as a helpful hint even if VLC didn't mark it selected yet
-                desc = f"Set subtitle to {fallback_pos}: {fallback_name or 'Unknown'}"
-            else:
-                desc = f"Selected subtitle {selected_pos}: {selected_name or 'Unknown'}"
-
+            # VLC's HTTP API never reports the selected subtitle (get_subtitle_tracks leaves
+            # 'selected' False), so re-reading the tracks cannot confirm anything: report the
+            # track that VLC acknowledged instead of spending another round trip
+            confirmed_name = selected_track.get('name') if selected_track else None
+            confirmed_pos = selected_track.get('index') if selected_track else pos_index
             embed = discord.Embed(
                 title="💬 Subtitles",
-                description=desc,
+                description=f"Set subtitle to {confirmed_pos}: {confirmed_name or 'Unknown'}",
                 color=discord.Color.green()
             )
-            if tracks2:
-                embed.add_field(
-                    name="Tip",
-                    value=f"Use {format_cmd_inline('sub_set off')} to disable subtitles.",
-                    inline=False
-                )
+            embed.add_field(
+                name="Tip",
+                value=f"Use {format_cmd_inline('sub_set off')} to disable subtitles.",
+                inline=False
+            )
             await ctx.send(embed=embed)
         except Exception as e:
             logger.error(f"subtitle_set error: {e}")
@@ -1314,23 +1671,24 @@ class PlaybackCommands(commands.Cog):
     @commands.has_any_role(*Config.ALLOWED_ROLES)
     async def status(self, ctx):
         """Show current VLC status and what's playing"""
-        embed = await self.get_status_embed()
+        embed = await self.get_status_embed(include_library_size=True)
         if embed:
             await ctx.send(embed=embed)
         else:
             await ctx.send("Could not retrieve VLC status.")
 
-    async def get_status_embed(self):
-        """Generate a rich embed for the current VLC status."""
+    async def get_status_embed(self, include_library_size: bool = False):
+        """Generate a rich embed for the current VLC status.
+
+        Args:
+            include_library_size: Also show the watch folders' cached total media size
+        """
         try:
-            status = self.vlc.get_status()
+            status, (position, current_item) = await self._fetch_status_and_current()
             if not status:
                 return None
 
-            state = status.find('state').text
-            
-            playlist = self.vlc.get_playlist()
-            position, current_item = self._find_current_position(playlist)
+            state = status.findtext('state')
             
             item_name = None
             playlist_name = None
@@ -1347,149 +1705,47 @@ class PlaybackCommands(commands.Cog):
                 try:
                     info_root = status.find('information')
                     if info_root is not None:
-                        for category in info_root.findall('category'):
-                            for info in category.findall('info'):
-                                if info.get('name') == 'filename' and info.text:
-                                    item_name = info.text
-                                    break
-                            if item_name:
-                                break
+                        info = info_root.find(FILENAME_XPATH)
+                        if info is not None and info.text:
+                            item_name = info.text
                 except Exception:
                     item_name = None
 
-            # Secondary fallback: scan playlist leaf nodes for current item.
-            if not item_name and playlist is not None:
-                try:
-                    for leaf in playlist.findall('.//leaf'):
-                        if leaf.get('current'):
-                            item_name = leaf.get('name')
-                            if not playlist_name:
-                                playlist_name = item_name
-                            break
-                except Exception:
-                    pass
-
             # Prefer playlist name for parsing when it contains explicit TV episode markers.
             parse_name = metadata_name or item_name
-            try:
-                if playlist_name and re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", playlist_name):
-                    parse_name = playlist_name
-            except Exception:
-                parse_name = metadata_name or item_name or playlist_name
+            if playlist_name and re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", playlist_name):
+                parse_name = playlist_name
 
-            # Try to get TMDB metadata
-            tmdb_embed = None
+            # Try to get TMDB metadata (off the event loop)
+            lookup = (None, None, False, False, None)
             if item_name or metadata_name:
-                edition_tag = MediaUtils.extract_edition_tag(parse_name or metadata_name or item_name)
-                is_movie_embed = False
-                episode_label = None
-                clean_title, year = MediaUtils.parse_movie_filename(parse_name or metadata_name or item_name)
-                tv_title, tv_season, tv_episode, tv_year = MediaUtils.parse_tv_filename(parse_name or metadata_name or item_name)
-                if tv_season and tv_episode:
-                    episode_label = f"S{int(tv_season):02d}E{int(tv_episode):02d}"
-                
-                # Detect if there's an explicit episode marker
-                has_explicit_episode = bool(tv_episode) or bool(re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", parse_name or metadata_name or item_name or ''))
-                
-                if has_explicit_episode and tv_title:
-                    # Has explicit episode: prefer TV
-                    tmdb_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
-                else:
-                    # No explicit episode: try both and compare scores
-                    movie_embed = None
-                    tv_embed = None
-                    movie_score = 0.0
-                    tv_score = 0.0
-                    
-                    if clean_title:
-                        movie_embed = self.tmdb.get_movie_metadata(clean_title, year, file_path=item_uri)
-                        movie_score = getattr(self.tmdb, '_last_match_score', 0.0)
-                    
-                    if tv_title:
-                        tv_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
-                        tv_score = getattr(self.tmdb, '_last_match_score', 0.0)
-                    
-                    # Choose the better match
-                    if tv_embed and movie_embed:
-                        tmdb_embed = tv_embed if tv_score > movie_score else movie_embed
-                        is_movie_embed = (tmdb_embed == movie_embed)
-                    elif tv_embed:
-                        tmdb_embed = tv_embed
-                    elif movie_embed:
-                        tmdb_embed = movie_embed
-                        is_movie_embed = True
-                    else:
-                        # Fallback: try generic TV lookup
-                        if clean_title:
-                            tmdb_embed = self.tmdb.get_tv_metadata(clean_title)
-
-            if tmdb_embed:
-                # Use the rich embed from TMDB
-                final_embed = tmdb_embed
-                final_embed.title = f"Now Playing: {final_embed.title}"
-                if edition_tag and is_movie_embed:
-                    try:
-                        final_embed.add_field(name="Edition", value=edition_tag, inline=True)
-                    except Exception:
-                        pass
-                if episode_label and not is_movie_embed:
-                    try:
-                        final_embed.add_field(name="Episode", value=episode_label, inline=True)
-                    except Exception:
-                        pass
-            else:
-                # Create a basic embed
-                title = "VLC Status"
-                if metadata_name or item_name:
-                    title = f"Now Playing: {metadata_name or item_name}"
-                
-                final_embed = discord.Embed(title=title, color=discord.Color.blue())
-                if item_name and edition_tag and not has_explicit_episode:
-                    try:
-                        final_embed.add_field(name="Edition", value=edition_tag, inline=True)
-                    except Exception:
-                        pass
-                if episode_label:
-                    try:
-                        final_embed.add_field(name="Episode", value=episode_label, inline=True)
-                    except Exception:
-                        pass
+                lookup = await self._lookup_metadata_async(parse_name or metadata_name or item_name, item_uri)
+            final_embed = self._build_now_playing_embed(
+                metadata_name or item_name, lookup, position if item_name else None
+            )
 
             # Add playback state and position
-            state_emoji_map = {
-                'playing': '▶️',
-                'paused': '⏸️',
-                'stopped': '⏹️'
-            }
-            state_text = f"{state_emoji_map.get(state, '')} {state.capitalize()}".strip()
+            state_text = f"{STATE_EMOJI.get(state, '')} {STATE_DISPLAY.get(state) or state.capitalize()}".strip()
             
-            if position and item_name:
-                final_embed.add_field(name="Playlist", value=f"#{position}", inline=True)
-
             final_embed.add_field(name="State", value=state_text, inline=True)
+            if include_library_size:
+                size_text = self.watch_service.get_total_media_size_display() if self.watch_service else human_size(0)
+                final_embed.add_field(name="Media Library Size", value=size_text, inline=True)
 
             # Add time/duration
-            time_elem = status.find('time')
-            length_elem = status.find('length')
-            if time_elem is not None and length_elem is not None:
-                try:
-                    current_time = int(time_elem.text)
-                    total_time = int(length_elem.text)
-                    if total_time > 0:
-                        progress = f"{MediaUtils.format_time(current_time)} / {MediaUtils.format_time(total_time)}"
-                        final_embed.add_field(name="Progress", value=progress, inline=False)
-                except (ValueError, TypeError):
-                    pass # Ignore if time/length are not valid numbers
+            current_time, total_time = _extract_time(status)
+            if current_time is not None and total_time > 0:
+                progress = f"{MediaUtils.format_time(current_time)} / {MediaUtils.format_time(total_time)}"
+                final_embed.add_field(name="Progress", value=progress, inline=False)
 
             # Add footer
-            try:
-                if Config.KOFI_URL:
-                    final_embed.add_field(name="Support kutsaratinidor by supporting CtrlVee", value=f"☕ <{Config.KOFI_URL}>", inline=False)
-            except Exception:
-                pass
+            if self._kofi_field:
+                final_embed.add_field(**self._kofi_field)
 
-            if not final_embed.thumbnail and hasattr(self.bot.user, 'display_avatar'):
-                final_embed.set_thumbnail(url=self.bot.user.display_avatar.url)
+            if not final_embed.thumbnail:
+                avatar_url = self._get_bot_avatar_url()
+                if avatar_url:
+                    final_embed.set_thumbnail(url=avatar_url)
 
             return final_embed
 
@@ -1504,28 +1760,23 @@ class PlaybackCommands(commands.Cog):
         if not await self._check_cooldown(ctx):
             return
 
-        status = self.vlc.get_status()
+        status = await self._vlc_call(self.vlc.get_status_cached)
         if not status:
             await ctx.send('Error: Could not access VLC')
             return
 
-        state = status.find('state').text
+        state = status.findtext('state')
         if state == 'playing':
             return
 
-        if self.vlc.play():
+        if await self._vlc_call(self.vlc.play):
             await asyncio.sleep(0.5)
-            new_status = self.vlc.get_status()
-            if new_status and new_status.find('state').text == 'playing':
+            new_status = await self._vlc_call(self.vlc.get_status)
+            if new_status and new_status.findtext('state') == 'playing':
                 guild_id = str(ctx.guild.id) if ctx.guild else 'dm'
-                self.last_state_change[guild_id] = asyncio.get_event_loop().time()
+                self.last_state_change[guild_id] = self._now()
                 logger.info("Playback started/resumed")
-                embed = discord.Embed(
-                    title="▶️ Playback started",
-                    description="Playback started/resumed",
-                    color=discord.Color.green()
-                )
-                await ctx.send(embed=embed)
+                await ctx.send(embed=self._static_embeds['play_started'])
 
     @commands.command(name='pause')
     @commands.has_any_role(*Config.ALLOWED_ROLES)
@@ -1534,21 +1785,21 @@ class PlaybackCommands(commands.Cog):
         if not await self._check_cooldown(ctx):
             return
 
-        status = self.vlc.get_status()
+        status = await self._vlc_call(self.vlc.get_status_cached)
         if not status:
             await ctx.send('Error: Could not access VLC')
             return
 
-        state = status.find('state').text
+        state = status.findtext('state')
         if state != 'playing':
             return
 
-        if self.vlc.pause():
+        if await self._vlc_call(self.vlc.pause):
             await asyncio.sleep(0.5)
-            new_status = self.vlc.get_status()
-            if new_status and new_status.find('state').text == 'paused':
+            new_status = await self._vlc_call(self.vlc.get_status)
+            if new_status and new_status.findtext('state') == 'paused':
                 guild_id = str(ctx.guild.id) if ctx.guild else 'dm'
-                self.last_state_change[guild_id] = asyncio.get_event_loop().time()
+                self.last_state_change[guild_id] = self._now()
                 logger.info("Playback paused")
                 await ctx.send('Playback paused')
 
@@ -1556,28 +1807,18 @@ class PlaybackCommands(commands.Cog):
     @commands.has_any_role(*Config.ALLOWED_ROLES)
     async def stop(self, ctx):
         """Stop playback"""
-        if self.vlc.stop():
+        if await self._vlc_call(self.vlc.stop):
             logger.info("Playback stopped")
-            embed = discord.Embed(
-                title="⏹️ Playback stopped",
-                description="Playback has been stopped",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._static_embeds['stop_ok'])
         else:
             logger.error("Failed to stop playback")
-            embed = discord.Embed(
-                title="⏹️ Playback stop failed",
-                description="Error: Could not stop playback",
-                color=discord.Color.dark_red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._static_embeds['stop_failed'])
 
     @commands.command(name='restart')
     @commands.has_any_role(*Config.ALLOWED_ROLES)
     async def restart(self, ctx):
         """Restart current file from the beginning"""
-        if self.vlc.seek("0"):
+        if await self._vlc_call(self.vlc.seek, "0"):
             logger.info("Restarted current file from beginning")
             await ctx.send('Restarted current file from the beginning')
         else:
@@ -1589,15 +1830,10 @@ class PlaybackCommands(commands.Cog):
     async def rewind(self, ctx, seconds: int = 10):
         """Rewind playback by specified number of seconds"""
         if seconds <= 0:
-            embed = discord.Embed(
-                title="⏪ Rewind failed",
-                description="Please specify a positive number of seconds",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._static_embeds['rewind_invalid'])
             return
 
-        if self.vlc.seek(f"-{seconds}"):
+        if await self._vlc_call(self.vlc.seek, f"-{seconds}"):
             embed = discord.Embed(
                 title="⏪ Rewound",
                 description=f"Rewound {seconds} seconds",
@@ -1605,27 +1841,17 @@ class PlaybackCommands(commands.Cog):
             )
             await ctx.send(embed=embed)
         else:
-            embed = discord.Embed(
-                title="⏪ Rewind failed",
-                description="Error: Could not rewind",
-                color=discord.Color.dark_red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._static_embeds['rewind_failed'])
  
     @commands.command(name='forward', aliases=['ff','skip'])
     @commands.has_any_role(*Config.ALLOWED_ROLES)
     async def forward(self, ctx, seconds: int = 10):
         """Fast forward playback by specified number of seconds"""
         if seconds <= 0:
-            embed = discord.Embed(
-                title="⏩ Fast-forward failed",
-                description="Please specify a positive number of seconds",
-                color=discord.Color.red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._static_embeds['forward_invalid'])
             return
 
-        if self.vlc.seek(f"+{seconds}"):
+        if await self._vlc_call(self.vlc.seek, f"+{seconds}"):
             embed = discord.Embed(
                 title="⏩ Fast-forwarded",
                 description=f"Fast forwarded {seconds} seconds",
@@ -1633,12 +1859,7 @@ class PlaybackCommands(commands.Cog):
             )
             await ctx.send(embed=embed)
         else:
-            embed = discord.Embed(
-                title="⏩ Fast-forward failed",
-                description="Error: Could not fast forward",
-                color=discord.Color.dark_red()
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=self._static_embeds['forward_failed'])
     
     @commands.command(name='play_num')
     @commands.has_any_role(*Config.ALLOWED_ROLES)
@@ -1649,12 +1870,11 @@ class PlaybackCommands(commands.Cog):
                 await ctx.send('Please provide a number greater than 0')
                 return
 
-            playlist = self.vlc.get_playlist()
+            playlist, items = await self._vlc_call(self._get_playlist_cached)
             if not playlist:
                 await ctx.send('Could not access VLC playlist')
                 return
 
-            items = playlist.findall('.//leaf')
             if not items:
                 await ctx.send('Playlist is empty')
                 return
@@ -1666,35 +1886,44 @@ class PlaybackCommands(commands.Cog):
             item = items[number - 1]
             item_id = item.get('id')
 
-            if self.vlc.play_item(item_id):
+            if await self._vlc_call(self.vlc.play_item, item_id):
+                self._invalidate_playlist_cache()
+                # Start the TMDB lookup now so it overlaps with waiting for VLC to start playing
+                metadata_task = None
+                try:
+                    metadata_name = self._choose_metadata_source_name(item.get('name'), item.get('uri'))
+                    if metadata_name:
+                        metadata_task = asyncio.create_task(
+                            self._lookup_metadata_async(metadata_name, item.get('uri'))
+                        )
+                except Exception as e:
+                    logger.debug("Could not prefetch metadata for item #%s: %s", number, e)
                 logger.info(f"Loading playlist item #{number}")
-                await ctx.send(f'Loading item #{number}...')
-                await asyncio.sleep(3)  # Give VLC time to load and start playing the file
-                
-                status = self.vlc.get_status()
+                msg = await ctx.send(embed=discord.Embed(title=f"Loading item #{number}…", color=discord.Color.blue()))
+                # Wait (up to 3s) for VLC to load and start playing the file
+                status = await self._wait_for_state('playing', timeout=3.0, item_id=item_id)
                 if not status:
-                    await ctx.send(f'Started playing item #{number}')
+                    await msg.edit(embed=discord.Embed(title=f"Started playing item #{number}", color=discord.Color.blue()))
                     return
                     
-                state = status.find('state').text
+                state = status.findtext('state')
                 if state != 'playing':
                     # If not playing yet, try to start playback
-                    self.vlc.play()
-                    await asyncio.sleep(2)
-                    status = self.vlc.get_status()
+                    await self._vlc_call(self.vlc.play)
+                    status = await self._wait_for_state('playing', timeout=2.0)
                     if status:
-                        state = status.find('state').text
+                        state = status.findtext('state')
                         if state != 'playing':
                             # One more try
-                            self.vlc.play()
+                            await self._vlc_call(self.vlc.play)
                             await asyncio.sleep(1)
                 
                 # Announce now playing via unified announcer
-                await self._announce_now_playing('command', item, number)
+                await self._announce_now_playing('command', item, number, edit_msg=msg, metadata_task=metadata_task)
                 
                 # Verify it's actually playing
-                status = self.vlc.get_status()
-                if status and status.find('state').text != 'playing':
+                status = await self._vlc_call(self.vlc.get_status)
+                if status and status.findtext('state') != 'playing':
                     await ctx.send(f"Warning: VLC might not be playing. Try using {format_cmd_inline('play')} if playback doesn't start.")
             else:
                 await ctx.send('Error: Could not start playback')
@@ -1709,10 +1938,10 @@ class PlaybackCommands(commands.Cog):
             return
         
         # First check if there are any queued items to play
-        next_queued = self.vlc.get_next_queued_item()
+        next_queued = await self._vlc_call(self.vlc.get_next_queued_item)
         if next_queued:
             logger.info(f"Playing next queued item: {next_queued['item_name']}")
-            result = self.vlc.play_next_queued_item()
+            result = await self._vlc_call(self.vlc.play_next_queued_item)
             
             if result.get("success"):
                 embed = discord.Embed(
@@ -1727,50 +1956,37 @@ class PlaybackCommands(commands.Cog):
                 )
                 await ctx.send(embed=embed)
                 # Update bot presence to the queued item's name (if enabled)
-                try:
-                    await self._set_presence(result.get('item_name'), reason="next (queued)")
-                except Exception:
-                    pass
+                await self._set_presence(result.get('item_name'), reason="next (queued)")
                 return
             else:
                 await ctx.send(f"Error playing queued item: {result.get('error', 'Unknown error')}")
                 # Fall through to normal next behavior
         
         # If no queued items or queue failed, use normal next behavior
-        if self.vlc.next():
+        before = await self._vlc_call(self.vlc.get_status_cached)
+        previous_id = before.findtext('currentplid') if before is not None else None
+        if await self._vlc_call(self.vlc.next):
+            self._invalidate_playlist_cache()
             logger.info("Loading next track")
-            await ctx.send('Loading next track...')
+            msg = await ctx.send(embed=self._static_embeds['next_loading'])
             try:
                 # Mark that this change was initiated by our command to suppress one auto announce
                 self._command_initiated_change = True
             except Exception:
                 pass
-            await asyncio.sleep(3)  # Give VLC time to load and start playing the file
-            
-            status = self.vlc.get_status()
+            # Wait (up to 5s) for VLC to move off the old item and start playing the new one
+            status = await self._wait_for_state('playing', timeout=5.0, not_item_id=previous_id or '')
             if not status:
-                await ctx.send('Skipped to next track')
+                await msg.edit(embed=self._static_embeds['next_done'])
                 return
-                
-            state = status.find('state').text
-            if state != 'playing':
-                # If not playing yet, wait a bit longer
-                await asyncio.sleep(2)
-                status = self.vlc.get_status()
             
-            playlist = self.vlc.get_playlist()
-            if status and playlist:
-                position, current_item = self._find_current_position(playlist)
-                if current_item is not None:
-                    await self._announce_now_playing('command', current_item, position)
-                    try:
-                        self._suppress_auto_announce_until = asyncio.get_event_loop().time() + 5.0
-                    except Exception:
-                        pass
-                else:
-                    await ctx.send('Skipped to next track')
+            # Stream playlist.xml only up to the new current leaf instead of building the full tree
+            position, current_item = await self._vlc_call(self.vlc.get_playlist_current)
+            if current_item is not None:
+                await self._announce_now_playing('command', current_item, position, edit_msg=msg)
+                self._suppress_auto_announce_until = self._now() + 5.0
             else:
-                await ctx.send('Skipped to next track')
+                await msg.edit(embed=self._static_embeds['next_done'])
         else:
             await ctx.send('Error: Could not skip to next track')
             
@@ -1781,103 +1997,109 @@ class PlaybackCommands(commands.Cog):
         if not await self._check_cooldown(ctx):
             return
             
-        if self.vlc.previous():
+        before = await self._vlc_call(self.vlc.get_status_cached)
+        previous_id = before.findtext('currentplid') if before is not None else None
+        if await self._vlc_call(self.vlc.previous):
+            self._invalidate_playlist_cache()
             logger.info("Loading previous track")
-            await ctx.send('Loading previous track...')
-            try:
-                self._command_initiated_change = True
-            except Exception:
-                pass
-            await asyncio.sleep(3)  # Give VLC time to load and start playing the file
-            
-            status = self.vlc.get_status()
+            msg = await ctx.send(embed=self._static_embeds['previous_loading'])
+            self._command_initiated_change = True
+            # Wait (up to 5s) for VLC to move off the old item and start playing the new one
+            status = await self._wait_for_state('playing', timeout=5.0, not_item_id=previous_id or '')
             if not status:
-                await ctx.send('Jumped to previous track')
+                await msg.edit(embed=self._static_embeds['previous_done'])
                 return
-                
-            state = status.find('state').text
-            if state != 'playing':
-                # If not playing yet, wait a bit longer
-                await asyncio.sleep(2)
-                status = self.vlc.get_status()
             
-            playlist = self.vlc.get_playlist()
-            if status and playlist:
-                # Find current item
-                current_item = None
-                for item in playlist.findall('.//leaf'):
-                    if item.get('current'):
-                        current_item = item
-                        break
-                        
-                if current_item is not None:
-                    # Find the position number of the current item
-                    position = None
-                    for i, item in enumerate(playlist.findall('.//leaf')):
-                        if item.get('id') == current_item.get('id'):
-                            position = i + 1  # Convert to 1-based index
-                            break
-                    await self._announce_now_playing('command', current_item, position)
-                    try:
-                        self._suppress_auto_announce_until = asyncio.get_event_loop().time() + 5.0
-                    except Exception:
-                        pass
-                else:
-                    await ctx.send('Jumped to previous track')
+            # Stream playlist.xml only up to the new current leaf instead of building the full tree
+            position, current_item = await self._vlc_call(self.vlc.get_playlist_current)
+            if current_item is not None:
+                await self._announce_now_playing('command', current_item, position, edit_msg=msg)
+                self._suppress_auto_announce_until = self._now() + 5.0
             else:
-                await ctx.send('Jumped to previous track')
+                await msg.edit(embed=self._static_embeds['previous_done'])
         else:
             await ctx.send('Error: Could not jump to previous track')
 
             
-    async def _check_vlc_connection(self, ctx):
-        """Check if VLC is accessible and send error message if not
-        
+    async def _wait_for_state(self, target: str = 'playing', timeout: float = 3.0, interval: float = 0.2,
+                              item_id: str | None = None, not_item_id: str | None = None):
+        """Poll VLC until it reaches a state (and optionally a playlist item), or time out.
+
+        Replaces fixed "give VLC time to load" sleeps: returns as soon as status shows
+        `target` with `currentplid` equal to item_id / different from not_item_id. When
+        VLC does not report currentplid the item condition never holds, so the wait
+        runs to the timeout like the old fixed sleep.
+
         Returns:
-            bool: True if VLC is accessible, False if not
+            The last status fetched (None if VLC could not be reached).
         """
-        try:
-            status = self.vlc.get_status()
-            if not status:
-                logger.error("Could not access VLC - HTTP interface may not be enabled")
-                await ctx.send('Error: Could not access VLC. Make sure VLC is running with HTTP interface enabled.')
-                return False
-            logger.debug("VLC connection check successful")
-            return True
-        except Exception as e:
-            logger.error(f"Error connecting to VLC: {str(e)}")
-            await ctx.send(f'Error connecting to VLC: {str(e)}')
-            return False
-        
+        deadline = self._now() + timeout
+        status = None
+        while True:
+            await asyncio.sleep(interval)
+            status = await self._vlc_call(self.vlc.get_status)
+            if status is not None and status.findtext('state') == target:
+                if item_id is None and not_item_id is None:
+                    return status
+                plid = status.findtext('currentplid')
+                if plid is not None and (item_id is None or plid == str(item_id)) and \
+                        (not_item_id is None or plid != str(not_item_id)):
+                    return status
+            if self._now() >= deadline:
+                return status
+
     async def _set_presence(self, name: str | None, reason: str | None = None):
-        """Set the bot's Discord presence (throttled).
+        """Request a Discord presence change (coalesced by _presence_flusher).
+
+        Only the newest pending request is applied, and at most once per
+        PRESENCE_MIN_INTERVAL, which keeps the bot within Discord's gateway limit of
+        5 presence updates per 60s no matter how many call sites fire.
 
         Args:
             name: The activity name to show (e.g., movie title). If None, clears the activity.
         """
-        # Respect global config toggle
-        try:
-            if not getattr(Config, 'ENABLE_PRESENCE', True):
-                logger.debug("Presence updates disabled by config; skipping change")
-                return
-            now = asyncio.get_event_loop().time()
-            # Always allow clearing presence. For setting a title, only throttle if
-            # it's the same as the last title within the throttle window.
-            if name is not None and (now - self._presence_last_set) < self._presence_throttle_seconds:
-                if self._presence_last_name == name:
-                    logger.debug(
-                        f"Presence skipped due to throttle (same title within {self._presence_throttle_seconds}s): {name}"
-                    )
-                    return
+        # Respect global config toggle (snapshotted by _reload_runtime_settings)
+        if not self._presence_enabled:
+            logger.debug("Presence updates disabled by config; skipping change")
+            return
+        self._pending_presence = (name, reason)
+        if self._presence_flusher_task is None or self._presence_flusher_task.done():
+            self._presence_flusher_task = self.bot.loop.create_task(self._presence_flusher())
+        self._presence_wake.set()
+
+    async def _presence_flusher(self):
+        """Apply the newest pending presence request, spacing gateway updates out."""
+        min_interval = max(self.PRESENCE_MIN_INTERVAL, float(self._presence_throttle_seconds))
+        while not self.bot.is_closed():
+            try:
+                await self._presence_wake.wait()
+                # Debounce even when the interval has long passed, so a burst of
+                # requests (e.g. next, next, next) collapses into one update
+                wait_for = max(self.PRESENCE_DEBOUNCE_SECONDS,
+                               self._presence_last_set + min_interval - self._now())
+                await asyncio.sleep(wait_for)
+                self._presence_wake.clear()
+                pending, self._pending_presence = self._pending_presence, None
+                if pending is None:
+                    continue
+                name, reason = pending
+                # Nothing to send if Discord already shows this exact activity
+                if name == self._presence_last_name:
+                    continue
+                await self._apply_presence(name, reason)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.debug("Presence flusher error: %s", e)
 
+    async def _apply_presence(self, name: str | None, reason: str | None = None):
+        """Send a presence change to Discord (called only by _presence_flusher)."""
+        try:
+            now = self._now()
             # Build an activity. Use 'Watching' to avoid Streaming URL requirements.
             if name:
                 display_name = f"🎬 {name}"
-                try:
-                    activity = discord.Activity(type=discord.ActivityType.watching, name=display_name)
-                except Exception:
-                    # Fallback: still attempt to set as watching if streaming creation fails
-                    activity = discord.Activity(type=discord.ActivityType.watching, name=display_name)
+                activity = discord.Activity(type=discord.ActivityType.watching, name=display_name)
             else:
                 activity = None
 
@@ -1894,255 +2116,14 @@ class PlaybackCommands(commands.Cog):
                     )
                 else:
                     # Avoid spamming 'Presence cleared' when repeatedly stopped
-                    try:
-                        if getattr(self, '_presence_cleared_once', False):
-                            # Already logged this state; keep quiet
-                            pass
-                        else:
-                            logger.info("Presence cleared" + (f" (reason: {reason})" if reason else ""))
-                            self._presence_cleared_once = True
-                    except Exception:
+                    if not getattr(self, '_presence_cleared_once', False):
                         logger.info("Presence cleared" + (f" (reason: {reason})" if reason else ""))
+                        self._presence_cleared_once = True
             except Exception as e:
-                logger.debug(f"Failed to set presence: {e}")
+                logger.debug("Failed to set presence: %s", e)
         except Exception as e:
-            logger.debug(f"Presence update error: {e}")
-            
-    async def _status_legacy(self, ctx):
-        """Legacy status implementation (kept for reference, not registered as a command)."""
-        if not await self._check_vlc_connection(ctx):
-            return
-        # Use formatting helper for commands
-            
-        status = self.vlc.get_status()
-            
-        state = status.find('state').text
-        current = status.find('information')
-        
-        logger.info(f"Current VLC state: {state}")
-        logger.debug(f"Status - Current Info: {ET.tostring(current).decode() if current is not None else 'None'}")
-        
-        # Get position by finding current item in playlist
-        playlist = self.vlc.get_playlist()
-        current_position = None
-        if playlist is not None:
-            # Find current item and its position
-            for i, item in enumerate(playlist.findall('.//leaf')):
-                if item.get('current'):
-                    current_position = i + 1  # Convert to 1-based index
-                    break
-            logger.info(f"Current position in playlist: {current_position if current_position else 'not found'}")
-        
-        # Compute media library size
-        size_bytes = self.watch_service.get_total_media_size() if self.watch_service else 0
-        def human_size(num):
-            for unit in ['B','KB','MB','GB','TB']:
-                if num < 1024.0:
-                    return f"{num:.2f} {unit}"
-                num /= 1024.0
-            return f"{num:.2f} PB"
-
-        embed = discord.Embed(
-            title="VLC Status",
-            color=discord.Color.blue()
-        )
-        embed.add_field(name="State", value=state.capitalize(), inline=True)
-        embed.add_field(name="Media Library Size", value=human_size(size_bytes), inline=True)
-        
-        if state != 'stopped':
-            # Get the name from information/category/info[@name='filename']
-            name = None
-            if current is not None:
-                for category in current.findall('category'):
-                    for info in category.findall('info'):
-                        if info.get('name') == 'filename':
-                            name = info.text
-                            break
-                    if name:
-                        break
-            
-            # If we couldn't get name from status, try playlist
-            if not name:
-                playlist = self.vlc.get_playlist()
-                if playlist is not None:
-                    for item in playlist.findall('.//leaf'):
-                        if item.get('current'):
-                            name = item.get('name')
-                            break
-
-            # Prefer playlist name for episode parsing when it contains SxxEyy/1x02
-            playlist_name = None
-            current_item_uri = None
-            try:
-                playlist = self.vlc.get_playlist()
-                if playlist is not None:
-                    for item in playlist.findall('.//leaf'):
-                        if item.get('current'):
-                            playlist_name = item.get('name')
-                            current_item_uri = item.get('uri')
-                            break
-            except Exception:
-                playlist_name = None
-
-            parse_name = name
-            try:
-                if playlist_name and re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", playlist_name):
-                    parse_name = playlist_name
-            except Exception:
-                parse_name = name or playlist_name
-            
-            if name:
-                logger.debug(f"Status - Found name: {name}")
-                edition_tag = MediaUtils.extract_edition_tag(parse_name or name)
-                is_movie_embed = False
-                episode_label = None
-                # Get metadata (try both movie and TV)
-                search_title, search_year = MediaUtils.parse_movie_filename(parse_name or name)
-                tv_title, tv_season, tv_episode, tv_year = MediaUtils.parse_tv_filename(parse_name or name)
-                if tv_season and tv_episode:
-                    episode_label = f"S{int(tv_season):02d}E{int(tv_episode):02d}"
-                logger.debug(f"Status - Cleaned title: {search_title}, Year: {search_year}")
-                
-                # Detect if there's an explicit episode marker
-                has_explicit_episode = bool(tv_episode) or bool(re.search(r"(?i)(s\d{1,2}e\d{1,2}|\d{1,2}x\d{1,2})", name))
-                
-                movie_data = None
-                if has_explicit_episode and tv_title:
-                    # Has explicit episode: prefer TV
-                    movie_data = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
-                else:
-                    # No explicit episode: try both and compare scores
-                    movie_embed = None
-                    tv_embed = None
-                    movie_score = 0.0
-                    tv_score = 0.0
-                    
-                    if search_title:
-                        movie_embed = self.tmdb.get_movie_metadata(search_title, search_year, file_path=current_item_uri)
-                        movie_score = getattr(self.tmdb, '_last_match_score', 0.0)
-                    
-                    if tv_title:
-                        tv_embed = self.tmdb.get_tv_metadata(tv_title, tv_season, tv_year)
-                        tv_score = getattr(self.tmdb, '_last_match_score', 0.0)
-                    
-                    # Choose the better match
-                    if tv_embed and movie_embed:
-                        movie_data = tv_embed if tv_score > movie_score else movie_embed
-                        is_movie_embed = (movie_data == movie_embed)
-                    elif tv_embed:
-                        movie_data = tv_embed
-                    elif movie_embed:
-                        movie_data = movie_embed
-                        is_movie_embed = True
-                    else:
-                        # Fallback: try generic TV lookup
-                        if search_title:
-                            movie_data = self.tmdb.get_tv_metadata(search_title)
-                
-                logger.debug(f"Status - Movie data: {movie_data}")
-                
-                # Log movie data attributes
-                if movie_data:
-                    logger.debug("Status - Movie data attributes:")
-                    logger.debug(f"  - Has title: {hasattr(movie_data, 'title')}")
-                    logger.debug(f"  - Has overview: {hasattr(movie_data, 'overview')}")
-                    logger.debug(f"  - Has tmdb_url: {hasattr(movie_data, 'tmdb_url')}")
-                    logger.debug(f"  - Has fields: {hasattr(movie_data, 'fields')}")
-                    if hasattr(movie_data, 'fields'):
-                        logger.debug("  - Fields:")
-                        for field in movie_data.fields:
-                            logger.debug(f"    - {field.name}: {field.value}")
-                
-                # Add position info if available
-                position_text = f" (Item {current_position})" if current_position is not None else ""
-                
-                if movie_data:
-                    logger.debug("Status - Using TMDB movie data")
-                    # Use the movie_data embed directly and update the state field
-                    embed = movie_data
-                    if edition_tag and is_movie_embed:
-                        try:
-                            embed.add_field(name="Edition", value=edition_tag, inline=True)
-                        except Exception:
-                            pass
-                    if episode_label and not is_movie_embed:
-                        try:
-                            embed.add_field(name="Episode", value=episode_label, inline=True)
-                        except Exception:
-                            pass
-                    embed.insert_field_at(0, name="State", value=state.capitalize(), inline=True)
-                else:
-                    logger.debug("Status - No movie data, using filename")
-                    # Add the filename to our existing embed
-                    embed.add_field(
-                        name="Now Playing",
-                        value=name,
-                        inline=False
-                    )
-                    if edition_tag and not has_explicit_episode:
-                        try:
-                            embed.add_field(name="Edition", value=edition_tag, inline=True)
-                        except Exception:
-                            pass
-                    if episode_label:
-                        try:
-                            embed.add_field(name="Episode", value=episode_label, inline=True)
-                        except Exception:
-                            pass
-                    
-                # Add progress information
-                time_elem = status.find('time')
-                length_elem = status.find('length')
-                if time_elem is not None and length_elem is not None:
-                    time = int(time_elem.text)
-                    length = int(length_elem.text)
-                    progress = f"{time//60}:{time%60:02d}/{length//60}:{length%60:02d}"
-                    embed.add_field(name="Progress", value=progress, inline=True)
-                    
-                # Add position note as a field with bold formatting after progress
-                if current_position is not None:
-                    embed.add_field(name="Quick Replay", value=f"💡 Use {format_cmd_inline(f'play_num {current_position}')} to play this item again", inline=False)
-                
-                # Ensure Support field (Ko-fi) is present and a thumbnail is set for visibility
-                try:
-                    if Config.KOFI_URL:
-                        try:
-                            embed.add_field(name="Support kutsaratinidor by supporting CtrlVee", value=f"☕ {f'<{Config.KOFI_URL}>'}", inline=False)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-
-                # If embed has no thumbnail, attempt to set bot avatar as thumbnail to increase visibility
-                try:
-                    if not embed.thumbnail or not getattr(embed.thumbnail, 'url', None):
-                        bot_user = getattr(self.bot, 'user', None)
-                        if bot_user and getattr(bot_user, 'display_avatar', None):
-                            embed.set_thumbnail(url=bot_user.display_avatar.url)
-                except Exception:
-                    pass
-            else:
-                # Playing but no name found
-                embed.add_field(name="Now Playing", value="Unknown item", inline=False)
-        else:
-            # VLC is stopped - add helpful information
-            embed.add_field(name="Now Playing", value="Nothing currently playing", inline=False)
+            logger.debug("Presence update error: %s", e)
             
-            # Add playlist information if available
-            if playlist is not None:
-                items = playlist.findall('.//leaf')
-                playlist_count = len(items)
-                if playlist_count > 0:
-                    embed.add_field(
-                        name="Playlist Info", 
-                        value=f"{playlist_count} items in playlist\nUse {format_cmd_inline('play')} to resume or {format_cmd_inline('play_num <number>')} to play a specific item",
-                        inline=False
-                    )
-                else:
-                    embed.add_field(name="Playlist Info", value="Playlist is empty", inline=False)
-        
-        await ctx.send(embed=embed)
-
     @commands.command(name='queue_next', aliases=['qnext'])
     @commands.has_any_role(*Config.ALLOWED_ROLES)
     async def queue_next(self, ctx, number: int):
@@ -2152,12 +2133,11 @@ class PlaybackCommands(commands.Cog):
                 await ctx.send('Please provide a number greater than 0')
                 return
 
-            playlist = self.vlc.get_playlist()
+            playlist, items = await self._vlc_call(self._get_playlist_cached)
             if not playlist:
                 await ctx.send('Could not access VLC playlist')
                 return
 
-            items = playlist.findall('.//leaf')
             if not items:
                 await ctx.send('Playlist is empty')
                 return
@@ -2171,7 +2151,7 @@ class PlaybackCommands(commands.Cog):
             item_name = item.get('name', 'Unknown')
 
             # Queue the item
-            result = self.vlc.queue_item_next(item_id)
+            result = await self._vlc_call(self.vlc.queue_item_next, item_id)
             
             if result.get("success"):
                 embed = discord.Embed(
@@ -2205,68 +2185,53 @@ class PlaybackCommands(commands.Cog):
     async def queue_status(self, ctx):
         """Show current soft queue status and shuffle state"""
         try:
-            queue_status = self.vlc.get_queue_status()
-            shuffle_on = queue_status.get("shuffle_currently_on", False)
+            # The queue dicts are only touched on the VLC worker, so read them there too
+            queue_status = await self._vlc_call(self.vlc.get_queue_status)
             
-            embed = discord.Embed(
-                title="📋 Queue Status",
-                color=discord.Color.blue()
-            )
+            data = dict(QUEUE_STATUS_TEMPLATE)
             
             # Get queue count for title
             queued_items = queue_status.get("queued_items", {})
             queue_count = len(queued_items)
             if queue_count > 0:
-                embed.title = f"📋 Queue Status ({queue_count} item{'s' if queue_count != 1 else ''})"
+                data['title'] = f"📋 Queue Status ({queue_count} item{'s' if queue_count != 1 else ''})"
             
             # Active queued items
             if queued_items:
-                # Get playlist to map item IDs to titles and positions
-                playlist = self.vlc.get_playlist()
-                playlist_map = {}
-                if playlist:
-                    for idx, item in enumerate(playlist.findall('.//leaf'), 1):
-                        item_id = item.get('id')
-                        item_name = item.get('name', 'Unknown')
-                        if item_id:
-                            playlist_map[item_id] = {
-                                'name': item_name,
-                                'position': idx
-                            }
+                # Resolve queued IDs to titles and positions straight from the cached id index;
+                # no intermediate per-item map is needed. Only fetched when something is queued.
+                cache = await self._vlc_call(self._get_playlist_cache_entry)
+                leaves = cache['leaves']
+                position_of = cache['id_to_pos'].get
                 
                 queue_list = []
-                for item_id, info in queued_items.items():
-                    # Get item details from playlist
-                    if item_id in playlist_map:
-                        item_name = playlist_map[item_id]['name']
-                        playlist_pos = playlist_map[item_id]['position']
+                # Only the first QUEUE_STATUS_MAX_ITEMS entries are shown; don't format the rest
+                for item_id, info in islice(queued_items.items(), self.QUEUE_STATUS_MAX_ITEMS):
+                    playlist_pos = position_of(item_id)
+                    if playlist_pos is not None:
+                        item_name = leaves[playlist_pos - 1].get('name', 'Unknown')
                         queue_list.append(f"• **{item_name}** (playlist #{playlist_pos}, queue #{info['queue_order']})")
                     else:
                         # Fallback if item not found in current playlist
                         item_name = info.get('item_name', 'Unknown')
                         queue_list.append(f"• **{item_name}** (queue #{info['queue_order']})")
                 
-                embed.add_field(
-                    name="Active Queue Items",
-                    value="\n".join(queue_list[:5]) + ("\n..." if len(queue_list) > 5 else ""),
-                    inline=False
-                )
+                more = len(queued_items) > self.QUEUE_STATUS_MAX_ITEMS
+                queue_value = "\n".join(queue_list) + ("\n..." if more else "")
             else:
-                embed.add_field(
-                    name="Active Queue Items",
-                    value="No items currently queued",
-                    inline=False
-                )
+                queue_value = "No items currently queued"
             
+            data['fields'] = [
+                {'name': "Active Queue Items", 'value': queue_value, 'inline': False},
+                # Usage hint
+                {
+                    'name': "Usage",
+                    'value': f"Use {format_cmd_inline('queue_next <number>')} to queue a playlist item to play next",
+                    'inline': False,
+                },
+            ]
             
-            # Usage hint
-            embed.add_field(
-                name="Usage",
-                value=f"Use {format_cmd_inline('queue_next <number>')} to queue a playlist item to play next",
-                inline=False
-            )
-            
-            await ctx.send(embed=embed)
+            await ctx.send(embed=discord.Embed.from_dict(data))
             
         except Exception as e:
             logger.error(f"Error in queue_status command: {e}")
@@ -2277,7 +2242,7 @@ class PlaybackCommands(commands.Cog):
     async def clear_queue(self, ctx):
         """Clear all queue tracking (useful for reset)"""
         try:
-            self.vlc.clear_queue_tracking()
+            await self._vlc_call(self.vlc.clear_queue_tracking)
             embed = discord.Embed(
                 title="🗑️ Queue Cleared",
                 description="All queue tracking has been cleared",
@@ -2309,10 +2274,10 @@ class PlaybackCommands(commands.Cog):
         try:
             if ref.startswith('#'):
                 num = int(ref[1:])
-                result = self.vlc.remove_from_queue_by_playlist_number(num)
+                result = await self._vlc_call(self.vlc.remove_from_queue_by_playlist_number, num)
             else:
                 num = int(ref)
-                result = self.vlc.remove_from_queue_by_order(num)
+                result = await self._vlc_call(self.vlc.remove_from_queue_by_order, num)
 
             if not result.get('success'):
                 await ctx.send(f"❌ {result.get('error', 'Failed to remove from queue')}")
@@ -2336,7 +2301,7 @@ class PlaybackCommands(commands.Cog):
     async def shuffle_on(self, ctx):
         """Enable shuffle mode"""
         try:
-            current_shuffle = self.vlc.get_shuffle_state()
+            current_shuffle = await self._vlc_call(self.vlc.get_shuffle_state)
             
             if current_shuffle:
                 embed = discord.Embed(
@@ -2346,7 +2311,7 @@ class PlaybackCommands(commands.Cog):
                 )
             else:
                 # Enable shuffle
-                self.vlc.toggle_shuffle()
+                await self._vlc_call(self.vlc.toggle_shuffle)
                 embed = discord.Embed(
                     title="🔀 Shuffle Enabled",
                     description="Shuffle mode has been turned on",
@@ -2365,7 +2330,7 @@ class PlaybackCommands(commands.Cog):
     async def shuffle_off(self, ctx):
         """Disable shuffle mode"""
         try:
-            current_shuffle = self.vlc.get_shuffle_state()
+            current_shuffle = await self._vlc_call(self.vlc.get_shuffle_state)
             
             if not current_shuffle:
                 embed = discord.Embed(
@@ -2375,7 +2340,7 @@ class PlaybackCommands(commands.Cog):
                 )
             else:
                 # Disable shuffle
-                self.vlc.toggle_shuffle()
+                await self._vlc_call(self.vlc.toggle_shuffle)
                 embed = discord.Embed(
                     title="▶️ Shuffle Disabled",
                     description="Shuffle mode has been turned off",
@@ -2394,10 +2359,10 @@ class PlaybackCommands(commands.Cog):
     async def shuffle_toggle(self, ctx):
         """Toggle shuffle mode on/off"""
         try:
-            current_shuffle = self.vlc.get_shuffle_state()
+            current_shuffle = await self._vlc_call(self.vlc.get_shuffle_state)
             
             # Toggle shuffle
-            self.vlc.toggle_shuffle()
+            await self._vlc_call(self.vlc.toggle_shuffle)
             new_shuffle = not current_shuffle
             
             if new_shuffle:
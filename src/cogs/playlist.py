@@ -1,14 +1,72 @@
 from typing import Optional, List, Tuple
+import asyncio
 import discord
 from discord.ext import commands
 import logging
 import re
-from ..utils.media_utils import MediaUtils
+import time
+from ..utils.media_utils import MediaUtils, human_size
 from ..config import Config
 from ..utils.command_utils import format_cmd_inline
 
 logger = logging.getLogger(__name__)
 
+# Separators and punctuation both collapse to word breaks when normalizing search text
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _build_line_pages(entries, max_items: int, max_chars: int) -> List[List[str]]:
+    """Render (number, name) entries as playlist lines and paginate them.
+
+    Pages are constrained by both max line count and max rendered characters to
+    avoid hitting Discord's 1024-char field cap.
+    """
+    # Hoisted out of the per-item loop: these run once per playlist entry
+    get_icon = MediaUtils.get_media_icon
+    clean = MediaUtils.clean_filename_for_display
+
+    pages: List[List[str]] = []
+    current_page: List[str] = []
+    current_chars = 0
+
+    for num, name in entries:
+        icon = get_icon(name)
+        basename = clean(name)
+        prefix = f"{icon}`{num}` "
+        line = prefix + basename
+
+        # Truncate very long single lines so one item can always fit a page.
+        if len(line) > max_chars:
+            keep = max(0, max_chars - len(prefix) - 3)
+            line = f"{prefix}{basename[:keep]}..."
+
+        # Running character count; the joined page text is only built at render time
+        line_len = len(line) + (1 if current_page else 0)
+        if current_page and (current_chars + line_len > max_chars or len(current_page) >= max_items):
+            pages.append(current_page)
+            current_page = []
+            current_chars = 0
+            line_len = len(line)
+
+        current_chars += line_len
+        current_page.append(line)
+
+    if current_page:
+        pages.append(current_page)
+
+    return pages
+
+
+def _page_starts(pages: List[List[str]]) -> List[int]:
+    """Return the 1-based number of the first entry on each page (running total)."""
+    starts = []
+    total = 0
+    for page in pages:
+        starts.append(total + 1)
+        total += len(page)
+    return starts
+
+
 class PlaylistView(discord.ui.View):
     def __init__(self, items, items_per_page: Optional[int] = None):
         super().__init__(timeout=300)  # 5 minute timeout
@@ -18,49 +76,30 @@ class PlaylistView(discord.ui.View):
         self.max_chars_per_page = 1000
         self.current_page = 1
         self.pages = self._build_pages()
+        self.page_starts = _page_starts(self.pages)
         self.total_pages = max(1, len(self.pages))
+        # The items never change for this view's lifetime, so render each page's
+        # (field text, footer) once; button clicks just index into this
+        self._page_texts = self._render_pages()
 
     def _build_pages(self) -> List[List[str]]:
         """Paginate playlist lines by item-count and field character limits."""
-        pages: List[List[str]] = []
-        current_page: List[str] = []
-        current_chars = 0
-
-        for i, item in enumerate(self.items, start=1):
-            name = item.get('name', '')
-            icon = MediaUtils.get_media_icon(name)
-            basename = MediaUtils.clean_filename_for_display(name)
-            line = f"{icon}`{i}` {basename}"
-
-            # Ensure one very long title still fits safely in a page.
-            if len(line) > self.max_chars_per_page:
-                keep = max(0, self.max_chars_per_page - len(f"{icon}`{i}` ..."))
-                line = f"{icon}`{i}` {basename[:keep]}..."
-
-            projected = current_chars + len(line) + (1 if current_page else 0)
-            would_overflow_chars = projected > self.max_chars_per_page
-            would_overflow_items = len(current_page) >= self.items_per_page
-
-            if current_page and (would_overflow_chars or would_overflow_items):
-                pages.append(current_page)
-                current_page = []
-                current_chars = 0
-
-            current_page.append(line)
-            current_chars += len(line) + (1 if len(current_page) > 1 else 0)
-
-        if current_page:
-            pages.append(current_page)
-
-        return pages
+        entries = ((i, item.get('name', '')) for i, item in enumerate(self.items, start=1))
+        return _build_line_pages(entries, self.items_per_page, self.max_chars_per_page)
+
+    def _render_pages(self) -> List[Tuple[str, str]]:
+        """Return (field text, footer) for every page, in page order."""
+        total = len(self.items)
+        if not self.pages:
+            return [("No items in playlist", f"📑 Showing items 0-0 of {total}")]
+        texts = []
+        for start, page_lines in zip(self.page_starts, self.pages):
+            end = start + len(page_lines) - 1
+            texts.append(("\n".join(page_lines), f"📑 Showing items {start}-{end} of {total}"))
+        return texts
 
     def build_embed(self) -> discord.Embed:
-        page_idx = self.current_page - 1
-        page_lines = self.pages[page_idx] if self.pages else []
-
-        # Compute global displayed range for this page.
-        start = sum(len(p) for p in self.pages[:page_idx]) + 1 if page_lines else 0
-        end = start + len(page_lines) - 1 if page_lines else 0
+        value, footer = self._page_texts[self.current_page - 1]
 
         embed = discord.Embed(
             title="VLC Playlist",
@@ -68,13 +107,10 @@ class PlaylistView(discord.ui.View):
         )
         embed.add_field(
             name=f"📋 Page {self.current_page}/{self.total_pages}",
-            value="\n".join(page_lines) if page_lines else "No items in playlist",
+            value=value,
             inline=False
         )
-        if start and end:
-            embed.set_footer(text=f"📑 Showing items {start}-{end} of {len(self.items)}")
-        else:
-            embed.set_footer(text=f"📑 Showing items 0-0 of {len(self.items)}")
+        embed.set_footer(text=footer)
         return embed
 
     @discord.ui.button(label="⏮️", style=discord.ButtonStyle.secondary)
@@ -145,6 +181,7 @@ class SearchResultsView(discord.ui.View):
         super().__init__(timeout=300)
         self.query = query
         self.pages = pages
+        self.page_starts = _page_starts(pages)
         self.total_matches = total_matches
         self.current_page = 1
         self.total_pages = max(1, len(pages))
@@ -178,8 +215,8 @@ class SearchResultsView(discord.ui.View):
         page_idx = self.current_page - 1
         page_lines = self.pages[page_idx] if self.pages else []
 
-        # Compute item range shown in this page for clearer navigation context.
-        start = sum(len(p) for p in self.pages[:page_idx]) + 1 if page_lines else 0
+        # Item range shown in this page for clearer navigation context.
+        start = self.page_starts[page_idx] if page_lines else 0
         end = start + len(page_lines) - 1 if page_lines else 0
 
         embed = discord.Embed(
@@ -201,18 +238,55 @@ class SearchResultsView(discord.ui.View):
         await interaction.response.edit_message(embed=embed, view=self)
 
 class PlaylistCommands(commands.Cog):
+    # Bursts of search/list commands within this many seconds share one playlist fetch
+    PLAYLIST_CACHE_TTL = 2.0
+
     def __init__(self, bot: commands.Bot, vlc_controller, tmdb_service, watch_service):
         self.bot = bot
         self.vlc = vlc_controller
         self.tmdb = tmdb_service
         self.watch_service = watch_service
+        # Short-lived playlist cache: dict with ts and items (the playlist's leaf elements)
+        self._playlist_cache = None
+
+    def _get_playlist_cache_entry(self) -> dict:
+        """Return the playlist cache entry, refetching playlist.xml when it is stale."""
+        now = time.monotonic()
+        cache = self._playlist_cache
+        if cache is not None and (now - cache['ts']) < self.PLAYLIST_CACHE_TTL:
+            return cache
+        playlist_xml = self.vlc.get_playlist()
+        # Element.iter() walks the tree in C without going through ElementPath's
+        # './/leaf' matcher; the order is the same document order
+        items = list(playlist_xml.iter('leaf')) if playlist_xml is not None else []
+        cache = {
+            'ts': now,
+            'items': items,
+        }
+        # A failed fetch is not cached so the next command retries immediately
+        self._playlist_cache = cache if playlist_xml is not None else None
+        return cache
+
+    def _invalidate_playlist_cache(self):
+        """Drop the cached playlist after commands that change VLC's playlist state."""
+        self._playlist_cache = None
+
+    async def _vlc_command(self, fn, *args):
+        """Run a VLC control call on the playback cog's VLC worker, in order with its commands."""
+        playback = self.bot.get_cog('PlaybackCommands')
+        if playback is None:
+            return await asyncio.to_thread(fn, *args)
+        return await playback.run_vlc_command(fn, *args)
+
+    def _wake_playback_poller(self):
+        """Have the playback cog's poller pick up a play started here without its backoff delay."""
+        playback = self.bot.get_cog('PlaybackCommands')
+        if playback is not None:
+            playback.wake_poller()
 
     def _get_playlist_items(self) -> List[dict]:
         """Get current playlist items"""
-        playlist_xml = self.vlc.get_playlist()
-        if playlist_xml is not None:
-            return playlist_xml.findall('.//leaf')
-        return []
+        return self._get_playlist_cache_entry()['items']
 
     def _find_item_by_id(self, item_id: str) -> Tuple[Optional[dict], int]:
         """Find an item and its index in the playlist by ID"""
@@ -228,21 +302,16 @@ class PlaylistCommands(commands.Cog):
         Returns:
             Tuple of (normalized_with_spaces, compact_alnum, tokens)
         """
-        lowered = (text or '').lower()
-        # Convert common separators to spaces first, then strip other punctuation.
-        normalized = re.sub(r'[._\-]+', ' ', lowered)
-        normalized = re.sub(r'[^a-z0-9]+', ' ', normalized)
-        normalized = ' '.join(normalized.split())
-        compact = normalized.replace(' ', '')
-        tokens = normalized.split() if normalized else []
-        return normalized, compact, tokens
-
-    def _score_match(self, query_norm: str, query_compact: str, query_tokens: List[str], item_name: str) -> int:
-        """Return a relevance score for query vs item name.
+        # One lower() and one regex split: separators (._-) and other punctuation alike
+        tokens = [t for t in _NON_ALNUM_RE.split((text or '').lower()) if t]
+        return ' '.join(tokens), ''.join(tokens), tokens
+
+    def _score_match(self, query_norm: str, query_compact: str, query_tokens: List[str],
+                     item_norm: str, item_compact: str) -> int:
+        """Return a relevance score for query vs an already-normalized item name.
 
         Higher score means better match.
         """
-        item_norm, item_compact, _ = self._normalize_search_text(item_name)
         if not item_norm:
             return 0
 
@@ -294,20 +363,23 @@ class PlaylistCommands(commands.Cog):
         if not query_tokens:
             return []
 
+        # Longest (most selective) words first so all() can bail out early
+        match_tokens = sorted(set(query_tokens), key=len, reverse=True)
+        normalize = self._normalize_search_text
+
         scored_results: List[Tuple[int, int, dict]] = []
         for i, item in enumerate(items):
-            raw_name = item.get('name', '')
-            item_norm, item_compact, _ = self._normalize_search_text(raw_name)
+            item_norm, item_compact, _ = normalize(item.get('name', ''))
 
             # Accept multiple match strategies to handle spacing/punctuation variants.
             matches = (
                 (query_norm and query_norm in item_norm) or
                 (query_compact and query_compact in item_compact) or
-                all(token in item_norm for token in query_tokens)
+                all(token in item_norm for token in match_tokens)
             )
 
             if matches:
-                score = self._score_match(query_norm, query_compact, query_tokens, raw_name)
+                score = self._score_match(query_norm, query_compact, query_tokens, item_norm, item_compact)
                 scored_results.append((score, i + 1, item))
 
         # Rank by best score first; use playlist position as stable tiebreaker.
@@ -322,46 +394,16 @@ class PlaylistCommands(commands.Cog):
         max rendered characters to avoid hitting Discord's 1024-char field cap.
         """
         max_items_per_page = max(1, int(getattr(Config, 'ITEMS_PER_PAGE', 20)))
-        max_chars_per_page = 1000
-
-        pages: List[List[str]] = []
-        current_page: List[str] = []
-        current_chars = 0
-
-        for playlist_num, item in results:
-            name = item.get('name', '')
-            icon = MediaUtils.get_media_icon(name)
-            basename = MediaUtils.clean_filename_for_display(name)
-            line = f"{icon}`{playlist_num}` {basename}"
-
-            # Truncate very long single lines so one item can always fit a page.
-            if len(line) > max_chars_per_page:
-                keep = max(0, max_chars_per_page - len(f"{icon}`{playlist_num}` ..."))
-                line = f"{icon}`{playlist_num}` {basename[:keep]}..."
-
-            projected = current_chars + len(line) + (1 if current_page else 0)
-            would_overflow_chars = projected > max_chars_per_page
-            would_overflow_items = len(current_page) >= max_items_per_page
-
-            if current_page and (would_overflow_chars or would_overflow_items):
-                pages.append(current_page)
-                current_page = []
-                current_chars = 0
-
-            current_page.append(line)
-            current_chars += len(line) + (1 if len(current_page) > 1 else 0)
-
-        if current_page:
-            pages.append(current_page)
-
-        return pages
+        entries = ((playlist_num, item.get('name', '')) for playlist_num, item in results)
+        return _build_line_pages(entries, max_items_per_page, 1000)
 
     @commands.command(name='search')
     @commands.has_any_role(*Config.ALLOWED_ROLES)
     async def search_playlist(self, ctx: commands.Context, *, query: str):
         """Search for items in the playlist"""
         try:
-            results = self._search_items(query)
+            # Playlist fetch, XML parse and scoring all block; keep them off the event loop
+            results = await asyncio.to_thread(self._search_items, query)
             
             # Create embed
             embed = discord.Embed(
@@ -371,7 +413,7 @@ class PlaylistCommands(commands.Cog):
             )
             
             if results:
-                pages = self._build_search_pages(results)
+                pages = await asyncio.to_thread(self._build_search_pages, results)
                 first_page = pages[0] if pages else []
                 embed.add_field(
                     name=f"Found {len(results)} matches • Page 1/{max(1, len(pages))}",
@@ -410,7 +452,7 @@ class PlaylistCommands(commands.Cog):
     async def play_search(self, ctx: commands.Context, *, query: str):
         """Search for and play an item from the playlist"""
         try:
-            results = self._search_items(query)
+            results = await asyncio.to_thread(self._search_items, query)
             if not results:
                 await ctx.send('No matches found in playlist')
                 return
@@ -419,7 +461,9 @@ class PlaylistCommands(commands.Cog):
             playlist_num, item = results[0]
             item_id = item.get('id')
             
-            if self.vlc.play_item(item_id):
+            if await self._vlc_command(self.vlc.play_item, item_id):
+                self._invalidate_playlist_cache()
+                self._wake_playback_poller()
                 logger.info(f"Playing search result: {item.get('name')} (#{playlist_num})")
                 hint = ""
                 if len(results) > 1:
@@ -428,7 +472,9 @@ class PlaylistCommands(commands.Cog):
                 
                 # Get parsed title and optional year for metadata search
                 search_title, search_year = MediaUtils.parse_movie_filename(item.get('name'))
-                movie_embed = self.tmdb.get_movie_metadata(search_title, search_year, file_path=item.get('uri'))
+                movie_embed = await asyncio.to_thread(
+                    self.tmdb.get_movie_metadata, search_title, search_year, file_path=item.get('uri')
+                )
                 edition_tag = MediaUtils.extract_edition_tag(item.get('name'))
                 
                 if movie_embed:
@@ -454,7 +500,7 @@ class PlaylistCommands(commands.Cog):
     async def list_playlist(self, ctx: commands.Context):
         """List items in the playlist with interactive navigation"""
         try:
-            items = self._get_playlist_items()
+            items = await asyncio.to_thread(self._get_playlist_items)
             if not items:
                 await ctx.send('Playlist is empty')
                 return
@@ -463,16 +509,10 @@ class PlaylistCommands(commands.Cog):
             embed = view.build_embed()
             
             # Add media library size to footer
-            size_bytes = self.watch_service.get_total_media_size() if self.watch_service else 0
-            def human_size(num):
-                for unit in ['B','KB','MB','GB','TB']:
-                    if num < 1024.0:
-                        return f"{num:.2f} {unit}"
-                    num /= 1024.0
-                return f"{num:.2f} PB"
+            size_text = self.watch_service.get_total_media_size_display() if self.watch_service else human_size(0)
             # Preserve the page range and append media size.
             page_footer = embed.footer.text or ""
-            embed.set_footer(text=f"{page_footer} | Media Library Size: {human_size(size_bytes)}")
+            embed.set_footer(text=f"{page_footer} | Media Library Size: {size_text}")
             await ctx.send(embed=embed, view=view)
             
         except Exception as e:
@@ -7,6 +7,7 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import logging
 import json
 import os
+from itertools import islice
 from ..utils.media_utils import MediaUtils
 
 # Cross-platform timezone handling for PH time
@@ -207,11 +208,21 @@ class Scheduler(commands.Cog):
             try:
                 # Play by number (1-based index)
                 playlist = self.vlc.get_playlist()
-                items = playlist.findall('.//leaf') if playlist is not None else []
                 idx = s["number"] - 1
-                if 0 <= idx < len(items):
-                    item_id = items[idx].get('id')
-                    self.vlc.play_item(item_id)
+                # Stop at the requested leaf instead of building the whole list
+                item = None
+                if playlist is not None and idx >= 0:
+                    item = next(islice(playlist.iterfind('.//leaf'), idx, idx + 1), None)
+                if item is not None:
+                    item_id = item.get('id')
+                    # Start it on the playback cog's VLC worker so it is ordered with bot
+                    # commands, then let its poller pick up the new track right away
+                    playback = self.bot.get_cog('PlaybackCommands')
+                    if playback is not None:
+                        await playback.run_vlc_command(self.vlc.play_item, item_id)
+                        playback.wake_poller()
+                    else:
+                        self.vlc.play_item(item_id)
                     announce_ids = Config.get_announce_channel_ids()
                     channel_ids = set(announce_ids or [])
                     # Also notify the original scheduling channel for visibility
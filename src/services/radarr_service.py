@@ -55,7 +55,7 @@ class RadarrService:
             }
         
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None, 
                 lambda: requests.get(
@@ -109,7 +109,7 @@ class RadarrService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             # Get movie list
             response = await loop.run_in_executor(
@@ -233,7 +233,7 @@ class RadarrService:
             }
         
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: requests.get(
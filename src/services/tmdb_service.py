@@ -1,11 +1,20 @@
 import logging
 import os
 import re
+import threading
+import time
 import discord
 import tmdbsimple as tmdb
 from urllib.parse import unquote
 
 class TMDBService:
+    # Movie lookup cache: key -> (timestamp, (score, movie_info) or None for "no match")
+    MOVIE_CACHE_TTL = 24 * 60 * 60
+    MOVIE_CACHE_MAX_ENTRIES = 1024
+    # TV lookup cache: key -> (timestamp, (score, tv_info, season_info) or None for "no match")
+    TV_CACHE_TTL = 24 * 60 * 60
+    TV_CACHE_MAX_ENTRIES = 512
+
     def __init__(self, api_key=None):
         """Initialize TMDB service using config or provided API key
         
@@ -15,9 +24,40 @@ class TMDBService:
         from ..config import Config
         self.api_key = api_key or Config.TMDB_API_KEY
         self.logger = logging.getLogger(__name__)
+        self._movie_cache = {}
+        self._tv_cache = {}
+        # Lookups run on several worker threads; guards the caches' get/put/evict steps
+        self._cache_lock = threading.Lock()
         if self.api_key:
             tmdb.API_KEY = self.api_key
 
+    def _cache_get(self, cache: dict, key, ttl: float):
+        """Return (hit, value) for a cached lookup, dropping expired entries."""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return False, None
+            ts, value = entry
+            if (time.monotonic() - ts) > ttl:
+                cache.pop(key, None)
+                return False, None
+            return True, value
+
+    def _cache_put(self, cache: dict, key, value, max_entries: int):
+        """Store a lookup result, evicting the oldest entries when full."""
+        with self._cache_lock:
+            while cache and len(cache) >= max_entries:
+                cache.pop(next(iter(cache)))
+            cache[key] = (time.monotonic(), value)
+
+    def _movie_cache_get(self, key):
+        """Return (hit, value) for a cached movie lookup."""
+        return self._cache_get(self._movie_cache, key, self.MOVIE_CACHE_TTL)
+
+    def _movie_cache_put(self, key, value):
+        """Store a movie lookup result."""
+        self._cache_put(self._movie_cache, key, value, self.MOVIE_CACHE_MAX_ENTRIES)
+
     def _compute_title_score(self, search_title: str, item_title: str, item_original_title: str, target_year: int | None, item_year: int | None, popularity: float, vote_count: int) -> float:
         """Compute a matching score for a search result.
         
@@ -174,6 +214,9 @@ class TMDBService:
         2. Pre-AKA and post-AKA parts when 'AKA' is present in the title
         3. Parent folder name derived from file_path (typically contains a clean title + year)
 
+        Results (including "no match") are cached per (title, year, file_path); the
+        cache holds TMDB data rather than embeds, so every call returns a fresh Embed.
+
         Args:
             title: Clean movie title
             year: Optional release year to disambiguate results
@@ -184,6 +227,15 @@ class TMDBService:
             self.logger.warning("No TMDB API key found")
             return None
 
+        cache_key = ((title or '').strip().lower(), year, file_path)
+        hit, cached = self._movie_cache_get(cache_key)
+        if hit:
+            self.logger.debug(f"TMDB movie cache hit: title='{title}' year={year}")
+            if cached is None:
+                return None
+            self._last_match_score = cached[0]
+            return self._build_embed_from_movie_info(cached[1])
+
         try:
             self.logger.info(f"TMDB movie lookup: title='{title}' year={year}")
 
@@ -229,17 +281,52 @@ class TMDBService:
                     )
                     self._last_match_score = best_score
                     movie_info = tmdb.Movies(movie['id']).info()
+                    self._movie_cache_put(cache_key, (best_score, movie_info))
                     return self._build_embed_from_movie_info(movie_info)
 
             self.logger.info(f"TMDB movie lookup: no results for title='{title}' (year={year}) after all fallbacks")
+            self._movie_cache_put(cache_key, None)
             return None
         except Exception as e:
             self.logger.error(f"Error getting movie metadata for title='{title}' year={year}: {e}")
             return None
 
+    def _build_embed_from_tv_info(self, tv_info: dict, season: int | None, season_info: dict | None) -> discord.Embed:
+        """Build a Discord embed from TMDB TV info and optional season info."""
+        embed = discord.Embed(
+            title=tv_info.get('name') or tv_info.get('original_name'),
+            description=tv_info.get('overview') or '',
+            color=discord.Color.blue(),
+            url=f"https://www.themoviedb.org/tv/{tv_info['id']}"
+        )
+
+        if tv_info.get('first_air_date'):
+            embed.add_field(name="First Air Date", value=tv_info.get('first_air_date'), inline=True)
+        if tv_info.get('vote_average'):
+            embed.add_field(name="Rating", value=f"⭐ {tv_info.get('vote_average'):.1f}/10", inline=True)
+
+        # Add genres if available
+        if tv_info.get('genres'):
+            embed.add_field(name="Genre", value=', '.join([g['name'] for g in tv_info['genres']]), inline=True)
+
+        poster_path = tv_info.get('poster_path')
+        if season is not None and season_info is not None:
+            # Add episode count and season poster if available
+            eps = season_info.get('episode_count') or season_info.get('episodes') and len(season_info.get('episodes'))
+            if eps:
+                embed.add_field(name=f"Season {season} Episodes", value=str(eps), inline=True)
+            # Fallback to show poster
+            poster_path = season_info.get('poster_path') or poster_path
+        if poster_path:
+            embed.set_thumbnail(url=f"https://image.tmdb.org/t/p/w500{poster_path}")
+        return embed
+
     def get_tv_metadata(self, title: str, season: int | None = None, year: int | None = None):
         """Get TV show or season metadata from TMDB.
 
+        Results (including "no match") are cached per (title, season, year) like movie
+        lookups; every call builds a fresh Embed from the cached TMDB data.
+
         Args:
             title: Clean TV show title
             season: Optional season number to fetch season-specific info
@@ -251,6 +338,15 @@ class TMDBService:
             self.logger.warning("No TMDB API key found")
             return None
 
+        cache_key = ((title or '').strip().lower(), season, year)
+        hit, cached = self._cache_get(self._tv_cache, cache_key, self.TV_CACHE_TTL)
+        if hit:
+            self.logger.debug(f"TMDB TV cache hit: title='{title}' season={season} year={year}")
+            if cached is None:
+                return None
+            self._last_match_score = cached[0]
+            return self._build_embed_from_tv_info(cached[1], season, cached[2])
+
         try:
             # Normalize title: strip trailing year in parentheses (e.g., "Show (2015)")
             try:
@@ -291,6 +387,7 @@ class TMDBService:
                     
             if not response.get('results'):
                 self.logger.debug(f"No TV results found for: {norm_title}")
+                self._cache_put(self._tv_cache, cache_key, None, self.TV_CACHE_MAX_ENTRIES)
                 return None
 
             def norm(s: str) -> str:
@@ -353,45 +450,18 @@ class TMDBService:
 
             tv_info = tmdb.TV(tv['id']).info()
 
-            # Build embed
-            embed = discord.Embed(
-                title=tv_info.get('name') or tv_info.get('original_name'),
-                description=tv_info.get('overview') or '',
-                color=discord.Color.blue(),
-                url=f"https://www.themoviedb.org/tv/{tv_info['id']}"
-            )
-
-            if tv_info.get('first_air_date'):
-                embed.add_field(name="First Air Date", value=tv_info.get('first_air_date'), inline=True)
-            if tv_info.get('vote_average'):
-                embed.add_field(name="Rating", value=f"⭐ {tv_info.get('vote_average'):.1f}/10", inline=True)
-
-            # Add genres if available
-            if tv_info.get('genres'):
-                embed.add_field(name="Genre", value=', '.join([g['name'] for g in tv_info['genres']]), inline=True)
-
             # Season-specific info
+            season_info = None
             if season is not None:
                 try:
-                    season_obj = tmdb.TV_Seasons(tv['id'], season).info()
-                    # Add episode count and season poster if available
-                    eps = season_obj.get('episode_count') or season_obj.get('episodes') and len(season_obj.get('episodes'))
-                    if eps:
-                        embed.add_field(name=f"Season {season} Episodes", value=str(eps), inline=True)
-                    if season_obj.get('poster_path'):
-                        embed.set_thumbnail(url=f"https://image.tmdb.org/t/p/w500{season_obj.get('poster_path')}")
-                    else:
-                        # Fallback to show poster
-                        if tv_info.get('poster_path'):
-                            embed.set_thumbnail(url=f"https://image.tmdb.org/t/p/w500{tv_info.get('poster_path')}")
+                    season_info = tmdb.TV_Seasons(tv['id'], season).info()
                 except Exception as e:
                     self.logger.debug(f"Failed to fetch season info for {tv_info.get('name')} season {season}: {e}")
-                    if tv_info.get('poster_path'):
-                        embed.set_thumbnail(url=f"https://image.tmdb.org/t/p/w500{tv_info.get('poster_path')}")
-            else:
-                if tv_info.get('poster_path'):
-                    embed.set_thumbnail(url=f"https://image.tmdb.org/t/p/w500{tv_info.get('poster_path')}")
 
+            # A failed season fetch is not cached, so the next lookup retries it
+            if season is None or season_info is not None:
+                self._cache_put(self._tv_cache, cache_key, (best_score, tv_info, season_info), self.TV_CACHE_MAX_ENTRIES)
+            embed = self._build_embed_from_tv_info(tv_info, season, season_info)
             return embed
         except Exception as e:
             self.logger.error(f"Error getting TV metadata for title='{title}' season={season}: {e}")
@@ -1,10 +1,16 @@
 from typing import Optional, Dict, Any
 import os
+import re
 import json
+import time
 import xml.etree.ElementTree as ET
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 
+# "Stream 2" -> 2 in status.xml <information> category names
+_STREAM_INDEX_RE = re.compile(r'stream\s*(\d+)')
+
 class VLCError(Exception):
     """Base exception for VLC controller errors"""
     pass
@@ -14,7 +20,19 @@ class VLCPlaylistError(VLCError):
     pass
 
 class VLCController:
-    """Controller for VLC HTTP interface"""
+    """Controller for VLC HTTP interface
+
+    The bot drives an already-running, user-facing VLC instance (its playlist, window and
+    streaming output live in that process), so control goes through VLC's HTTP interface.
+    In-process libvlc bindings would create a separate, headless player with its own
+    playlist rather than controlling that instance; request overhead is kept low instead
+    via a pooled keep-alive session and short-lived caching at the call sites.
+    """
+
+    # Seconds a parsed subtitle track list is reused (e.g. sub_list followed by sub_set)
+    SUBTITLE_CACHE_TTL = 3.0
+    # Seconds a fetched status.xml may be reused by get_status_cached
+    STATUS_CACHE_TTL = 0.25
     
     def __init__(self, host: Optional[str] = None, port: Optional[int] = None, 
                  password: Optional[str] = None, queue_backup_file: str = "queue_backup.json",
@@ -34,7 +52,24 @@ class VLCController:
         self.queue_backup_file = queue_backup_file
         self.logger = logging.getLogger(__name__)
         self.bot = bot
-        
+        # Persistent HTTP session: keeps the TCP connection to VLC alive across commands
+        # and monitor ticks instead of reconnecting on every request
+        self._session = requests.Session()
+        self._session.auth = ('', self.password)
+        # VLC is reached directly: skip the per-request proxy/netrc environment lookups
+        self._session.trust_env = False
+        self._base_url = f"http://{self.host}:{self.port}/requests/"
+        # Sized for the concurrent users: the poller's status + playlist fetches, the cog's
+        # VLC worker thread, status-embed fetches and the watch-folder/playlist threads.
+        # Requests beyond the pool size would open throwaway connections instead of reusing one
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self._session.mount('http://', adapter)
+        
+        # (monotonic ts, tracks) from the last get_subtitle_tracks; cleared by any command
+        self._subtitle_cache = None
+        # (monotonic ts, status root) from the last get_status; cleared by any command
+        self._status_cache = None
+
         # Queue management state
         self._queued_items = {}  # item_id -> queue_info
         self._shuffle_restore_queue = []  # List of items that need shuffle restored after playing
@@ -94,6 +129,9 @@ class VLCController:
         Returns:
             ElementTree root element of response XML or None on failure
         """
+        # Any command may switch media or tracks
+        self._subtitle_cache = None
+        self._status_cache = None
         # Build parameters dict starting with the command
         all_params = {"command": command}
         if params:
@@ -101,6 +139,13 @@ class VLCController:
         
         return self._make_request("status.xml", all_params)
     
+    def close(self):
+        """Close the pooled HTTP session to VLC."""
+        try:
+            self._session.close()
+        except Exception as e:
+            self.logger.debug("Error closing VLC HTTP session: %s", e)
+
     def _make_request(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Optional[ET.Element]:
         """Make a HTTP request to VLC interface with consistent error handling
         
@@ -112,18 +157,18 @@ class VLCController:
             ElementTree root element of response XML or None on failure
         """
         try:
-            url = f"http://{self.host}:{self.port}/requests/{endpoint}"
+            url = self._base_url + endpoint
             
-            response = requests.get(
+            response = self._session.get(
                 url,
                 params=params,
-                auth=('', self.password),
                 timeout=5
             )
             
-            self.logger.debug(f"VLC {endpoint} response code: {response.status_code}")
+            self.logger.debug("VLC %s response code: %s", endpoint, response.status_code)
             
             if response.status_code == 200:
+                # Feed raw bytes so the C expat parser handles decoding itself
                 return ET.fromstring(response.content)
             elif response.status_code == 401:
                 self.logger.error(f"Authentication failed for {endpoint}. Using password: {self.password[:3]}...")
@@ -132,7 +177,7 @@ class VLCController:
                 self.logger.warning(f"VLC {endpoint} request failed with status {response.status_code}")
                 return None
         except requests.exceptions.ConnectionError:
-            self.logger.debug(f"Could not connect to VLC HTTP interface for {endpoint}")
+            self.logger.debug("Could not connect to VLC HTTP interface for %s", endpoint)
             return None
         except requests.exceptions.Timeout:
             self.logger.warning(f"VLC {endpoint} request timed out")
@@ -162,7 +207,7 @@ class VLCController:
         playlist_map = {}
         current_item_id = None
         
-        for idx, item in enumerate(playlist.findall('.//leaf'), 1):
+        for idx, item in enumerate(playlist.iterfind('.//leaf'), 1):
             item_id = item.get('id')
             item_name = item.get('name', 'Unknown')
             is_current = item.get('current') is not None
@@ -183,6 +228,59 @@ class VLCController:
         """Get the current VLC playlist"""
         return self._make_request("playlist.xml")
 
+    def get_playlist_current(self):
+        """Stream playlist.xml and return only the current item.
+
+        Parses incrementally with iterparse, clearing each non-current leaf once seen
+        and stopping at the current one, so a long playlist is never held as a full tree.
+        Positions are counted in the same document order as findall('.//leaf').
+
+        Returns:
+            tuple: (position, leaf) with the 1-based position and the current leaf
+                   element, or (None, None) when nothing is current or on failure
+        """
+        try:
+            url = self._base_url + "playlist.xml"
+            with self._session.get(url, timeout=5, stream=True) as response:
+                if response.status_code == 401:
+                    self.logger.error(f"Authentication failed for playlist.xml. Using password: {self.password[:3]}...")
+                    return None, None
+                if response.status_code != 200:
+                    self.logger.warning(f"VLC playlist.xml request failed with status {response.status_code}")
+                    return None, None
+                # Let urllib3 undo any Content-Encoding before the parser sees the bytes
+                response.raw.decode_content = True
+                position = 0
+                current = None
+                for _, elem in ET.iterparse(response.raw, events=('end',)):
+                    if elem.tag != 'leaf':
+                        continue
+                    position += 1
+                    if elem.get('current'):
+                        current = elem
+                        break
+                    elem.clear()
+                # Read off the unparsed tail so the keep-alive connection can be reused
+                try:
+                    response.raw.drain_conn()
+                except Exception:
+                    pass
+                if current is None:
+                    return None, None
+                return position, current
+        except requests.exceptions.ConnectionError:
+            self.logger.debug("Could not connect to VLC HTTP interface for playlist.xml")
+            return None, None
+        except requests.exceptions.Timeout:
+            self.logger.warning("VLC playlist.xml request timed out")
+            return None, None
+        except ET.ParseError as e:
+            self.logger.error(f"Failed to parse VLC playlist.xml XML: {e}")
+            return None, None
+        except Exception as e:
+            self.logger.error(f"Unexpected error getting VLC playlist.xml: {e}")
+            return None, None
+
     def export_playlist(self) -> Optional[list]:
         """Export current playlist to a list of dicts with basic fields.
 
@@ -196,7 +294,7 @@ class VLCController:
             if not playlist:
                 return None
             items = []
-            for item in playlist.findall('.//leaf'):
+            for item in playlist.iterfind('.//leaf'):
                 items.append({
                     'id': item.get('id'),
                     'name': item.get('name', ''),
@@ -245,7 +343,7 @@ class VLCController:
                     if len(p) > 2 and p[2] == ':':
                         # Remove the leading / to get C:/path/to/file
                         p = p[1:]
-                        self.logger.debug(f"Windows local path conversion: {u} -> {p}")
+                        self.logger.debug("Windows local path conversion: %s -> %s", u, p)
                         return p
                     
                     # Fallback for other Windows paths
@@ -256,11 +354,11 @@ class VLCController:
                     # Check if this is a network path (file://IP/path)
                     if not p.startswith('/'):
                         # Network path on Unix - should be mounted
-                        self.logger.debug(f"Unix network path: {u} -> {p}")
+                        self.logger.debug("Unix network path: %s -> %s", u, p)
                         return p
                     
                     # Unix/Linux local file: file:///home/user/path
-                    self.logger.debug(f"Unix local path conversion: {u} -> {p}")
+                    self.logger.debug("Unix local path conversion: %s -> %s", u, p)
                     return p
             # Fallback: if it looks like an absolute path, return as-is
             try:
@@ -307,7 +405,7 @@ class VLCController:
             if not playlist:
                 return result
             removed_any = False
-            for leaf in playlist.findall('.//leaf'):
+            for leaf in playlist.iterfind('.//leaf'):
                 try:
                     item_id = leaf.get('id')
                     name = leaf.get('name', '')
@@ -315,7 +413,7 @@ class VLCController:
                     path = self._uri_to_path(uri) or name
                     
                     # Debug logging
-                    self.logger.debug(f"Checking playlist item: name='{name}', uri='{uri}', resolved_path='{path}'")
+                    self.logger.debug("Checking playlist item: name='%s', uri='%s', resolved_path='%s'", name, uri, path)
                     
                     # Check if this is a network path (UNC path on Windows or network mount on Unix)
                     is_network_path = self._is_network_path(uri, path)
@@ -329,11 +427,11 @@ class VLCController:
                             
                             # Use robust file existence check that works with network shares
                             exists = self._file_exists_robust(normalized_path)
-                            self.logger.debug(f"  Normalized path: '{normalized_path}', exists={exists}, is_network={is_network_path}")
+                            self.logger.debug("  Normalized path: '%s', exists=%s, is_network=%s", normalized_path, exists, is_network_path)
                         else:
                             exists = False
                     except Exception as e:
-                        self.logger.debug(f"  Error checking existence: {e}")
+                        self.logger.debug("  Error checking existence: %s", e)
                         exists = False
                     
                     if not exists:
@@ -346,9 +444,9 @@ class VLCController:
                                 result['items'].append({'id': item_id, 'name': name})
                                 removed_any = True
                         else:
-                            self.logger.debug(f"Skipping deletion (no id) for missing item '{name}'")
+                            self.logger.debug("Skipping deletion (no id) for missing item '%s'", name)
                 except Exception as e:
-                    self.logger.debug(f"Error checking/removing playlist item: {e}")
+                    self.logger.debug("Error checking/removing playlist item: %s", e)
             if removed_any:
                 # Optionally refresh playlist to reflect changes
                 try:
@@ -382,7 +480,7 @@ class VLCController:
             tl_el = ET.SubElement(pl_el, ET.QName(ns, 'trackList'))
 
             count = 0
-            for leaf in playlist.findall('.//leaf'):
+            for leaf in playlist.iterfind('.//leaf'):
                 uri = leaf.get('uri')
                 name = leaf.get('name', '')
 
@@ -449,7 +547,23 @@ class VLCController:
         """
         if enhanced:
             return self._get_enhanced_status()
-        return self._make_request("status.xml")
+        status = self._make_request("status.xml")
+        if status is not None:
+            self._status_cache = (time.monotonic(), status)
+        return status
+
+    def get_status_cached(self, max_age: Optional[float] = None):
+        """Return the last status if it was fetched within max_age seconds, else fetch it.
+
+        Lets several reads in one command (or a command right after a poll) share one
+        request. Commands sent through send_command drop the cached status.
+        """
+        cached = self._status_cache
+        if max_age is None:
+            max_age = self.STATUS_CACHE_TTL
+        if cached is not None and (time.monotonic() - cached[0]) < max_age:
+            return cached[1]
+        return self.get_status()
     
     def _get_enhanced_status(self):
         """Get current VLC status with enhanced metadata"""
@@ -478,7 +592,7 @@ class VLCController:
     
     def get_shuffle_state(self):
         """Check if shuffle is currently enabled"""
-        status = self.get_status()
+        status = self.get_status_cached()
         if status:
             random_elem = status.find('random')
             return random_elem is not None and random_elem.text == 'true'
@@ -490,7 +604,7 @@ class VLCController:
     
     def get_repeat_state(self):
         """Check current repeat mode"""
-        status = self.get_status()
+        status = self.get_status_cached()
         if status:
             repeat_elem = status.find('repeat')
             loop_elem = status.find('loop')
@@ -509,7 +623,7 @@ class VLCController:
         """
         result = self.send_command("pl_move", {"id": str(item_id), "psn": str(position)})
         if result is not None:
-            self.logger.debug(f"Move command sent for item {item_id} to position {position}")
+            self.logger.debug("Move command sent for item %s to position %s", item_id, position)
             return True
         return False
     
@@ -517,7 +631,7 @@ class VLCController:
         """Play a specific playlist item by its ID"""
         result = self.send_command("pl_play", {"id": str(item_id)})
         if result is not None:
-            self.logger.debug(f"Play command sent for item {item_id}")
+            self.logger.debug("Play command sent for item %s", item_id)
             return True
         return False
 
@@ -537,7 +651,7 @@ class VLCController:
                 self.logger.info(f"Set VLC playback rate to {rate}")
                 return True
             else:
-                self.logger.debug(f"VLC did not return a response when setting rate to {rate}")
+                self.logger.debug("VLC did not return a response when setting rate to %s", rate)
                 return False
         except Exception as e:
             self.logger.error(f"Error setting VLC rate to {rate}: {e}")
@@ -555,11 +669,14 @@ class VLCController:
         Returns True if the command was acknowledged by VLC.
         """
         try:
-            self.logger.info(f"Attempting to set subtitle track to value={value}")
-            res = self.send_command('subtitle_track', {'val': str(value)})
+            self.logger.debug("Attempting to set subtitle track to value=%s", value)
+            # Bypass send_command's cache reset: switching subtitles leaves the track list
+            # (and the media) unchanged, and the command's reply is itself a fresh status.xml
+            res = self._make_request("status.xml", {"command": "subtitle_track", "val": str(value)})
             ok = res is not None
             if ok:
-                self.logger.info(f"Set VLC subtitle track val={value} - SUCCESS")
+                self._status_cache = (time.monotonic(), res)
+                self.logger.debug("Set VLC subtitle track val=%s - SUCCESS", value)
             else:
                 self.logger.warning(f"VLC did not acknowledge subtitle_track val={value}")
             return ok
@@ -575,7 +692,24 @@ class VLCController:
         """Cycle to previous subtitle track, if supported by VLC."""
         return self.set_subtitle_track("-1")
 
+    def invalidate_subtitle_cache(self):
+        """Drop the cached subtitle track list (e.g. after the current media changed)."""
+        self._subtitle_cache = None
+
     def get_subtitle_tracks(self) -> Optional[list[dict]]:
+        """Return available subtitle tracks, reusing a list fetched within SUBTITLE_CACHE_TTL.
+
+        Callers get their own copies of the track dicts and may mark them freely.
+        """
+        cached = self._subtitle_cache
+        if cached is not None and (time.monotonic() - cached[0]) < self.SUBTITLE_CACHE_TTL:
+            return [dict(tr) for tr in cached[1]]
+        tracks = self._fetch_subtitle_tracks()
+        if tracks is not None:
+            self._subtitle_cache = (time.monotonic(), [dict(tr) for tr in tracks])
+        return tracks
+
+    def _fetch_subtitle_tracks(self) -> Optional[list[dict]]:
         """Return available subtitle tracks with selection info.
 
         Parses VLC status.xml for stream information to build subtitle track list.
@@ -587,7 +721,7 @@ class VLCController:
         Returns None if status cannot be fetched.
         """
         try:
-            status = self.get_status()
+            status = self.get_status_cached()
             if status is None:
                 return None
             
@@ -613,7 +747,7 @@ class VLCController:
                     # Note: VLC HTTP API doesn't reliably report selected status
                     selected = False
                     tracks.append({'id': tid, 'name': name, 'selected': selected})
-                    self.logger.debug(f"Track from <subtitle>: id={tid}, name={name}")
+                    self.logger.debug("Track from <subtitle>: id=%s, name=%s", tid, name)
 
             # Parse stream categories to derive UI order (Stream 0, Stream 1, ...)
             streams: list[Dict[str, Any]] = []
@@ -626,8 +760,7 @@ class VLCController:
                         # Extract numeric stream index from name like "Stream 2"
                         stream_index = None
                         try:
-                            import re
-                            m = re.search(r'stream\s*(\d+)', lcname)
+                            m = _STREAM_INDEX_RE.search(lcname)
                             if m:
                                 stream_index = int(m.group(1))
                         except Exception:
@@ -656,7 +789,7 @@ class VLCController:
                             name = ' / '.join(parts) if parts else (cname or 'Subtitle Stream')
                             streams.append({'id': tid, 'name': name, 'stream_index': stream_index})
             except Exception as e:
-                self.logger.debug(f"Subtitle streams parse failed: {e}")
+                self.logger.debug("Subtitle streams parse failed: %s", e)
 
             # Filter out disable/off tracks (usually id=-1 or id=0 with name like "Disable" or "Off")
             # These shouldn't be in the user-facing list
@@ -666,10 +799,10 @@ class VLCController:
                 name_lower = (tr.get('name') or '').strip().lower()
                 # Skip tracks that are clearly "disable" options
                 if tid is not None and tid < 0:
-                    self.logger.debug(f"Filtering out disable track: id={tid}, name={tr.get('name')}")
+                    self.logger.debug("Filtering out disable track: id=%s, name=%s", tid, tr.get('name'))
                     continue
                 if name_lower in {'disable', 'disabled', 'off', 'none'}:
-                    self.logger.debug(f"Filtering out disable track by name: id={tid}, name={tr.get('name')}")
+                    self.logger.debug("Filtering out disable track by name: id=%s, name=%s", tid, tr.get('name'))
                     continue
                 filtered_tracks.append(tr)
             tracks = filtered_tracks
@@ -738,7 +871,7 @@ class VLCController:
                     tr['index'] = idx
                     # Without stream info, we don't have stream_index, so it stays None
 
-            self.logger.debug(f"get_subtitle_tracks returning {len(tracks)} tracks (after filtering)")
+            self.logger.debug("get_subtitle_tracks returning %s tracks (after filtering)", len(tracks))
             return tracks
         except Exception as e:
             self.logger.error(f"get_subtitle_tracks error: {e}")
@@ -983,7 +1116,7 @@ class VLCController:
                     "success": True
                 })
             else:
-                self.logger.debug(f"Queued item {current_item_id} already removed from queue")
+                self.logger.debug("Queued item %s already removed from queue", current_item_id)
         
         # Check if we should play the next queued item
         # This happens when the current track is about to end or has ended
@@ -1132,7 +1265,7 @@ class VLCController:
             item_id: The item ID to remove from the queue
         """
         if item_id not in self._queued_items:
-            self.logger.debug(f"Item {item_id} not in queue - nothing to remove")
+            self.logger.debug("Item %s not in queue - nothing to remove", item_id)
             return
         
         # Get the item info before removing it
@@ -1141,7 +1274,7 @@ class VLCController:
         
         # Remove from the main queue
         del self._queued_items[item_id]
-        self.logger.debug(f"Removed item {item_id} from queue")
+        self.logger.debug("Removed item %s from queue", item_id)
         
         # If the queue is now empty, clear the shuffle restore queue too
         if len(self._queued_items) == 0:
@@ -1150,7 +1283,7 @@ class VLCController:
         
         # Save the updated queue state
         self._save_queue_backup()
-        self.logger.debug(f"Queue state saved after removing item {item_id}")
+        self.logger.debug("Queue state saved after removing item %s", item_id)
 
     def _handle_queued_item_finished(self, item_id):
         """
@@ -1163,13 +1296,13 @@ class VLCController:
             item_id: The item ID that just finished playing
         """
         if item_id not in self._shuffle_restore_queue:
-            self.logger.debug(f"Item {item_id} finished but was not in shuffle restore queue")
+            self.logger.debug("Item %s finished but was not in shuffle restore queue", item_id)
             return
         
         # Remove from shuffle restore queue since this item finished
         # (shuffle should have already been restored when the last item started playing)
         self._shuffle_restore_queue.remove(item_id)
-        self.logger.debug(f"Removed finished item {item_id} from shuffle restore queue")
+        self.logger.debug("Removed finished item %s from shuffle restore queue", item_id)
         
         # Note: We no longer restore shuffle here - it happens when the last item starts playing
         # This prevents the delay between queue finishing and shuffle being restored
@@ -1195,13 +1328,13 @@ class VLCController:
             # os.stat() will raise FileNotFoundError if file doesn't exist
             try:
                 os.stat(path)
-                self.logger.debug(f"File exists (detected via os.stat): {path}")
+                self.logger.debug("File exists (detected via os.stat): %s", path)
                 return True
             except (FileNotFoundError, OSError) as e:
-                self.logger.debug(f"File does not exist (os.stat failed): {path} - {type(e).__name__}")
+                self.logger.debug("File does not exist (os.stat failed): %s - %s", path, type(e).__name__)
                 return False
         except Exception as e:
-            self.logger.debug(f"Unexpected error checking file: {path} - {e}")
+            self.logger.debug("Unexpected error checking file: %s - %s", path, e)
             return False
     
     def _is_network_path(self, uri: str | None, path: str | None) -> bool:
@@ -1220,13 +1353,13 @@ class VLCController:
             uri_lower = str(uri).lower()
             # file://192.168.x.x/... pattern
             if re.search(r'file://\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}/', uri_lower):
-                self.logger.debug(f"Detected network path (SMB via IP): {uri}")
+                self.logger.debug("Detected network path (SMB via IP): %s", uri)
                 return True
             # file://hostname/... pattern (non-IP domain/hostname)
             # file:// URLs with network hosts don't have triple slashes after file://
             if uri_lower.startswith('file://') and not uri_lower.startswith('file:///'):
                 # file://hostname/path (only two slashes) indicates network path
-                self.logger.debug(f"Detected network path (SMB via hostname): {uri}")
+                self.logger.debug("Detected network path (SMB via hostname): %s", uri)
                 return True
         
         # Check the resolved path
@@ -1234,11 +1367,11 @@ class VLCController:
             path_str = str(path)
             # UNC paths: \\server\share or //server/share
             if path_str.startswith('\\\\') or path_str.startswith('//'):
-                self.logger.debug(f"Detected network path (UNC): {path}")
+                self.logger.debug("Detected network path (UNC): %s", path)
                 return True
             # Linux network mounts
             if path_str.startswith('/mnt/') or path_str.startswith('/media/'):
-                self.logger.debug(f"Detected network mount: {path}")
+                self.logger.debug("Detected network mount: %s", path)
                 return True
         
         return False
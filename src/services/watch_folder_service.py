@@ -6,6 +6,7 @@ import logging
 from typing import Iterable, Set, Optional, List, Callable
 
 from ..config import Config, get_watch_folders_from_env
+from ..utils.media_utils import human_size
 
 
 MEDIA_EXTENSIONS = {
@@ -29,6 +30,11 @@ class WatchFolderService:
         self._pending = {}
         self._notifier = None
         self._cached_media_size = 0
+        # (bytes, text) memo so the display string is only reformatted when the total changes
+        self._media_size_display = (0, human_size(0))
+        # Per-file sizes behind the cached total so deletions can be subtracted without a rescan
+        self._media_sizes = {}
+        self._size_lock = threading.Lock()
         # Defer media size calculation; do it in a background thread after start()
         self._size_thread = None
         # Event to signal that the very first scan has completed
@@ -43,6 +49,15 @@ class WatchFolderService:
         """Return the cached total size in bytes of all media files in the watched folders."""
         return getattr(self, '_cached_media_size', 0)
 
+    def get_total_media_size_display(self) -> str:
+        """Return the cached total media size as a human-readable string."""
+        size = self.get_total_media_size()
+        cached_size, text = self._media_size_display
+        if size != cached_size:
+            text = human_size(size)
+            self._media_size_display = (size, text)
+        return text
+
     def _update_media_size_cache(self):
         """Compute and cache total size of media files across all watch folders."""
         all_files: List[str] = []
@@ -51,15 +66,33 @@ class WatchFolderService:
                 continue
             all_files.extend(list(self._iter_media_files(folder)))
         total_files = len(all_files)
-        total = 0
+        sizes = {}
         for idx, path in enumerate(all_files, 1):
             try:
-                total += os.path.getsize(path)
+                sizes[path] = os.path.getsize(path)
             except Exception:
                 continue
             if idx == 1 or idx % 200 == 0 or idx == total_files:
                 self.logger.info(f"Calculating media size: {idx}/{total_files} files processed...")
-        self._cached_media_size = total
+        with self._size_lock:
+            self._media_sizes = sizes
+            self._cached_media_size = sum(sizes.values())
+
+    def _forget_removed_media(self, present: set, scanned_folders: List[str]):
+        """Subtract files that disappeared from scanned folders from the cached size."""
+        if not self._media_sizes or not scanned_folders:
+            return
+        prefixes = tuple(os.path.join(f, '') for f in scanned_folders)
+        with self._size_lock:
+            removed = [
+                p for p in self._media_sizes
+                if p not in present and p.startswith(prefixes) and not os.path.exists(p)
+            ]
+            if not removed:
+                return
+            freed = sum(self._media_sizes.pop(p, 0) for p in removed)
+            self._cached_media_size = max(0, self._cached_media_size - freed)
+        self.logger.info(f"Media size cache: {len(removed)} file(s) removed ({self._format_bytes(freed)})")
 
     def set_notifier(self, notifier: Callable[[List[str], bool], None]):
         """Set a callback that will be called with a list of successfully enqueued file paths.
@@ -204,11 +237,15 @@ class WatchFolderService:
         new_files = []
         pending_before = len(self._pending)
         is_first_pass = not self._first_scan_done
+        present = set()
+        scanned_folders: List[str] = []
         for folder in self.folders:
             if not os.path.isdir(folder):
                 self.logger.warning(f"Watch folder not found or not a directory: {folder}")
                 continue
+            scanned_folders.append(folder)
             for path in self._iter_media_files(folder):
+                present.add(path)
                 if is_first_pass:
                     # On first pass, mark everything as seen; enqueue only if configured
                     if path not in self._seen:
@@ -233,6 +270,12 @@ class WatchFolderService:
         for p in to_delete:
             self._pending.pop(p, None)
 
+        # Keep the cached library size in step with deletions (O(1) reads for !status/!list)
+        try:
+            self._forget_removed_media(present, scanned_folders)
+        except Exception as e:
+            self.logger.debug(f"Media size cache cleanup failed: {e}")
+
         if not new_files:
             if pending_before != len(self._pending):
                 self.logger.info(f"Watch scan: {len(self._pending)} file(s) pending stability (age>={Config.WATCH_STABLE_AGE}s)")
@@ -263,12 +306,15 @@ class WatchFolderService:
         # Incremental media size cache update (add sizes of enqueued files)
         if enqueued:
             added = 0
-            for p in enqueued:
-                try:
-                    added += os.path.getsize(p)
-                except Exception:
-                    continue
-            self._cached_media_size = max(0, getattr(self, '_cached_media_size', 0)) + added
+            with self._size_lock:
+                for p in enqueued:
+                    try:
+                        sz = os.path.getsize(p)
+                    except Exception:
+                        continue
+                    added += sz - self._media_sizes.get(p, 0)
+                    self._media_sizes[p] = sz
+                self._cached_media_size = max(0, getattr(self, '_cached_media_size', 0)) + added
 
         # Notify if any were added
         if enqueued and self._notifier:
@@ -351,12 +397,7 @@ class WatchFolderService:
 
     @staticmethod
     def _format_bytes(n: int) -> str:
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(n)
-        for u in units:
-            if size < 1024 or u == units[-1]:
-                return f"{size:.2f}{u}"
-            size /= 1024
+        return human_size(n, sep='')
 
     # Initial scan completion helpers
     def has_initial_scan_completed(self) -> bool:
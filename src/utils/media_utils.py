@@ -1,8 +1,53 @@
+from functools import lru_cache
 from typing import Optional, Tuple
 import os
 import re
 from urllib.parse import unquote
 
+# Precompiled patterns and token sets for parse_movie_filename (hot path for Now Playing/status)
+_VIDEO_EXT_RE = re.compile(r'(?i)\.(mkv|mp4|avi|mov|m4v|ts|m2ts|wmv|flv|webm)$')
+_BRACKETED_RE = re.compile(r'\[[^\]]*\]')
+_PARENS_RE = re.compile(r'[\(\)]')
+_GROUP_SUFFIX_RE = re.compile(r'\s*[-–]\s*[A-Za-z0-9]{2,}$')
+_TOKEN_SPLIT_RE = re.compile(r"[\s\-]+")
+_RESOLUTION_RE = re.compile(r'^\d{3,4}p$')
+_WORD_TOKEN_RE = re.compile(r'^[\w-]+$')
+
+_RESOLUTION_TOKENS = frozenset({'uhd', '4k', '1080', '720', '480'})
+_SOURCE_TOKENS = frozenset({
+    'bluray', 'brrip', 'bdrip', 'webrip', 'web', 'webdl', 'web-dl', 'dvdrip', 'hdtv',
+    'remux', 'hdrip', 'cam', 'tc', 'ts'
+})
+_CODEC_TOKENS = frozenset({'x264', 'x265', 'h264', 'h265', 'hevc', 'av1'})
+_AUDIO_TOKENS = frozenset({
+    'dd', 'dd5', 'dd51', 'ddp', 'ddp5', 'ddp51', 'dts', 'dtshd', 'aac', 'opus', 'truehd', 'atmos'
+})
+_TAG_TOKENS = frozenset({
+    'proper', 'repack', 'extended', 'theatrical', 'directors', 'director', 'cut', 'imax',
+    'hdr', 'hdr10', 'dv', 'dolby', 'vision', 'sdr',
+    # hardcoded subs markers
+    'hc', 'hardsub', 'hardsubs', 'hardcoded', 'hcsubs', 'hcsub', 'hcsubbed'
+})
+_NOISE_TOKENS = _SOURCE_TOKENS | _CODEC_TOKENS | _AUDIO_TOKENS | _TAG_TOKENS
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def human_size(num: int, sep: str = ' ') -> str:
+    """Format a byte count with binary (1024) units, e.g. 1536 -> '1.50 KB'."""
+    n = max(0, int(num or 0))
+    # bit_length gives floor(log2(n)); every 10 bits is one 1024 step
+    i = min(len(_SIZE_UNITS) - 1, (n.bit_length() - 1) // 10) if n else 0
+    return f"{n / (1 << (i * 10)):.2f}{sep}{_SIZE_UNITS[i]}"
+
+
+@lru_cache(maxsize=8192)
+def _format_hms(seconds: int) -> str:
+    # Status renders the same track length (and nearby positions) over and over
+    minutes, secs = divmod(seconds, 60)
+    return "%02d:%02d:%02d" % (*divmod(minutes, 60), secs)
+
+
 class MediaUtils:
     @staticmethod
     def extract_edition_tag(filename: str) -> Optional[str]:
@@ -75,52 +120,30 @@ class MediaUtils:
         basename = unquote(basename)
 
         # Remove only known video extensions (avoid splitext confusion with scene tags like [eztv.re]).
-        name = re.sub(r'(?i)\.(mkv|mp4|avi|mov|m4v|ts|m2ts|wmv|flv|webm)$', '', basename)
+        name = _VIDEO_EXT_RE.sub('', basename)
 
         # Remove bracketed tracker/release suffixes often appended by indexers.
-        name = re.sub(r'\[[^\]]*\]', ' ', name)
+        name = _BRACKETED_RE.sub(' ', name)
 
         # Normalize separators and remove brackets to simplify tokenization
         normalized = name.replace('.', ' ').replace('_', ' ')
-        normalized = re.sub(r'[\(\)]', ' ', normalized)
+        normalized = _PARENS_RE.sub(' ', normalized)
         # Remove trailing release-group style suffixes like "-iKA" after normalization.
-        normalized = re.sub(r'\s*[-–]\s*[A-Za-z0-9]{2,}$', ' ', normalized)
+        normalized = _GROUP_SUFFIX_RE.sub(' ', normalized)
         normalized = ' '.join(normalized.split())
 
-        tokens = re.split(r"[\s\-]+", normalized)
-        ltokens = [t.lower() for t in tokens]
+        tokens = _TOKEN_SPLIT_RE.split(normalized)
 
         def is_year_token(tok: str) -> bool:
             return tok.isdigit() and len(tok) == 4 and 1900 <= int(tok) <= 2099
 
-        # Known noise detectors
-        source_tokens = {
-            'bluray', 'brrip', 'bdrip', 'webrip', 'web', 'webdl', 'web-dl', 'dvdrip', 'hdtv',
-            'remux', 'hdrip', 'cam', 'tc', 'ts'
-        }
-        codec_tokens = {'x264', 'x265', 'h264', 'h265', 'hevc', 'av1'}
-        audio_tokens = {
-            'dd', 'dd5', 'dd51', 'ddp', 'ddp5', 'ddp51', 'dts', 'dtshd', 'aac', 'opus', 'truehd', 'atmos'
-        }
-        tag_tokens = {
-            'proper', 'repack', 'extended', 'theatrical', 'directors', 'director', 'cut', 'imax',
-            'hdr', 'hdr10', 'dv', 'dolby', 'vision', 'sdr',
-            # hardcoded subs markers
-            'hc', 'hardsub', 'hardsubs', 'hardcoded', 'hcsubs', 'hcsub', 'hcsubbed'
-        }
-
-        def is_resolution(tok: str) -> bool:
-            return bool(re.match(r'^\d{3,4}p$', tok)) or tok in {'uhd', '4k', '1080', '720', '480'}
-
         def is_noise(tok: str) -> bool:
             t = tok.lower()
             return (
-                is_resolution(t) or
-                t in source_tokens or
-                t in codec_tokens or
-                t in audio_tokens or
-                t in tag_tokens or
-                bool(re.match(r'^[\w-]+$' , t)) and t.startswith('rarbg')
+                t in _NOISE_TOKENS or
+                t in _RESOLUTION_TOKENS or
+                _RESOLUTION_RE.match(t) is not None or
+                t.startswith('rarbg') and _WORD_TOKEN_RE.match(t) is not None
             )
 
         # Find candidate year positions (prefer the rightmost one)
@@ -236,6 +259,7 @@ class MediaUtils:
         return series, season, episode, year
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_media_icon(filename):
         """Get appropriate icon for media file type"""
         name = filename.lower()
@@ -255,14 +279,14 @@ class MediaUtils:
         Returns:
             Formatted time string in HH:MM:SS format
         """
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return _format_hms(seconds)
         
     @staticmethod
+    @lru_cache(maxsize=4096)
     def clean_filename_for_display(filename: str, max_length: int = 50) -> str:
         """Clean up filename for display in Discord messages
+
+        Memoized: playlist pages and search results render the same names repeatedly.
         
         Args:
             filename: Original filename
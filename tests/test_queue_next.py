@@ -0,0 +1,89 @@
+"""A queue_next item waits for the current track to finish instead of cutting it."""
+import asyncio
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("discord")
+
+from src.cogs.playback import PlaybackCommands
+
+
+class FakeVLC:
+    """Soft queue holding one queued item; records which items were started."""
+
+    def __init__(self):
+        self.queued = [{"item_id": "7", "item_name": "Queued", "queue_order": 1, "restore_shuffle": False}]
+        self.played = []
+
+    def get_next_queued_item(self):
+        return self.queued[0] if self.queued else None
+
+    def play_next_queued_item(self):
+        item = self.queued.pop(0)
+        self.played.append(item["item_id"])
+        return {"success": True, **item}
+
+    def check_and_handle_queue_transition(self, current_item_id):
+        return {"transitions": []}
+
+    def _handle_queued_item_finished(self, item_id):
+        pass
+
+    def set_rate(self, rate):
+        return True
+
+
+def _make_cog(vlc):
+    cog = PlaybackCommands.__new__(PlaybackCommands)
+    cog.vlc = vlc
+    cog._vlc_executor = ThreadPoolExecutor(max_workers=1)
+    cog._pending_vlc_cmds = []
+    cog._now = time.monotonic
+    cog.last_queue_auto_play = 0.0
+
+    async def _noop(*args, **kwargs):
+        return None
+
+    cog._notify_watch_channel = _noop
+    cog._set_presence = _noop
+    return cog
+
+
+def _tick(vlc, state, item_id, last_item_id, *, position_changed=False, state_changed=False, at=None, length=0):
+    return {
+        'state': state,
+        'position': 2,
+        'item': ET.Element('leaf', id=item_id),
+        'item_id': item_id,
+        'item_name': item_id,
+        'time': at,
+        'length': length,
+        'next_queued': vlc.get_next_queued_item(),
+        'last': {'state': 'playing', 'position': 1, 'item_id': last_item_id},
+        'state_changed': state_changed,
+        'position_changed': position_changed,
+    }
+
+
+def test_queued_item_waits_for_current_track():
+    vlc = FakeVLC()
+    cog = _make_cog(vlc)
+
+    async def run():
+        cog._loop = asyncio.get_running_loop()
+        # VLC moves on to the next playlist track: the queued item is not forced in
+        tick = _tick(vlc, 'playing', '3', '2', position_changed=True, at=5, length=600)
+        await cog._handle_queue_transition(tick)
+        if tick['next_queued']:
+            await cog._enforce_queue(tick)
+        assert vlc.played == []
+
+        # The track plays to its end and VLC stops: now the queued item starts
+        tick = _tick(vlc, 'stopped', '3', '3', state_changed=True)
+        await cog._handle_queue_transition(tick)
+        assert vlc.played == ['7']
+
+    asyncio.run(run())